@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark de precisión de inferencia para REMForge Ultra
+========================================================
+
+Mide, para cada modo de precisión soportado en el dispositivo, el throughput
+de forja de texto (documentos/segundo) y la deriva de los embeddings del
+modelo semántico respecto a la referencia float32 (similitud coseno media de
+los estados ocultos por token).
+
+Uso:
+    python benchmarks/bench_precision.py --device cpu --docs 64
+    python benchmarks/bench_precision.py --device cuda --modes float32 float16 bfloat16
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from remforge_models import get_model_registry
+from remforge_ultra_formato_optimo import REMForgeUltraFormatoOptimo
+
+TEXTOS_BASE = [
+    "Veo un color rojo intenso en la superficie de la mesa",
+    "Me recuerda a algo, pero no sé qué exactamente",
+    "La textura es suave bajo mis dedos, casi sedosa",
+    "Oigo el sonido suave de la lluvia contra la ventana",
+    "Siento una mezcla de nostalgia y serenidad mientras el sol cae detrás de las montañas",
+    "Era una tarde fría. Ahora veo la luz brillante y siento el aire cálido en la piel"
+]
+
+
+def default_modes(device: str):
+    """Modos de precisión que tienen sentido en el dispositivo"""
+    if device == "cpu":
+        return ["float32", "bfloat16", "int8"]
+    return ["float32", "float16", "bfloat16"]
+
+
+def encode_states(forge: REMForgeUltraFormatoOptimo, texts):
+    """Estados ocultos por documento (float32, en CPU) para medir deriva"""
+    return [hidden_states.cpu() for _, hidden_states in forge._encode_semantic_batch(texts)]
+
+
+def embedding_similarity(reference, candidate) -> float:
+    """Similitud coseno media por token entre dos conjuntos de estados ocultos"""
+    similarities = [
+        torch.nn.functional.cosine_similarity(ref, cand, dim=-1).mean().item()
+        for ref, cand in zip(reference, candidate)
+    ]
+    return sum(similarities) / len(similarities)
+
+
+def run_mode(device: str, precision: str, texts, batch_size: int, repeats: int):
+    forge = REMForgeUltraFormatoOptimo(device=device, precision=precision)
+    if not forge.preload(["semantic"])["semantic"]:
+        raise RuntimeError("El modelo semántico no está disponible; el benchmark requiere transformers y los pesos de BART")
+
+    # Calentamiento
+    forge.forge_text_batch(texts[:batch_size], batch_size=batch_size)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        forge.forge_text_batch(texts, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+
+    states = encode_states(forge, TEXTOS_BASE)
+    throughput = len(texts) * repeats / elapsed
+    return forge.precision, throughput, states
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de precisión de REMForge Ultra")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--modes", nargs="+", default=None)
+    parser.add_argument("--docs", type=int, default=64, help="Documentos por repetición")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    modes = args.modes or default_modes(args.device)
+    texts = [TEXTOS_BASE[i % len(TEXTOS_BASE)] for i in range(args.docs)]
+
+    results = []
+    reference_states = None
+    for precision in ["float32"] + [mode for mode in modes if mode != "float32"]:
+        effective, throughput, states = run_mode(args.device, precision, texts, args.batch_size, args.repeats)
+        if reference_states is None:
+            reference_states = states
+        drift = max(0.0, 1.0 - embedding_similarity(reference_states, states))
+        results.append((precision, effective, throughput, drift))
+
+        # Liberar los pesos antes de cargar el siguiente modo
+        get_model_registry().release(REMForgeUltraFormatoOptimo.MODEL_NAMES["semantic"])
+
+    baseline = results[0][2]
+    print(f"\n{'modo':<10} {'efectivo':<10} {'docs/s':>10} {'speedup':>8} {'deriva (1-cos)':>16}")
+    for precision, effective, throughput, drift in results:
+        print(f"{precision:<10} {effective:<10} {throughput:>10.1f} {throughput / baseline:>7.2f}x {drift:>16.6f}")
+
+
+if __name__ == "__main__":
+    main()
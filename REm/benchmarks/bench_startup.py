@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque de REMForge
+=================================
+
+Mide, en un intérprete nuevo por módulo, el tiempo de importación de los
+módulos de REMForge (con el desglose de `python -X importtime` para localizar
+los módulos que más pesan) y la latencia en frío de la primera forja
+heurística de texto, que no debe cargar torch ni ningún modelo.
+
+Con `--budget-ms` el script termina con código 1 si algún módulo o la forja en
+frío supera el presupuesto, para usarlo como comprobación de regresiones.
+
+Uso:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --modules remforge_ultra_formato_optimo --top 15 --budget-ms 500
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+MODULOS_BASE = [
+    "remforge_models",
+    "remforge_cache",
+    "remforge_segment",
+    "remforge_lite",
+    "remforge_ultra_formato_optimo",
+    "remforge_async",
+]
+
+# Forja heurística en frío: importación + instancia + primer REM, todo en un proceso nuevo
+SCRIPT_FORJA_FRIA = """
+import sys, time
+start = time.perf_counter()
+from remforge_ultra_formato_optimo import forge_text_heuristic
+forge_text_heuristic("Veo un color rojo intenso y siento calma")
+elapsed = time.perf_counter() - start
+print(f"{elapsed * 1000:.3f} {int('torch._C' in sys.modules)}")
+"""
+
+
+def run_python(args) -> subprocess.CompletedProcess:
+    """Ejecuta un intérprete nuevo con el directorio del proyecto como cwd"""
+    return subprocess.run(
+        [sys.executable] + args, cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+
+
+def import_profile(module: str):
+    """
+    Tiempo total de importación (ms) y desglose acumulado por módulo
+
+    Devuelve (total_ms, [(acumulado_ms, módulo)...]) a partir de la salida de -X importtime.
+    """
+    result = run_python(["-X", "importtime", "-c", f"import {module}"])
+    cumulative = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        try:
+            cumulative.append((int(cumulative_us) / 1000.0, name.strip()))
+        except ValueError:
+            # Cabecera "self [us] | cumulative | imported package"
+            continue
+
+    total = next((ms for ms, name in cumulative if name == module), 0.0)
+    return total, cumulative
+
+
+def cold_heuristic_forge():
+    """Latencia (ms) de la primera forja heurística y si llegó a cargarse torch"""
+    result = run_python(["-c", SCRIPT_FORJA_FRIA])
+    elapsed, torch_loaded = result.stdout.split()[-2:]
+    return float(elapsed), torch_loaded == "1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de REMForge")
+    parser.add_argument("--modules", nargs="+", default=MODULOS_BASE)
+    parser.add_argument("--top", type=int, default=8, help="Módulos más pesados a mostrar por importación")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Presupuesto de importación y de forja en frío (código 1 si se supera)")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'módulo':<34} {'import (ms)':>12}")
+    for module in args.modules:
+        total, cumulative = import_profile(module)
+        print(f"{module:<34} {total:>12.1f}")
+
+        heaviest = sorted(
+            (entry for entry in cumulative if entry[1] != module), reverse=True
+        )[:args.top]
+        for ms, name in heaviest:
+            print(f"    {name:<30} {ms:>12.1f}")
+
+        if args.budget_ms is not None and total > args.budget_ms:
+            over_budget.append(module)
+
+    elapsed, torch_loaded = cold_heuristic_forge()
+    print(f"\nforja heurística en frío: {elapsed:.1f} ms (torch cargado: {'sí' if torch_loaded else 'no'})")
+    if args.budget_ms is not None and elapsed > args.budget_ms:
+        over_budget.append("forge_text_heuristic")
+
+    if over_budget:
+        print(f"\nPresupuesto de {args.budget_ms:.0f} ms superado: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from remforge_stream import write_jsonl
+
 # Importar REMForge Ultra
 try:
     from remforge_ultra import REMForgeUltra, PhenomenalREM
@@ -347,8 +349,8 @@ def create_advanced_demo(forge):
     print(f"   ✅ Valencia promedio: {stats['affective_profile']['mean_valence']:.3f}")
     
     # Exportar secuencia
-    sequence_path = "/mnt/okcomputer/output/temporal_sequence.json"
-    forge.export_to_json(sequence, sequence_path, include_embeddings=False)
+    sequence_path = "/mnt/okcomputer/output/temporal_sequence.jsonl"
+    write_jsonl((rem.to_dict() for rem in sequence), sequence_path)
     
     print(f"   ✅ Secuencia exportada: {sequence_path}")
     
@@ -382,7 +384,7 @@ def main():
     print("=" * 60)
     print(f"📊 Dashboard: {dashboard_path}")
     print(f"📄 Reporte: {report_path}")
-    print(f"🔬 Secuencia temporal: /mnt/okcomputer/output/temporal_sequence.json")
+    print(f"🔬 Secuencia temporal: /mnt/okcomputer/output/temporal_sequence.jsonl")
     print(f"📁 Archivos demo: {demo_dir}")
     
     print(f"\n📈 Estadísticas:")
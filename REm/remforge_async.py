@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+REMForge Ultra: Servicio de Forja Asíncrono
+===========================================
+
+Frontal asyncio para servir `forge_text_ultra` detrás de una API web. Las
+peticiones concurrentes se encolan y se agrupan en micro-lotes (tamaño
+máximo y espera máxima) que pasan por `forge_text_batch` en un hilo de
+inferencia; cada petición recibe su REM a través de su propio future.
+
+Uso:
+    async with AsyncForge(max_batch_size=16, max_wait_ms=10) as service:
+        rem = await service.forge_text("Veo un color rojo intenso", contexto)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from remforge_ultra_formato_optimo import REMForgeUltraFormatoOptimo
+
+# Petición encolada: (texto, contexto, future del llamante)
+_Request = Tuple[str, Optional[Dict], "asyncio.Future"]
+
+
+class AsyncForge:
+    """
+    Servicio asíncrono que agrupa peticiones concurrentes en micro-lotes.
+
+    Un único hilo ejecuta la inferencia, de modo que los lotes no compiten
+    por el dispositivo; mientras un lote se forja, las peticiones nuevas se
+    acumulan en la cola y forman el siguiente. La latencia de cada petición
+    queda acotada por `max_wait_ms` más la duración de como mucho dos lotes.
+    """
+
+    def __init__(self, forge: Optional[REMForgeUltraFormatoOptimo] = None,
+                 forge_kwargs: Optional[Dict[str, Any]] = None, max_batch_size: int = 16,
+                 max_wait_ms: float = 10.0, max_queue_size: int = 1024):
+        """
+        Args:
+            forge: Forge ya construida (por defecto se crea una con forge_kwargs)
+            forge_kwargs: Argumentos de REMForgeUltraFormatoOptimo si no se pasa `forge`
+            max_batch_size: Peticiones por micro-lote como máximo
+            max_wait_ms: Espera máxima desde la primera petición de un lote hasta lanzarlo
+            max_queue_size: Peticiones en cola como máximo (contrapresión sobre los llamantes)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size debe ser al menos 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms debe ser no negativo")
+
+        self.forge = forge if forge is not None else REMForgeUltraFormatoOptimo(**(forge_kwargs or {}))
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_queue_size = max_queue_size
+
+        self.requests = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.failed_requests = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self._stopped = False
+
+    # ------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------
+
+    async def start(self):
+        """Arranca el agrupador en el bucle de eventos actual (se llama solo en la primera petición)"""
+        if self._closed:
+            raise RuntimeError("El servicio de forja está cerrado")
+        if self._worker is not None:
+            return
+        self._stopped = False
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="remforge-inference")
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        """Forja las peticiones encoladas antes del cierre y detiene el servicio (no admite nuevas)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._executor.shutdown(wait=True)
+        self._worker = None
+        self._queue = None
+        self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # ------------------------------------------------------------
+    # Peticiones
+    # ------------------------------------------------------------
+
+    async def forge_text(self, text: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Forja un texto; la petición se agrupa con las concurrentes
+
+        Args:
+            text: Texto experiencial
+            context: {situational_context, temporal_context, author_id}
+        """
+        if self._closed:
+            raise RuntimeError("El servicio de forja está cerrado")
+        await self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, context, future))
+        self.requests += 1
+        if self._stopped:
+            # Encolada tras el cierre del agrupador (esperaba sitio en la cola): nadie la atenderá
+            self._fail(future, RuntimeError("El servicio de forja se cerró antes de atender la petición"))
+        return await future
+
+    async def forge_many(self, texts: List[str], contexts: Optional[List[Optional[Dict]]] = None) -> List[Dict[str, Any]]:
+        """Forja varios textos como peticiones concurrentes y devuelve los REMs en orden"""
+        if contexts is None:
+            contexts = [None] * len(texts)
+        elif len(contexts) != len(texts):
+            raise ValueError(f"Se esperaban {len(texts)} contextos, se recibieron {len(contexts)}")
+        return list(await asyncio.gather(*(self.forge_text(text, context) for text, context in zip(texts, contexts))))
+
+    # ------------------------------------------------------------
+    # Agrupador
+    # ------------------------------------------------------------
+
+    async def _collect_batch(self) -> Tuple[List[_Request], bool]:
+        """Espera la primera petición y agrupa las que lleguen hasta llenar el lote o agotar la espera"""
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                # Lo ya encolado se toma sin esperar; después, hasta el plazo del lote
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self):
+        """Bucle del agrupador: micro-lotes hacia el hilo de inferencia hasta recibir el cierre"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._collect_batch()
+            # Peticiones cuyo llamante ya no espera (cancelación, timeout) no se forjan
+            batch = [request for request in batch if not request[2].done()]
+            if not batch:
+                continue
+
+            texts = [text for text, _, _ in batch]
+            contexts = [context for _, context, _ in batch]
+            self.batches += 1
+            try:
+                rems = await loop.run_in_executor(
+                    self._executor, self.forge.forge_text_batch, texts, contexts, len(batch)
+                )
+            except Exception:
+                # Un texto problemático no debe hacer fallar al resto: se reintenta petición a petición
+                self.failed_batches += 1
+                for request in batch:
+                    await self._run_single(loop, request)
+                continue
+
+            for (_, _, future), rem in zip(batch, rems):
+                if not future.done():
+                    future.set_result(rem)
+
+        # Peticiones encoladas detrás del centinela de cierre: no se forjarán
+        while not self._queue.empty():
+            request = self._queue.get_nowait()
+            if request is not None:
+                self._fail(request[2], RuntimeError("El servicio de forja se cerró antes de atender la petición"))
+        self._stopped = True
+
+    async def _run_single(self, loop, request: _Request):
+        """Forja una sola petición (reintento tras el fallo de su lote)"""
+        text, context, future = request
+        try:
+            rems = await loop.run_in_executor(self._executor, self.forge.forge_text_batch, [text], [context], 1)
+        except Exception as e:
+            self._fail(future, e)
+            return
+        if not future.done():
+            future.set_result(rems[0])
+
+    def _fail(self, future: "asyncio.Future", error: Exception):
+        """Resuelve el future de una petición con un error (si el llamante aún espera)"""
+        self.failed_requests += 1
+        if not future.done():
+            future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """Peticiones, lotes forjados y tamaño medio de lote"""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "failed_requests": self.failed_requests,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "queued": self._queue.qsize() if self._queue is not None else 0
+        }
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+REMForge: Contenedor Binario PhenomenalREM
+==========================================
+
+Serialización compacta de secuencias de REMs. Los campos estructurales se
+guardan como JSON compacto comprimido con zlib; todos los vectores numéricos
+(embeddings de anclajes léxicos, vectores invariantes, mapas...) se extraen a
+un bloque contiguo de arrays float16/float32/float64 alineados.
+
+Layout del fichero (.premb):
+
+    MAGIC (8 bytes) | longitud de la estructura (uint64 LE) | estructura zlib
+    | relleno hasta ALIGNMENT | bloque de arrays
+
+`load_rems(dump_rems(rems))` reproduce exactamente la misma estructura que
+`json.loads(json.dumps(rems, default=str))`, es decir, lo que hoy se obtiene
+al releer el JSON exportado. Con `dtype="auto"` (por defecto) cada array usa
+el tipo más compacto que conserva sus valores sin pérdida; "float16" y
+"float32" fuerzan un tipo más compacto aceptando la pérdida de precisión.
+"""
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Union, BinaryIO
+
+import numpy as np
+
+MAGIC = b"PREMB\x00\x01\x00"
+ALIGNMENT = 64
+ARRAY_REF_KEY = "$nd"
+MIN_ARRAY_LENGTH = 2
+
+_LENGTH = struct.Struct("<Q")
+_DTYPES = {"float16": np.float16, "float32": np.float32, "float64": np.float64}
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Normaliza tipos numpy y no serializables igual que json.dumps(default=str)"""
+    if isinstance(value, dict):
+        return {str(key) if not isinstance(key, str) else key: _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _to_json_compatible(value.tolist())
+    if isinstance(value, (np.floating, np.integer)) and not isinstance(value, (float, int)):
+        return value.item()
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def _float_shape(value: List) -> Union[Tuple[int, ...], None]:
+    """Forma de una lista (o lista de listas rectangular) cuyas hojas son todas float"""
+    if not value:
+        return None
+    if all(type(item) is float for item in value):
+        return (len(value),)
+    if all(isinstance(item, list) for item in value):
+        inner = _float_shape(value[0])
+        if inner is None or len(inner) != 1:
+            return None
+        if all(len(item) == inner[0] and all(type(x) is float for x in item) for item in value[1:]):
+            return (len(value), inner[0])
+    return None
+
+
+def _pick_dtype(array: np.ndarray, dtype: str) -> np.dtype:
+    """Tipo de almacenamiento: el solicitado, o en modo auto el más compacto sin pérdida"""
+    if dtype != "auto":
+        return np.dtype(_DTYPES[dtype])
+    for candidate in (np.float16, np.float32):
+        with np.errstate(over="ignore"):
+            narrowed = array.astype(candidate)
+        if np.array_equal(narrowed.astype(np.float64), array):
+            return np.dtype(candidate)
+    return np.dtype(np.float64)
+
+
+def _extract_arrays(value: Any, arrays: List[np.ndarray], dtype: str) -> Any:
+    """Sustituye los vectores numéricos por referencias {"$nd": índice}"""
+    if isinstance(value, dict):
+        return {key: _extract_arrays(item, arrays, dtype) for key, item in value.items()}
+    if isinstance(value, list):
+        shape = _float_shape(value)
+        if shape is not None and shape[-1] >= MIN_ARRAY_LENGTH:
+            array = np.asarray(value, dtype=np.float64)
+            arrays.append(array.astype(_pick_dtype(array, dtype)))
+            return {ARRAY_REF_KEY: len(arrays) - 1}
+        return [_extract_arrays(item, arrays, dtype) for item in value]
+    return value
+
+
+def _restore_arrays(value: Any, arrays: List[np.ndarray]) -> Any:
+    """Reemplaza las referencias {"$nd": índice} por listas de floats"""
+    if isinstance(value, dict):
+        if len(value) == 1 and ARRAY_REF_KEY in value:
+            return arrays[value[ARRAY_REF_KEY]].astype(np.float64).tolist()
+        return {key: _restore_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_arrays(item, arrays) for item in value]
+    return value
+
+
+def dumps_rems(rems: List[Dict[str, Any]], dtype: str = "auto", compression_level: int = 6) -> bytes:
+    """
+    Serializa una lista de REMs al contenedor binario
+
+    Args:
+        rems: REMs tal como los devuelve la forja
+        dtype: "auto" (sin pérdida), "float16", "float32" o "float64"
+        compression_level: Nivel zlib de la parte estructural
+    """
+    if dtype != "auto" and dtype not in _DTYPES:
+        raise ValueError(f"dtype no soportado: {dtype}")
+
+    arrays: List[np.ndarray] = []
+    structure = _extract_arrays(_to_json_compatible(rems), arrays, dtype)
+
+    offset = 0
+    descriptors = []
+    for array in arrays:
+        descriptors.append({"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+        offset += array.nbytes
+        offset += -offset % array.dtype.itemsize
+
+    header = json.dumps({"rems": structure, "arrays": descriptors}, separators=(",", ":"), ensure_ascii=False)
+    compressed = zlib.compress(header.encode("utf-8"), compression_level)
+
+    prefix_length = len(MAGIC) + _LENGTH.size + len(compressed)
+    chunks = [MAGIC, _LENGTH.pack(len(compressed)), compressed, b"\x00" * (-prefix_length % ALIGNMENT)]
+
+    position = 0
+    for array, descriptor in zip(arrays, descriptors):
+        chunks.append(b"\x00" * (descriptor["offset"] - position))
+        chunks.append(np.ascontiguousarray(array).tobytes())
+        position = descriptor["offset"] + array.nbytes
+
+    return b"".join(chunks)
+
+
+def loads_rems(data: Union[bytes, memoryview]) -> List[Dict[str, Any]]:
+    """Deserializa un contenedor binario a la lista de REMs original"""
+    view = memoryview(data)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("No es un contenedor PhenomenalREM binario (magic inválido)")
+
+    position = len(MAGIC)
+    (struct_length,) = _LENGTH.unpack_from(view, position)
+    position += _LENGTH.size
+    header = json.loads(zlib.decompress(view[position:position + struct_length]).decode("utf-8"))
+    position += struct_length
+    blob_start = position + (-position % ALIGNMENT)
+
+    arrays = []
+    for descriptor in header["arrays"]:
+        dtype = np.dtype(descriptor["dtype"])
+        count = int(np.prod(descriptor["shape"]))
+        array = np.frombuffer(view, dtype=dtype, count=count, offset=blob_start + descriptor["offset"])
+        arrays.append(array.reshape(descriptor["shape"]))
+
+    return _restore_arrays(header["rems"], arrays)
+
+
+def dump_rems(rems: List[Dict[str, Any]], destination: Union[str, Path, BinaryIO], dtype: str = "auto",
+              compression_level: int = 6) -> int:
+    """Escribe los REMs en un fichero .premb (ruta o fichero binario); devuelve los bytes escritos"""
+    data = dumps_rems(rems, dtype=dtype, compression_level=compression_level)
+    if hasattr(destination, "write"):
+        destination.write(data)
+    else:
+        with open(destination, "wb") as f:
+            f.write(data)
+    return len(data)
+
+
+def load_rems(source: Union[str, Path, BinaryIO]) -> List[Dict[str, Any]]:
+    """Lee los REMs de un fichero .premb (ruta o fichero binario)"""
+    if hasattr(source, "read"):
+        return loads_rems(source.read())
+    with open(source, "rb") as f:
+        return loads_rems(f.read())
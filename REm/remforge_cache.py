@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+REMForge: Caché Persistente de Resultados de Forja
+==================================================
+
+Caché opcional en disco delante de las llamadas de forja. La clave combina el
+hash del contenido de entrada (texto, bytes del fichero o del array), el
+contexto, la versión de la forja y su configuración de modelos, de modo que
+re-procesar un corpus sin cambios devuelve los REMs ya forjados.
+
+Cada entrada es un pickle en `<directorio>/<xx>/<clave>.pkl`. La recencia se
+guarda en el mtime del fichero (se actualiza en cada acierto) y la caché
+expulsa las entradas menos usadas recientemente al superar el máximo de
+entradas o de bytes.
+
+Uso:
+    cache = ForgeResultCache("~/.cache/remforge", max_bytes=2 << 30)
+    forge = REMForgeUltraFormatoOptimo(result_cache=cache)
+    ...
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Union
+
+import numpy as np
+
+FILE_CHUNK_SIZE = 1 << 20
+
+
+def _update_digest(digest, value: Any):
+    """Añade un valor al hash de forma estable según su tipo"""
+    if value is None or isinstance(value, (bool, int, float)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, str):
+        digest.update(b"s" + value.encode("utf-8"))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        digest.update(b"b" + bytes(value))
+    elif isinstance(value, Path):
+        # Contenido del fichero, no su ruta: dos copias del mismo fichero comparten entrada
+        digest.update(b"f")
+        with open(value, "rb") as f:
+            for chunk in iter(lambda: f.read(FILE_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"a{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif hasattr(value, "detach") and hasattr(value, "cpu"):
+        _update_digest(digest, value.detach().cpu().numpy())
+    elif isinstance(value, dict):
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"l")
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode("utf-8"))
+
+
+def content_key(namespace: str, content: Any, context: Optional[Dict], version: str, config: Dict) -> str:
+    """
+    Clave de caché de una llamada de forja
+
+    Args:
+        namespace: Tipo de llamada ("ultra/text", "lite/image"...)
+        content: Entrada; un `Path` se hashea por el contenido del fichero
+        context: Contexto de la llamada
+        version: Versión de la forja (invalida la caché al cambiar el esquema)
+        config: Configuración de modelos y precisión
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (namespace, version, config, context or {}, content):
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+
+class ForgeResultCache:
+    """Caché LRU en disco de resultados de forja, con métricas de aciertos y fallos"""
+
+    def __init__(self, directory: Union[str, Path], max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = 1 << 30):
+        """
+        Args:
+            directory: Directorio de la caché (se crea si no existe)
+            max_entries: Número máximo de entradas (None: sin límite)
+            max_bytes: Tamaño máximo en disco (None: sin límite)
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._scan()
+
+    def _scan(self):
+        """Reconstruye el índice LRU desde el disco (orden por mtime)"""
+        found = []
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime_ns, path.stem, stat.st_size))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Devuelve el resultado guardado para la clave, o None (y cuenta un fallo)"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except Exception as e:
+            # Entrada ausente, truncada o de una versión anterior del código: fallo de caché
+            if not isinstance(e, FileNotFoundError):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            with self._lock:
+                self.misses += 1
+                if key in self._entries:
+                    self._total_bytes -= self._entries.pop(key)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any):
+        """Guarda un resultado (escritura atómica) y aplica la expulsión LRU"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+        size = path.stat().st_size
+
+        with self._lock:
+            self.writes += 1
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        """Expulsa las entradas menos recientes hasta cumplir los límites (con el lock tomado)"""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Devuelve el resultado en caché o lo calcula y lo guarda"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Elimina todas las entradas (las métricas se conservan)"""
+        with self._lock:
+            for key in list(self._entries):
+                try:
+                    self._path(key).unlink()
+                except FileNotFoundError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas de la caché: aciertos, fallos, tasa de acierto, escrituras, expulsiones y tamaño"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes
+        }
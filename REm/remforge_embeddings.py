@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+REMForge: Tabla de Embeddings de Anclajes
+=========================================
+
+Tabla direccionada por contenido para los embeddings de los anclajes léxicos.
+Cada vector distinto se guarda una única vez y los REMs lo referencian por su
+`embedding_id` (hash del contenido), de modo que el vocabulario repetido entre
+documentos deja de duplicar vectores de 768 dimensiones en cada REM.
+
+Cuantización escalar opcional por niveles: cada vector se guarda en int8 con
+escala propia si el error relativo (norma L2) cabe en el presupuesto; si no,
+en float16; y si tampoco, en float32.
+"""
+
+import functools
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+QUANTIZATION_MODES = (None, "scalar")
+TIERS = ("int8", "float16", "float32")
+
+
+def embedding_id_for(vector: np.ndarray) -> str:
+    """Identificador por contenido de un embedding (sobre su representación float32)"""
+    data = np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+    return "emb-" + hashlib.blake2b(data, digest_size=10).hexdigest()
+
+
+def _relative_error(original: np.ndarray, restored: np.ndarray) -> float:
+    norm = np.linalg.norm(original)
+    if norm == 0:
+        return float(np.linalg.norm(restored))
+    return float(np.linalg.norm(original - restored) / norm)
+
+
+class AnchorEmbeddingTable:
+    """
+    Tabla deduplicada de embeddings de anclajes léxicos.
+
+    Uso:
+        table = AnchorEmbeddingTable(quantization="scalar", error_budget=0.01)
+        forge = REMForgeUltraFormatoOptimo(embedding_table=table)
+        rem = forge.forge_text_ultra(texto)
+        vector = table.get(rem["semantic_contamination"]["lexical_anchors"][0]["embedding_id"])
+        table.save("anclajes.npz")
+    """
+
+    def __init__(self, quantization: Optional[str] = None, error_budget: float = 0.01):
+        """
+        Args:
+            quantization: None (float32) o "scalar" (int8 / float16 / float32 por niveles)
+            error_budget: Error relativo L2 máximo admitido al cuantizar un vector
+        """
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Cuantización no soportada: {quantization}")
+        if error_budget < 0:
+            raise ValueError("error_budget debe ser no negativo")
+
+        self.quantization = quantization
+        self.error_budget = error_budget
+        self.dim: Optional[int] = None
+
+        self._index: Dict[str, Tuple[str, int]] = {}
+        self._int8_codes: List[np.ndarray] = []
+        self._int8_scales: List[float] = []
+        self._float16: List[np.ndarray] = []
+        self._float32: List[np.ndarray] = []
+        self.lookups = 0
+
+    def _quantize(self, vector: np.ndarray) -> Tuple[str, Any]:
+        """Elige el nivel más compacto dentro del presupuesto de error"""
+        if self.quantization == "scalar":
+            peak = float(np.abs(vector).max())
+            scale = peak / 127.0 if peak > 0 else 1.0
+            codes = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+            if _relative_error(vector, codes.astype(np.float32) * scale) <= self.error_budget:
+                return "int8", (codes, scale)
+
+            half = vector.astype(np.float16)
+            if _relative_error(vector, half.astype(np.float32)) <= self.error_budget:
+                return "float16", half
+
+        return "float32", vector
+
+    def add(self, vector: Union[np.ndarray, List[float]]) -> str:
+        """Registra un embedding (si no existe ya) y devuelve su identificador"""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if self.dim is None:
+            self.dim = vector.shape[0]
+        elif vector.shape[0] != self.dim:
+            raise ValueError(f"Dimensión de embedding {vector.shape[0]} distinta de la de la tabla ({self.dim})")
+
+        self.lookups += 1
+        embedding_id = embedding_id_for(vector)
+        if embedding_id in self._index:
+            return embedding_id
+
+        tier, payload = self._quantize(vector)
+        if tier == "int8":
+            codes, scale = payload
+            self._int8_codes.append(codes)
+            self._int8_scales.append(scale)
+            row = len(self._int8_codes) - 1
+        elif tier == "float16":
+            self._float16.append(payload)
+            row = len(self._float16) - 1
+        else:
+            self._float32.append(payload)
+            row = len(self._float32) - 1
+
+        self._index[embedding_id] = (tier, row)
+        return embedding_id
+
+    def get(self, embedding_id: str) -> np.ndarray:
+        """Devuelve el embedding (decuantizado, float32) de un identificador"""
+        tier, row = self._index[embedding_id]
+        if tier == "int8":
+            return self._int8_codes[row].astype(np.float32) * np.float32(self._int8_scales[row])
+        if tier == "float16":
+            return self._float16[row].astype(np.float32)
+        return self._float32[row].copy()
+
+    def get_many(self, embedding_ids: List[str]) -> np.ndarray:
+        """Matriz (n, dim) con los embeddings de varios identificadores"""
+        return np.stack([self.get(embedding_id) for embedding_id in embedding_ids]) if embedding_ids \
+            else np.empty((0, self.dim or 0), dtype=np.float32)
+
+    def __contains__(self, embedding_id: str) -> bool:
+        return embedding_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def stats(self) -> Dict[str, Any]:
+        """Vectores por nivel, bytes ocupados y tasa de deduplicación"""
+        nbytes = (sum(codes.nbytes + 4 for codes in self._int8_codes)
+                  + sum(half.nbytes for half in self._float16)
+                  + sum(full.nbytes for full in self._float32))
+        return {
+            "unique_embeddings": len(self._index),
+            "lookups": self.lookups,
+            "dedup_ratio": 1.0 - len(self._index) / self.lookups if self.lookups else 0.0,
+            "tiers": {"int8": len(self._int8_codes), "float16": len(self._float16), "float32": len(self._float32)},
+            "nbytes": nbytes,
+            "float32_equivalent_nbytes": len(self._index) * (self.dim or 0) * 4
+        }
+
+    def save(self, path: Union[str, Path]):
+        """Guarda la tabla en un fichero .npz"""
+        ids = list(self._index)
+        tiers = np.array([TIERS.index(self._index[embedding_id][0]) for embedding_id in ids], dtype=np.int8)
+        rows = np.array([self._index[embedding_id][1] for embedding_id in ids], dtype=np.int64)
+        dim = self.dim or 0
+
+        def _matrix(vectors, dtype):
+            return np.stack(vectors).astype(dtype) if vectors else np.empty((0, dim), dtype=dtype)
+
+        np.savez(
+            path,
+            ids=np.array(ids, dtype=str),
+            tiers=tiers,
+            rows=rows,
+            int8_codes=_matrix(self._int8_codes, np.int8),
+            int8_scales=np.array(self._int8_scales, dtype=np.float32),
+            float16=_matrix(self._float16, np.float16),
+            float32=_matrix(self._float32, np.float32),
+            config=np.array([self.quantization or "", str(self.error_budget), str(dim)], dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "AnchorEmbeddingTable":
+        """Carga una tabla guardada con `save`"""
+        with np.load(path) as data:
+            quantization, error_budget, dim = data["config"].tolist()
+            table = cls(quantization=quantization or None, error_budget=float(error_budget))
+            table.dim = int(dim) or None
+            table._int8_codes = list(data["int8_codes"])
+            table._int8_scales = data["int8_scales"].tolist()
+            table._float16 = list(data["float16"])
+            table._float32 = list(data["float32"])
+            for embedding_id, tier, row in zip(data["ids"].tolist(), data["tiers"].tolist(), data["rows"].tolist()):
+                table._index[embedding_id] = (TIERS[tier], row)
+        return table
+
+
+# Vectores heurísticos recientes; acotado para que un corpus en streaming no crezca sin límite
+HEURISTIC_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=HEURISTIC_CACHE_SIZE)
+def heuristic_token_embedding(token: str, dim: int = 768) -> np.ndarray:
+    """
+    Embedding determinista de un token para el modo heurístico (sin modelo)
+
+    Se deriva de un hash estable del token, de modo que el mismo token produce
+    siempre el mismo vector (y la tabla lo deduplica entre documentos).
+    """
+    seed = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+    vector = np.random.default_rng(seed).standard_normal(dim)
+    vector.flags.writeable = False
+    return vector
@@ -3,23 +3,36 @@
 REMForge Lite: An optimized version of REMForge Ultra for low-spec systems.
 
 This version uses lighter models to ensure compatibility with systems with limited resources (e.g., i5 CPU, 8GB RAM).
+
+Heavy dependencies (torch, spaCy, transformers, torchvision, librosa, PIL) are imported
+by the code paths that use them, so importing this module is cheap.
 """
 
+from __future__ import annotations
+
 import json
 import os
 import re
 import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
 
 import numpy as np
-from PIL import Image
-import torch
-import spacy
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-from torchvision import transforms
-from torchvision.models import mobilenet_v2
-import librosa
+
+from remforge_cache import ForgeResultCache, content_key
+from remforge_models import get_model_registry
+from remforge_segment import PUNCTUATION_DELIMITERS, iter_clause_spans
+
+# Streaming audio defaults: recordings longer than the threshold are read in overlapping windows
+DEFAULT_AUDIO_CONFIG = {
+    "window_seconds": 30.0,
+    "overlap_seconds": 2.0,
+    "stream_threshold_seconds": 120.0
+}
+
+# librosa's default STFT frame; shorter windows are zero-padded to it before analysis
+STFT_FRAME_LENGTH = 2048
 
 # ============================================
 # REMForge Lite System
@@ -28,42 +41,63 @@ import librosa
 class REMForgeLite:
     """A lightweight version of REMForge for phenomenological data conversion."""
 
-    def __init__(self, config: Optional[Dict] = None, device: str = "cpu"):
+    SCHEMA_VERSION = "PhenomenalREM-Lite-1.0.0"
+
+    def __init__(self, config: Optional[Dict] = None, device: str = "cpu",
+                 result_cache: Optional[ForgeResultCache] = None, load_models: bool = True):
         """Initializes the REMForge Lite system.
 
         Args:
             config (Optional[Dict]): A configuration dictionary for models.
             device (str): The device to run the models on ('cpu' or 'cuda').
+            result_cache (Optional[ForgeResultCache]): Persistent cache of forged REMs keyed by content hash.
+            load_models (bool): Load the models now; False gives a keyword-only forge that imports no ML stack.
         """
         self.device = device
         self.config = config or self._get_default_config()
+        self.result_cache = result_cache
         self.models = {}
         print(f"REMForge Lite initialized on device: {self.device}")
 
-        self._load_models()
+        if load_models:
+            self._load_models()
 
     def _get_default_config(self) -> Dict:
         """Returns the default model configuration."""
         return {
             "text": {
                 "spacy_model": "en_core_web_sm",
-                "sentiment_model": "distilbert-base-uncased-finetuned-sst-2-english"
+                "spacy_disable": ["parser", "ner"],
+                "sentiment_model": "distilbert-base-uncased-finetuned-sst-2-english",
+                "batch_size": 32,
+                "n_process": 1
             },
             "vision": {
                 "model_name": "mobilenet_v2",
                 "pretrained": True
-            }
+            },
+            "audio": dict(DEFAULT_AUDIO_CONFIG)
         }
 
+    def _audio_config(self) -> Dict:
+        """Returns the audio streaming configuration, filling in defaults."""
+        return {**DEFAULT_AUDIO_CONFIG, **self.config.get("audio", {})}
+
     def _load_models(self):
         """Loads the lightweight models required for analysis based on the config."""
         print("Loading lightweight models...")
+        registry = get_model_registry()
 
         # Text analysis
         try:
+            import spacy
             spacy_model = self.config['text']['spacy_model']
-            self.models['nlp'] = spacy.load(spacy_model)
-            print(f"  - spaCy model '{spacy_model}' loaded.")
+            # The analyzers only read pos_ and lemma_, so the parser and NER are not needed
+            disable = list(self.config['text'].get('spacy_disable', ["parser", "ner"]))
+            registry_name = f"{spacy_model}[-{','.join(sorted(disable))}]" if disable else spacy_model
+            self.models['nlp'] = registry.get_or_load(registry_name, "cpu", "float32",
+                                                      lambda: spacy.load(spacy_model, disable=disable))
+            print(f"  - spaCy model '{spacy_model}' loaded (disabled: {', '.join(disable) or 'none'}).")
         except OSError:
             print(f"  - spaCy model not found. Please run: python -m spacy download {self.config['text']['spacy_model']}")
             self.models['nlp'] = None
@@ -72,8 +106,12 @@ class REMForgeLite:
             self.models['nlp'] = None
 
         try:
+            from transformers import pipeline
             sentiment_model = self.config['text']['sentiment_model']
-            self.models['sentiment'] = pipeline("sentiment-analysis", model=sentiment_model, device=self.device)
+            self.models['sentiment'] = registry.get_or_load(
+                sentiment_model, self.device, "float32",
+                lambda: pipeline("sentiment-analysis", model=sentiment_model, device=self.device)
+            )
             print(f"  - Sentiment analysis model '{sentiment_model}' loaded.")
         except Exception as e:
             print(f"  - Could not load sentiment analysis model: {e}")
@@ -82,8 +120,13 @@ class REMForgeLite:
         # Vision analysis
         try:
             if self.config['vision']['model_name'] == 'mobilenet_v2':
-                self.models['vision'] = mobilenet_v2(pretrained=self.config['vision']['pretrained']).to(self.device)
-                self.models['vision'].eval()
+                from torchvision import transforms
+                from torchvision.models import mobilenet_v2
+                pretrained = self.config['vision']['pretrained']
+                self.models['vision'] = registry.get_or_load(
+                    "mobilenet_v2" if pretrained else "mobilenet_v2-untrained", self.device, "float32",
+                    lambda: mobilenet_v2(pretrained=pretrained).to(self.device).eval()
+                )
                 self.models['vision_transform'] = transforms.Compose([
                     transforms.Resize(256),
                     transforms.CenterCrop(224),
@@ -104,7 +147,7 @@ class REMForgeLite:
         """Generates the header for a REM file."""
         return {
             "rem_id": f"rem_{uuid.uuid4()}",
-            "schema_version": "PhenomenalREM-Lite-1.0.0",
+            "schema_version": self.SCHEMA_VERSION,
             "timestamp_created": datetime.utcnow().isoformat() + "Z",
             "modality_origin": modality,
             "context": context,
@@ -123,6 +166,52 @@ class REMForgeLite:
             "visualization_layer": {}
         }
 
+    def _forge_cached(self, kind: str, content: Any, context: Optional[Dict], forge_fn) -> Dict:
+        """Returns the cached REM for this input, or forges and caches it.
+
+        Args:
+            kind (str): The forge call ('text', 'image' or 'audio').
+            content (Any): The input to key on; a Path is keyed by its file contents.
+            context (Optional[Dict]): The call context, part of the key.
+            forge_fn: Zero-argument callable that forges the REM on a cache miss.
+
+        Returns:
+            Dict: A dictionary representing the PhenomenalREM-Lite object.
+        """
+        key = self._cache_key(kind, content, context)
+        if key is None:
+            return forge_fn()
+        rem = self.result_cache.get(key)
+        if rem is not None:
+            return self._reissue_cached_rem(rem)
+        rem = forge_fn()
+        self.result_cache.put(key, rem)
+        return rem
+
+    @staticmethod
+    def _reissue_cached_rem(rem: Dict) -> Dict:
+        """Returns a copy of a cached REM with a fresh rem_id and creation timestamp.
+
+        Every forge call yields a distinct REM, even for repeated inputs, so two
+        cache hits never share an id.
+        """
+        header = dict(rem["header"])
+        header["rem_id"] = f"rem_{uuid.uuid4()}"
+        header["timestamp_created"] = datetime.utcnow().isoformat() + "Z"
+        return {**rem, "header": header}
+
+    def _cache_key(self, kind: str, content: Any, context: Optional[Dict]) -> Optional[str]:
+        """Returns the result cache key for an input, or None when the cache does not apply.
+
+        The key records which models actually loaded, so REMs forged by the
+        fallback paths are never served to an instance that has the models.
+        """
+        if self.result_cache is None or (isinstance(content, Path) and not content.is_file()):
+            return None
+        loaded = sorted(name for name, model in self.models.items() if model is not None)
+        config = {"models": self.config, "loaded": loaded, "device": self.device}
+        return content_key(f"lite/{kind}", content, context, self.SCHEMA_VERSION, config)
+
     def forge_text(self, text: str, context: Optional[Dict] = None) -> Dict:
         """Converts a text string into a PhenomenalREM-Lite object.
 
@@ -133,6 +222,91 @@ class REMForgeLite:
         Returns:
             Dict: A dictionary representing the PhenomenalREM-Lite object.
         """
+        return self._forge_cached("text", text, context, lambda: self._forge_text_uncached(text, context))
+
+    def forge_text_batch(self, texts: List[str], contexts: Optional[List[Optional[Dict]]] = None,
+                         batch_size: Optional[int] = None, n_process: Optional[int] = None) -> List[Dict]:
+        """Converts a batch of texts into PhenomenalREM-Lite objects.
+
+        Texts are streamed through spaCy with `nlp.pipe` and sentiment is scored
+        in batches through the Hugging Face pipeline, which is several times
+        faster than calling `forge_text` per document. Cached results are reused
+        and only the misses are forged.
+
+        Args:
+            texts (List[str]): The input texts to analyze.
+            contexts (Optional[List[Optional[Dict]]]): One context per text, or None.
+            batch_size (Optional[int]): Documents per spaCy and sentiment batch (defaults to the text config).
+            n_process (Optional[int]): spaCy worker processes (defaults to the text config).
+
+        Returns:
+            List[Dict]: The PhenomenalREM-Lite objects, in input order.
+        """
+        if contexts is None:
+            contexts = [None] * len(texts)
+        elif len(contexts) != len(texts):
+            raise ValueError(f"Expected {len(texts)} contexts, got {len(contexts)}")
+
+        keys = [self._cache_key("text", text, context) for text, context in zip(texts, contexts)]
+        results = [self.result_cache.get(key) if key is not None else None for key in keys]
+        results = [self._reissue_cached_rem(rem) if rem is not None else None for rem in results]
+        missing = [i for i, rem in enumerate(results) if rem is None]
+        if missing:
+            forged = self._forge_text_batch_uncached([texts[i] for i in missing], [contexts[i] for i in missing],
+                                                     batch_size, n_process)
+            for i, rem in zip(missing, forged):
+                if keys[i] is not None:
+                    self.result_cache.put(keys[i], rem)
+                results[i] = rem
+        return results
+
+    def _forge_text_uncached(self, text: str, context: Optional[Dict]) -> Dict:
+        """Forges a text REM without going through the result cache."""
+        return self._forge_text_batch_uncached([text], [context], 1, 1)[0]
+
+    def _forge_text_batch_uncached(self, texts: List[str], contexts: List[Optional[Dict]],
+                                   batch_size: Optional[int], n_process: Optional[int]) -> List[Dict]:
+        """Forges a batch of text REMs without going through the result cache."""
+        text_config = self.config.get('text', {})
+        batch_size = batch_size or text_config.get('batch_size', 32)
+        n_process = n_process or text_config.get('n_process', 1)
+
+        if self.models.get('nlp'):
+            docs = self.models['nlp'].pipe(texts, batch_size=batch_size, n_process=n_process)
+        else:
+            docs = (None for _ in texts)
+        valences = self._compute_sentiment_batch(texts, batch_size)
+
+        return [
+            self._assemble_text_rem(text, context, doc, valence)
+            for text, context, doc, valence in zip(texts, contexts, docs, valences)
+        ]
+
+    def _compute_sentiment_batch(self, texts: List[str], batch_size: int) -> List[Optional[float]]:
+        """Scores sentiment valence for a batch of texts (None where unavailable)."""
+        if not self.models.get('sentiment'):
+            return [None] * len(texts)
+
+        def to_valence(sentiment: Dict) -> float:
+            return sentiment['score'] if sentiment['label'] == 'POSITIVE' else -sentiment['score']
+
+        try:
+            return [to_valence(sentiment) for sentiment in self.models['sentiment'](texts, batch_size=batch_size)]
+        except Exception:
+            pass
+
+        # A single failing text (e.g. over the model length) must not drop the whole batch
+        valences = []
+        for text in texts:
+            try:
+                valences.append(to_valence(self.models['sentiment'](text)[0]))
+            except Exception as e:
+                print(f"Could not compute sentiment: {e}")
+                valences.append(None)
+        return valences
+
+    def _assemble_text_rem(self, text: str, context: Optional[Dict], doc, valence: Optional[float]) -> Dict:
+        """Builds a text REM from its spaCy doc and sentiment valence."""
         header = self._generate_rem_header("text", context or {})
         rem = self._create_base_rem_structure(header)
 
@@ -143,18 +317,12 @@ class REMForgeLite:
         }
 
         # 2. Noetic, Sensorial, and Affective Analysis
-        if self.models.get('nlp'):
-            doc = self.models['nlp'](text)
+        if doc is not None:
             rem["noetic_layer"] = self._analyze_noetic_aspects(doc)
             rem["sensorial_layer"] = self._analyze_sensorial_aspects(doc)
 
-        if self.models.get('sentiment'):
-            try:
-                sentiment = self.models['sentiment'](text)[0]
-                valence = sentiment['score'] if sentiment['label'] == 'POSITIVE' else -sentiment['score']
-                rem['sensorial_layer']['affective_valence'] = valence
-            except Exception as e:
-                print(f"Could not compute sentiment: {e}")
+        if valence is not None:
+            rem['sensorial_layer']['affective_valence'] = valence
 
         # 3. Semantic Contamination
         rem["semantic_contamination"] = self._analyze_semantic_contamination(text)
@@ -172,7 +340,7 @@ class REMForgeLite:
         return rem
 
     def _analyze_clausal_structure(self, text: str) -> List[Dict[str, Any]]:
-        """Analyzes the clausal structure of a text using simple punctuation-based splitting.
+        """Analyzes the clausal structure of a text using single-pass punctuation splitting.
 
         Args:
             text (str): The text to analyze.
@@ -180,17 +348,10 @@ class REMForgeLite:
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each representing a clause.
         """
-        clauses = re.split(r'[,.;:!?]', text)
-        result = []
-        for c in clauses:
-            if c.strip():
-                start_char = text.find(c)
-                result.append({
-                    'clause_text': c.strip(),
-                    'start_char': start_char,
-                    'end_char': start_char + len(c)
-                })
-        return result
+        return [
+            {'clause_text': clause, 'start_char': start_char, 'end_char': end_char}
+            for clause, start_char, end_char in iter_clause_spans(text, PUNCTUATION_DELIMITERS, strip=True)
+        ]
 
     def _analyze_noetic_aspects(self, doc) -> Dict[str, Any]:
         """Analyzes noetic aspects using spaCy's linguistic features.
@@ -295,6 +456,11 @@ class REMForgeLite:
         Returns:
             Dict: A dictionary representing the PhenomenalREM-Lite object.
         """
+        return self._forge_cached("image", Path(image_path), context,
+                                  lambda: self._forge_image_uncached(image_path, context))
+
+    def _forge_image_uncached(self, image_path: str, context: Optional[Dict]) -> Dict:
+        """Forges an image REM without going through the result cache."""
         header = self._generate_rem_header("image", context or {})
         rem = self._create_base_rem_structure(header)
 
@@ -303,6 +469,8 @@ class REMForgeLite:
             return rem
 
         try:
+            import torch
+            from PIL import Image
             image = Image.open(image_path).convert("RGB")
             image_tensor = self.models['vision_transform'](image).unsqueeze(0).to(self.device)
 
@@ -337,6 +505,7 @@ class REMForgeLite:
 
     def _analyze_audio_qualia(self, y: np.ndarray, sr: int) -> Dict:
         """Analyzes simplified audio qualia from a signal."""
+        import librosa
         chroma = librosa.feature.chroma_stft(y=y, sr=sr)
         tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
         spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
@@ -357,10 +526,26 @@ class REMForgeLite:
         Returns:
             Dict: A dictionary representing the PhenomenalREM-Lite object.
         """
+        return self._forge_cached("audio", Path(audio_path), context,
+                                  lambda: self._forge_audio_uncached(audio_path, context))
+
+    def _forge_audio_uncached(self, audio_path: str, context: Optional[Dict]) -> Dict:
+        """Forges an audio REM without going through the result cache."""
+        try:
+            import soundfile as sf
+            if sf.info(audio_path).duration > self._audio_config()["stream_threshold_seconds"]:
+                return self._forge_audio_stream_uncached(audio_path, context, None, None)
+        except ImportError:
+            pass
+        except RuntimeError:
+            # soundfile cannot read the format (e.g. mp3 on old libsndfile): fall back to librosa
+            pass
+
         header = self._generate_rem_header("audio", context or {})
         rem = self._create_base_rem_structure(header)
 
         try:
+            import librosa
             y, sr = librosa.load(audio_path, sr=None)
 
             rem['phenomenal_core']['qualia_signature'] = self._analyze_audio_qualia(y, sr)
@@ -374,6 +559,107 @@ class REMForgeLite:
 
         return rem
 
+    def iter_audio_windows(self, audio_path: str, window_seconds: Optional[float] = None,
+                           overlap_seconds: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Streams per-window audio qualia from a file in constant memory.
+
+        The file is read with soundfile in fixed-size blocks that overlap by
+        `overlap_seconds`, so only one window is ever held in memory.
+
+        Args:
+            audio_path (str): The path to the audio file.
+            window_seconds (Optional[float]): Window length (defaults to the audio config).
+            overlap_seconds (Optional[float]): Overlap between consecutive windows.
+
+        Yields:
+            Dict[str, Any]: Window index, start/end time, the number of new (non-overlapping)
+                samples it contributes, its RMS energy and its qualia.
+        """
+        import soundfile as sf
+
+        audio_config = self._audio_config()
+        window_seconds = window_seconds or audio_config["window_seconds"]
+        overlap_seconds = audio_config["overlap_seconds"] if overlap_seconds is None else overlap_seconds
+
+        sr = sf.info(audio_path).samplerate
+        window_frames = max(1, int(window_seconds * sr))
+        overlap_frames = min(int(overlap_seconds * sr), window_frames - 1)
+        hop_frames = window_frames - overlap_frames
+
+        blocks = sf.blocks(audio_path, blocksize=window_frames, overlap=overlap_frames,
+                           dtype='float32', always_2d=True)
+        for index, block in enumerate(blocks):
+            y = block.mean(axis=1)
+            new_samples = len(y) if index == 0 else len(y) - overlap_frames
+            if new_samples <= 0:
+                # Trailing block that only repeats the overlap
+                continue
+
+            start = index * hop_frames
+            rms_energy = float(np.sqrt(np.mean(y ** 2)))
+            if len(y) < STFT_FRAME_LENGTH:
+                # Short tail window: pad it to one STFT frame so its samples are still analysed
+                y = np.pad(y, (0, STFT_FRAME_LENGTH - len(y)))
+            yield {
+                "index": index,
+                "start_time": start / sr,
+                "end_time": (start + block.shape[0]) / sr,
+                "new_samples": new_samples,
+                "rms_energy": rms_energy,
+                "qualia": self._analyze_audio_qualia(y, sr)
+            }
+
+    def forge_audio_stream(self, audio_path: str, context: Optional[Dict] = None,
+                           window_seconds: Optional[float] = None,
+                           overlap_seconds: Optional[float] = None) -> Dict:
+        """Converts a long audio recording into a PhenomenalREM-Lite object by streaming windows.
+
+        Args:
+            audio_path (str): The path to the audio file.
+            context (Optional[Dict]): Additional context for the analysis.
+            window_seconds (Optional[float]): Window length (defaults to the audio config).
+            overlap_seconds (Optional[float]): Overlap between consecutive windows.
+
+        Returns:
+            Dict: A dictionary representing the PhenomenalREM-Lite object, with per-window
+                qualia and a signature aggregated over the whole recording.
+        """
+        return self._forge_cached(
+            "audio_stream", (Path(audio_path), window_seconds, overlap_seconds), context,
+            lambda: self._forge_audio_stream_uncached(audio_path, context, window_seconds, overlap_seconds)
+        )
+
+    def _forge_audio_stream_uncached(self, audio_path: str, context: Optional[Dict],
+                                     window_seconds: Optional[float], overlap_seconds: Optional[float]) -> Dict:
+        """Forges a streamed audio REM without going through the result cache."""
+        header = self._generate_rem_header("audio", context or {})
+        rem = self._create_base_rem_structure(header)
+
+        windows = []
+        totals = {"chroma_mean": 0.0, "tempo": 0.0, "spectral_brightness": 0.0}
+        total_samples = 0
+        energy_sum = 0.0
+        try:
+            for window in self.iter_audio_windows(audio_path, window_seconds, overlap_seconds):
+                # Weight by the new samples each window contributes, so overlaps are not counted twice
+                weight = window["new_samples"]
+                for key in totals:
+                    totals[key] += window["qualia"][key] * weight
+                energy_sum += window["rms_energy"] ** 2 * weight
+                total_samples += weight
+                windows.append({key: value for key, value in window.items() if key != "new_samples"})
+        except FileNotFoundError:
+            print(f"Error: Audio file not found at {audio_path}")
+        except Exception as e:
+            print(f"Error processing audio {audio_path}: {e}")
+
+        if total_samples:
+            rem['phenomenal_core']['qualia_signature'] = {key: value / total_samples for key, value in totals.items()}
+            rem['header']['quality_metrics']['rms_energy'] = float(np.sqrt(energy_sum / total_samples))
+        rem['experiential_stream']['windows'] = windows
+        rem['header']['quality_metrics']['num_windows'] = len(windows)
+        return rem
+
 if __name__ == '__main__':
     # ==============================================================================
     # Demonstration of REMForgeLite
@@ -385,6 +671,8 @@ if __name__ == '__main__':
     # --- 1. Configuration and Initialization ---
     # Set the device for computation ('cuda' for GPU, 'cpu' for CPU).
     # The script will automatically fall back to 'cpu' if 'cuda' is not available.
+    import torch
+    from PIL import Image
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
     output_dir = "rem_output"
     os.makedirs(output_dir, exist_ok=True)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+REMForge: Registro Compartido de Modelos
+========================================
+
+Registro de modelos a nivel de proceso, indexado por (nombre de modelo,
+dispositivo, precisión). Varias instancias de REMForgeUltraFormatoOptimo o
+REMForgeLite en el mismo proceso comparten así los mismos pesos.
+
+En Linux, `freeze_for_fork()` prepara el proceso padre para que los workers
+creados con fork hereden los pesos ya cargados como páginas copy-on-write.
+
+`lazy_import()` difiere la importación de dependencias pesadas (torch) hasta
+el primer acceso a uno de sus atributos.
+"""
+
+import gc
+import importlib.util
+import sys
+import threading
+from typing import Dict, Any, Callable, List, Tuple
+
+ModelKey = Tuple[str, str, str]
+
+
+class ModelRegistry:
+    """Caché de modelos por proceso con carga única y thread-safe por clave"""
+
+    def __init__(self):
+        self._models: Dict[ModelKey, Any] = {}
+        self._locks: Dict[ModelKey, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get_or_load(self, name: str, device: str, precision: str, loader: Callable[[], Any]) -> Any:
+        """
+        Devuelve el modelo registrado para la clave, cargándolo una sola vez
+
+        Args:
+            name: Nombre del modelo (p. ej. "facebook/bart-large")
+            device: Dispositivo de ejecución ("cpu", "cuda", "mps")
+            precision: Precisión de inferencia ("float32", "float16", ...)
+            loader: Función sin argumentos que construye el modelo
+
+        Un loader que devuelve None (modelo no disponible) también queda
+        registrado, para no reintentar la carga en cada instancia.
+        """
+        key = (name, device, precision)
+        if key in self._models:
+            return self._models[key]
+
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self._models:
+                self._models[key] = loader()
+
+        return self._models[key]
+
+    def keys(self) -> List[ModelKey]:
+        """Claves de los modelos registrados"""
+        return list(self._models)
+
+    def release(self, name: str = None):
+        """Libera los modelos de un nombre (o todos si name es None)"""
+        with self._guard:
+            for key in list(self._models):
+                if name is None or key[0] == name:
+                    del self._models[key]
+
+    def __contains__(self, key: ModelKey) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# Registro único del proceso (heredado por los workers creados con fork)
+MODEL_REGISTRY = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Devuelve el registro de modelos del proceso"""
+    return MODEL_REGISTRY
+
+
+def fork_sharing_available() -> bool:
+    """Indica si la plataforma permite compartir pesos copy-on-write vía fork"""
+    return sys.platform.startswith("linux")
+
+
+def freeze_for_fork():
+    """
+    Prepara el proceso padre para hacer fork con los modelos ya cargados
+
+    Recolecta la basura pendiente y congela los objetos supervivientes
+    (gc.freeze) para que el recolector de los hijos no escriba en sus
+    cabeceras y rompa el copy-on-write de las páginas compartidas.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def lazy_import(name: str):
+    """
+    Devuelve el módulo `name` sin ejecutarlo hasta el primer acceso a un atributo
+
+    Si el módulo ya está importado se devuelve tal cual. Permite que los
+    caminos que no lo usan (modo heurístico, comprobaciones de salud, CLI)
+    no paguen su tiempo de importación.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No se encuentra el módulo {name}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+REMForge Ultra: Motor de Forja Paralela
+=======================================
+
+Reparte `forge_text_ultra` sobre un pool de procesos. Pensado para el camino
+heurístico (sin modelo semántico), que es trabajo Python puro de regex y
+conjuntos limitado por el GIL y escala linealmente con los núcleos.
+"""
+
+import gc
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+from remforge_models import fork_sharing_available, freeze_for_fork
+from remforge_ultra_formato_optimo import REMForgeUltraFormatoOptimo
+
+# Forge residente en cada proceso worker (creada una sola vez por el initializer)
+_worker_forge: Optional[REMForgeUltraFormatoOptimo] = None
+
+
+def _init_worker(forge_kwargs: Dict[str, Any], preload: Optional[List[str]]):
+    """Inicializa la forge del worker una única vez (y precarga sus modelos si se pide)"""
+    global _worker_forge
+    _worker_forge = REMForgeUltraFormatoOptimo(**forge_kwargs)
+    if preload:
+        _worker_forge.preload(preload)
+
+
+def _forge_chunk(items: List[Tuple[str, Optional[Dict]]]) -> List[Dict[str, Any]]:
+    """Forja un bloque de (texto, contexto) en el worker"""
+    return [_worker_forge.forge_text_ultra(text, context) for text, context in items]
+
+
+class ParallelForge:
+    """
+    Ejecuta `forge_text_ultra` en paralelo sobre un ProcessPoolExecutor.
+
+    Los resultados se devuelven en el orden de entrada y en streaming: sólo se
+    mantiene en vuelo un número acotado de bloques, de modo que la memoria no
+    crece con el tamaño del corpus.
+
+    Con `prewarm` (sólo Linux) los modelos se cargan en el proceso padre antes
+    del fork: los workers los encuentran en el registro compartido heredado y
+    usan los mismos pesos copy-on-write en lugar de cargar su propia copia.
+    El heap del padre queda congelado (gc.freeze) mientras el pool está
+    abierto, porque los workers pueden hacer fork bajo demanda (Python < 3.11)
+    o reemplazarse; `close()` lo descongela.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, forge_kwargs: Optional[Dict[str, Any]] = None,
+                 chunksize: int = 32, max_pending_chunks: Optional[int] = None, mp_context=None,
+                 preload: Optional[List[str]] = None, prewarm: Optional[List[str]] = None):
+        """
+        Args:
+            max_workers: Número de procesos (por defecto, todos los núcleos)
+            forge_kwargs: Argumentos de REMForgeUltraFormatoOptimo en cada worker
+                          (por defecto CPU y modo heurístico, sin modelos; con `prewarm`,
+                          CPU con modelos)
+            chunksize: Textos enviados a un worker en cada tarea
+            max_pending_chunks: Bloques en vuelo como máximo (por defecto 2 por worker)
+            mp_context: Contexto de multiprocessing opcional ("fork", "spawn"...)
+            preload: Modalidades a precargar en cada worker al arrancar (pool en caliente)
+            prewarm: Modalidades a cargar en el padre y compartir vía fork (sólo Linux, CPU)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if forge_kwargs is None:
+            forge_kwargs = {"device": "cpu"} if prewarm else {"device": "cpu", "load_models": False}
+        self.forge_kwargs = forge_kwargs
+        self.chunksize = max(1, chunksize)
+        self.max_pending_chunks = max_pending_chunks or self.max_workers * 2
+        self.preload = preload
+        self._frozen = bool(prewarm)
+
+        if prewarm:
+            mp_context = self._prewarm_for_fork(prewarm, mp_context)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.forge_kwargs, self.preload)
+        )
+
+    def _prewarm_for_fork(self, modalities: List[str], mp_context):
+        """Carga los modelos en el padre y devuelve un contexto fork para heredarlos"""
+        if not fork_sharing_available():
+            raise RuntimeError("El pre-calentamiento compartido vía fork sólo está disponible en Linux")
+        if mp_context is not None and mp_context.get_start_method() != "fork":
+            raise ValueError("prewarm requiere un contexto de multiprocessing 'fork'")
+        if not self.forge_kwargs.get("load_models", True):
+            raise ValueError("prewarm no tiene efecto con load_models=False: los workers no usan modelos")
+
+        parent_forge = REMForgeUltraFormatoOptimo(**self.forge_kwargs)
+        if parent_forge.device != "cpu":
+            raise ValueError("prewarm sólo es compatible con device='cpu' (CUDA no sobrevive a un fork)")
+        parent_forge.preload(modalities)
+
+        freeze_for_fork()
+        return mp_context or multiprocessing.get_context("fork")
+
+    def map(self, texts: Iterable[str], contexts: Optional[Iterable[Optional[Dict]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Forja cada texto y produce los REMs en el orden de entrada
+
+        Args:
+            texts: Iterable de textos experienciales (puede ser un generador)
+            contexts: Iterable de contextos paralelo a `texts`, o None
+        """
+        if contexts is None:
+            items = ((text, None) for text in texts)
+        else:
+            items = zip(texts, contexts)
+
+        pending = deque()
+        while True:
+            while len(pending) < self.max_pending_chunks:
+                chunk = list(islice(items, self.chunksize))
+                if not chunk:
+                    break
+                pending.append(self._executor.submit(_forge_chunk, chunk))
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+    def forge_all(self, texts: Iterable[str], contexts: Optional[Iterable[Optional[Dict]]] = None) -> List[Dict[str, Any]]:
+        """Forja todos los textos y devuelve la lista completa de REMs"""
+        return list(self.map(texts, contexts))
+
+    def close(self):
+        """Cierra el pool de procesos (y descongela el heap del padre si hubo prewarm)"""
+        self._executor.shutdown(wait=True)
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
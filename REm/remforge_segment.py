@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+REMForge: Segmentación de Cláusulas con Offsets Exactos
+=======================================================
+
+Segmentador de una sola pasada compartido por REMForgeLite y REMForge Ultra.
+Recorre los delimitadores con `re.finditer` y produce cada cláusula junto con
+su intervalo de caracteres [start, end) en el texto original, de modo que
+`text[span.start:span.end] == span.text` se cumple siempre, también con
+cláusulas repetidas y conectores de varias palabras.
+
+El coste es O(n) en la longitud del texto. `iter_clause_spans` es un
+generador: un libro completo se segmenta sin construir listas intermedias.
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Pattern, Union
+
+# Puntuación de cláusula (REMForgeLite)
+PUNCTUATION_DELIMITERS = re.compile(r'[,.;:!?]')
+
+# Fin de oración y conectores temporales y de perspectiva (REMForge Ultra)
+EXPERIENTIAL_DELIMITERS = re.compile(r'(?<=[.!?])\s+|\s+(?:y|pero|entonces|cuando|mientras|aunque|sin embargo)\s+')
+
+
+class ClauseSpan(NamedTuple):
+    """Cláusula y su intervalo [start, end) de caracteres en el texto original"""
+    text: str
+    start: int
+    end: int
+
+
+def iter_clause_spans(text: str, delimiters: Union[str, Pattern] = PUNCTUATION_DELIMITERS,
+                      strip: bool = False) -> Iterator[ClauseSpan]:
+    """
+    Produce las cláusulas no vacías del texto con sus offsets, en orden
+
+    Args:
+        text: Texto a segmentar
+        delimiters: Patrón (o expresión regular) de los separadores entre cláusulas
+        strip: Excluir el espacio en blanco inicial y final de cada cláusula (y de su intervalo)
+    """
+    pattern = re.compile(delimiters) if isinstance(delimiters, str) else delimiters
+
+    position = 0
+    for match in pattern.finditer(text):
+        span = _clause_span(text, position, match.start(), strip)
+        if span is not None:
+            yield span
+        position = match.end()
+
+    span = _clause_span(text, position, len(text), strip)
+    if span is not None:
+        yield span
+
+
+def segment_clauses(text: str, delimiters: Union[str, Pattern] = PUNCTUATION_DELIMITERS,
+                    strip: bool = False) -> List[ClauseSpan]:
+    """Lista de cláusulas con offsets (ver `iter_clause_spans`)"""
+    return list(iter_clause_spans(text, delimiters, strip))
+
+
+def _clause_span(text: str, start: int, end: int, strip: bool):
+    """Cláusula del intervalo [start, end), o None si sólo contiene espacio en blanco"""
+    piece = text[start:end]
+    stripped = piece.strip()
+    if not stripped:
+        return None
+    if strip:
+        start += len(piece) - len(piece.lstrip())
+        return ClauseSpan(stripped, start, start + len(stripped))
+    return ClauseSpan(piece, start, end)
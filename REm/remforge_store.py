@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+REMForge: Almacén de Corpus REM
+===============================
+
+Almacén en disco para corpus grandes de REMs con acceso aleatorio. Cada
+almacén es un directorio con cuatro ficheros:
+
+    records.bin     Registros estructurales (JSON compacto comprimido con zlib)
+    index.jsonl     Índice de offsets y columnas de filtrado, una línea por REM
+    embeddings.bin  Matriz contigua de embeddings de anclajes léxicos
+    meta.json       Dimensión y tipo de la matriz de embeddings
+
+Los embeddings de los anclajes se extraen del registro y se sustituyen por su
+fila en la matriz, que se lee como `numpy.memmap`. `get(rem_id)`, el acceso
+por posición o slice y `filter()` sólo leen el índice y los registros
+pedidos, nunca el corpus completo.
+"""
+
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Union, Callable
+
+import numpy as np
+
+from remforge_binary import _to_json_compatible
+
+EMBEDDING_REF_KEY = "$row"
+
+# Columnas del índice extraídas de cada REM (nombre -> ruta en el documento)
+INDEX_COLUMNS = {
+    "modality_origin": ("header", "modality_origin"),
+    "creation_timestamp": ("header", "creation_timestamp"),
+    "intentional_mode": ("noetic_layer", "intentional_mode"),
+    "temporal_phase": ("noetic_layer", "temporal_phase"),
+    "directedness": ("noetic_layer", "directedness"),
+    "qualia_type": ("phenomenal_core", "qualia_signature", "qualia_type"),
+    "contamination_strength": ("semantic_contamination", "contamination_strength"),
+}
+
+
+def _lookup(document: Dict[str, Any], path) -> Any:
+    """Valor en una ruta anidada del REM (None si no existe)"""
+    for key in path:
+        if not isinstance(document, dict) or key not in document:
+            return None
+        document = document[key]
+    return document
+
+
+class REMStore:
+    """
+    Almacén columnar de REMs con índice de offsets y embeddings en memmap.
+
+    Uso:
+        with REMStore("corpus_rems") as store:
+            store.extend(rems)
+            rem = store.get("TXT-5b56635fa4f8")
+            visuales = list(store.filter(qualia_type="visual"))
+    """
+
+    RECORDS_FILE = "records.bin"
+    INDEX_FILE = "index.jsonl"
+    EMBEDDINGS_FILE = "embeddings.bin"
+    META_FILE = "meta.json"
+
+    def __init__(self, path: Union[str, Path], embedding_dtype: str = "float32", readonly: bool = False):
+        """
+        Args:
+            path: Directorio del almacén (se crea si no existe)
+            embedding_dtype: Tipo de la matriz de embeddings ("float16", "float32", "float64");
+                             sólo se aplica al crear el almacén
+            readonly: Abre el almacén sin permitir escrituras
+        """
+        self.path = Path(path)
+        self.readonly = readonly
+        if not readonly:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+        meta_path = self.path / self.META_FILE
+        if meta_path.exists():
+            with open(meta_path, encoding="utf-8") as f:
+                self.meta = json.load(f)
+        else:
+            if readonly:
+                raise FileNotFoundError(f"No existe un almacén REM en {self.path}")
+            if embedding_dtype not in ("float16", "float32", "float64"):
+                raise ValueError(f"embedding_dtype no soportado: {embedding_dtype}")
+            self.meta = {"embedding_dim": None, "embedding_dtype": embedding_dtype}
+            self._write_meta()
+
+        self.embedding_dtype = np.dtype(self.meta["embedding_dtype"])
+        self._entries: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._embedding_rows = 0
+        self._memmap: Optional[np.memmap] = None
+        self._load_index()
+
+        self._records = open(self.path / self.RECORDS_FILE, "rb" if readonly else "ab+")
+        self._index = None if readonly else open(self.path / self.INDEX_FILE, "a", encoding="utf-8")
+        self._embeddings = None if readonly else open(self.path / self.EMBEDDINGS_FILE, "ab")
+
+    def _load_index(self):
+        """Carga el índice (sólo offsets y columnas, no los registros) y repara una escritura interrumpida"""
+        index_path = self.path / self.INDEX_FILE
+        if not index_path.exists():
+            return
+
+        records_size = self._file_size(self.RECORDS_FILE)
+        row_bytes = (self.meta["embedding_dim"] or 0) * self.embedding_dtype.itemsize
+        embedding_rows = self._file_size(self.EMBEDDINGS_FILE) // row_bytes if row_bytes else 0
+
+        complete_bytes = 0
+        with open(index_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("línea sin terminar")
+                    entry = json.loads(line)
+                except ValueError:
+                    # Última línea incompleta tras una escritura interrumpida
+                    break
+                rows_end = entry["embedding_start"] + entry["embedding_count"]
+                missing_data = entry["offset"] + entry["length"] > records_size
+                missing_rows = entry["embedding_count"] and rows_end > embedding_rows
+                if missing_data or missing_rows:
+                    # Entrada escrita antes que los datos a los que apunta: se descarta con las siguientes
+                    break
+                complete_bytes += len(line)
+                self._positions[entry["rem_id"]] = len(self._entries)
+                self._entries.append(entry)
+                self._embedding_rows = max(self._embedding_rows, rows_end)
+
+        if not self.readonly:
+            self._truncate_to_index(complete_bytes)
+
+    def _truncate_to_index(self, index_bytes: int):
+        """
+        Recorta los ficheros a lo que cubre el índice completo
+
+        Un `append` interrumpido puede dejar una línea parcial en el índice, un
+        registro huérfano y filas de embeddings sin entrada; si se conservaran,
+        las escrituras siguientes quedarían tras ellos (y desalineadas respecto a
+        `embedding_start`), de modo que se descartan al abrir el almacén.
+        """
+        records_bytes = 0
+        if self._entries:
+            last = self._entries[-1]
+            records_bytes = last["offset"] + last["length"]
+        embedding_bytes = self._embedding_rows * (self.meta["embedding_dim"] or 0) * self.embedding_dtype.itemsize
+
+        for name, size in ((self.INDEX_FILE, index_bytes), (self.RECORDS_FILE, records_bytes),
+                           (self.EMBEDDINGS_FILE, embedding_bytes)):
+            if self._file_size(name) > size:
+                os.truncate(self.path / name, size)
+
+    def _file_size(self, name: str) -> int:
+        """Tamaño en bytes de un fichero del almacén (0 si no existe)"""
+        file_path = self.path / name
+        return file_path.stat().st_size if file_path.exists() else 0
+
+    # ------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------
+
+    def append(self, rem: Dict[str, Any]) -> int:
+        """Añade un REM al almacén y devuelve su posición"""
+        if self.readonly:
+            raise PermissionError("El almacén está abierto en modo sólo lectura")
+
+        document = _to_json_compatible(rem)
+        rem_id = document["header"]["rem_id"]
+        if rem_id in self._positions:
+            raise ValueError(f"El REM {rem_id} ya existe en el almacén")
+
+        embeddings = []
+        for anchor in _lookup(document, ("semantic_contamination", "lexical_anchors")) or []:
+            embedding = anchor.get("embedding")
+            if not isinstance(embedding, list):
+                continue
+            if self.meta["embedding_dim"] is None:
+                self.meta["embedding_dim"] = len(embedding)
+                self._write_meta()
+            if len(embedding) != self.meta["embedding_dim"]:
+                raise ValueError(f"Dimensión de embedding {len(embedding)} distinta de la del almacén "
+                                 f"({self.meta['embedding_dim']})")
+            anchor["embedding"] = {EMBEDDING_REF_KEY: self._embedding_rows + len(embeddings)}
+            embeddings.append(embedding)
+
+        payload = zlib.compress(json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+        self._records.seek(0, os.SEEK_END)
+        offset = self._records.tell()
+        self._records.write(payload)
+        if embeddings:
+            self._embeddings.write(np.asarray(embeddings, dtype=self.embedding_dtype).tobytes())
+        # Los datos llegan al sistema antes que la entrada del índice que los referencia
+        self._records.flush()
+        self._embeddings.flush()
+
+        entry = {
+            "rem_id": rem_id,
+            "offset": offset,
+            "length": len(payload),
+            "embedding_start": self._embedding_rows,
+            "embedding_count": len(embeddings),
+        }
+        for column, path in INDEX_COLUMNS.items():
+            entry[column] = _lookup(document, path)
+
+        self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._positions[rem_id] = len(self._entries)
+        self._entries.append(entry)
+        self._embedding_rows += len(embeddings)
+        self._memmap = None
+        return len(self._entries) - 1
+
+    def extend(self, rems: Iterable[Dict[str, Any]]) -> int:
+        """Añade varios REMs (acepta generadores) y devuelve cuántos se añadieron"""
+        count = 0
+        for rem in rems:
+            self.append(rem)
+            count += 1
+        self.flush()
+        return count
+
+    def _write_meta(self):
+        with open(self.path / self.META_FILE, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+
+    def flush(self):
+        """Vuelca a disco los ficheros abiertos en escritura"""
+        for handle in (self._records, self._index, self._embeddings):
+            if handle is not None and not handle.closed:
+                handle.flush()
+
+    # ------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Matriz (filas, dim) de embeddings de anclajes, mapeada en memoria"""
+        if self._memmap is None or self._memmap.shape[0] != self._embedding_rows:
+            dim = self.meta["embedding_dim"]
+            if not self._embedding_rows or dim is None:
+                return np.empty((0, dim or 0), dtype=self.embedding_dtype)
+            self.flush()
+            self._memmap = np.memmap(self.path / self.EMBEDDINGS_FILE, dtype=self.embedding_dtype, mode="r",
+                                     shape=(self._embedding_rows, dim))
+        return self._memmap
+
+    def anchor_embeddings(self, rem_id: str) -> np.ndarray:
+        """Embeddings de los anclajes de un REM como vista de la matriz (sin copiar)"""
+        entry = self._entries[self._positions[rem_id]]
+        start = entry["embedding_start"]
+        return self.embeddings[start:start + entry["embedding_count"]]
+
+    def _read(self, position: int, with_embeddings: bool = True) -> Dict[str, Any]:
+        """Lee y reconstruye el REM de una posición"""
+        entry = self._entries[position]
+        self.flush()
+        self._records.seek(entry["offset"])
+        document = json.loads(zlib.decompress(self._records.read(entry["length"])).decode("utf-8"))
+
+        matrix = self.embeddings if with_embeddings else None
+        for anchor in _lookup(document, ("semantic_contamination", "lexical_anchors")) or []:
+            reference = anchor.get("embedding")
+            if isinstance(reference, dict) and EMBEDDING_REF_KEY in reference:
+                if with_embeddings:
+                    anchor["embedding"] = matrix[reference[EMBEDDING_REF_KEY]].astype(np.float64).tolist()
+                else:
+                    anchor["embedding"] = None
+        return document
+
+    def get(self, rem_id: str, with_embeddings: bool = True) -> Dict[str, Any]:
+        """Devuelve el REM con el identificador dado"""
+        if rem_id not in self._positions:
+            raise KeyError(rem_id)
+        return self._read(self._positions[rem_id], with_embeddings)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(key, slice):
+            return [self._read(position) for position in range(*key.indices(len(self._entries)))]
+        if key < 0:
+            key += len(self._entries)
+        if not 0 <= key < len(self._entries):
+            raise IndexError("Posición fuera del almacén")
+        return self._read(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, rem_id: str) -> bool:
+        return rem_id in self._positions
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(len(self._entries)):
+            yield self._read(position)
+
+    def rem_ids(self) -> List[str]:
+        """Identificadores de los REMs en orden de inserción"""
+        return [entry["rem_id"] for entry in self._entries]
+
+    def index(self) -> List[Dict[str, Any]]:
+        """Copia de las entradas del índice (offsets y columnas de filtrado)"""
+        return [dict(entry) for entry in self._entries]
+
+    def filter(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, with_embeddings: bool = True,
+               **criteria) -> Iterator[Dict[str, Any]]:
+        """
+        Produce los REMs cuyas columnas del índice cumplen los criterios
+
+        Args:
+            predicate: Función opcional sobre la entrada del índice
+            with_embeddings: Reconstruir los embeddings de los anclajes
+            **criteria: Columna=valor, o columna=función para condiciones arbitrarias
+
+        Ejemplo:
+            store.filter(qualia_type="visual", contamination_strength=lambda c: c < 0.3)
+        """
+        unknown = set(criteria) - set(INDEX_COLUMNS) - {"rem_id"}
+        if unknown:
+            raise ValueError(f"Columnas de filtrado desconocidas: {sorted(unknown)}")
+
+        for position, entry in enumerate(self._entries):
+            matches = all(
+                condition(entry.get(column)) if callable(condition) else entry.get(column) == condition
+                for column, condition in criteria.items()
+            )
+            if matches and (predicate is None or predicate(entry)):
+                yield self._read(position, with_embeddings)
+
+    # ------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------
+
+    def close(self):
+        """Cierra los ficheros del almacén"""
+        self.flush()
+        self._memmap = None
+        for handle in (self._records, self._index, self._embeddings):
+            if handle is not None:
+                handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+REMForge: Exportación e Importación en Streaming (JSONL)
+========================================================
+
+Escribe y lee secuencias de REMs como JSON Lines (un REM por línea) con
+memoria acotada: los REMs se producen, serializan y liberan de uno en uno.
+
+Compresión opcional:
+    .jsonl       sin comprimir
+    .jsonl.gz    gzip (biblioteca estándar)
+    .jsonl.zst   zstd (requiere `pip install zstandard`)
+
+Reanudación tras un corte:
+
+    done = count_jsonl("rems.jsonl.gz")
+    write_jsonl(forge.iter_forge(texts, start=done), "rems.jsonl.gz", resume=True)
+
+`resume=True` conserva los registros completos ya escritos, descarta un
+registro final truncado y añade los nuevos a continuación.
+"""
+
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Union, IO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+# Bloque de lectura al reparar un fichero sin comprimir antes de reanudar
+REPAIR_CHUNK_SIZE = 1 << 20
+
+
+def _resolve_compression(path: Path, compression: Optional[str]) -> Optional[str]:
+    """Compresión explícita, o inferida de la extensión con "infer" """
+    if compression == "infer":
+        return COMPRESSION_SUFFIXES.get(path.suffix)
+    if compression not in (None, "gzip", "zstd"):
+        raise ValueError(f"Compresión no soportada: {compression}")
+    return compression
+
+
+def _open_text(path: Path, mode: str, compression: Optional[str]) -> IO[str]:
+    """Abre el fichero en modo texto ("r", "w" o "a") con la compresión indicada"""
+    if compression is None:
+        return open(path, mode, encoding="utf-8", newline="\n")
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="\n")
+
+    if zstandard is None:
+        raise ImportError("La compresión zstd requiere el paquete `zstandard` (pip install zstandard)")
+    raw = open(path, mode + "b")
+    if mode == "r":
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    else:
+        # Cada sesión de escritura en modo "a" añade un frame zstd independiente
+        stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+
+
+def _truncation_errors():
+    """Excepciones que indican un flujo comprimido cortado a mitad"""
+    errors = (EOFError,)
+    if zstandard is not None:
+        errors += (zstandard.ZstdError,)
+    return errors
+
+
+def read_jsonl(path: Union[str, Path], compression: Optional[str] = "infer") -> Iterator[Dict[str, Any]]:
+    """
+    Lee los REMs de un fichero JSONL uno a uno
+
+    Un registro final incompleto (escritura interrumpida) se ignora; una línea
+    completa que no es JSON válido lanza ValueError.
+    """
+    path = Path(path)
+    with _open_text(path, "r", _resolve_compression(path, compression)) as f:
+        line_number = 0
+        try:
+            for line in f:
+                line_number += 1
+                if not line.endswith("\n"):
+                    return
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Línea {line_number} corrupta en {path}: {e}") from e
+        except _truncation_errors():
+            return
+
+
+def count_jsonl(path: Union[str, Path], compression: Optional[str] = "infer") -> int:
+    """Número de REMs completos en un fichero JSONL (0 si no existe)"""
+    path = Path(path)
+    if not path.exists():
+        return 0
+    return sum(1 for _ in read_jsonl(path, compression))
+
+
+def _last_line_end(f: IO[bytes]) -> int:
+    """Offset tras el último salto de línea del fichero (0 si no hay), leyendo hacia atrás por bloques"""
+    end = f.seek(0, os.SEEK_END)
+    while end > 0:
+        start = max(0, end - REPAIR_CHUNK_SIZE)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline != -1:
+            return start + newline + 1
+        end = start
+    return 0
+
+
+def _repair_for_resume(path: Path, compression: Optional[str]) -> int:
+    """Descarta un registro final truncado y devuelve los registros conservados"""
+    if compression is None:
+        with open(path, "rb+") as f:
+            keep = _last_line_end(f)
+            f.seek(0, os.SEEK_END)
+            if keep != f.tell():
+                f.truncate(keep)
+            f.seek(0)
+            count = 0
+            remaining = keep
+            while remaining:
+                chunk = f.read(min(REPAIR_CHUNK_SIZE, remaining))
+                count += chunk.count(b"\n")
+                remaining -= len(chunk)
+        return count
+
+    # En un flujo comprimido no se puede truncar in situ: se reescribe en streaming el prefijo válido
+    temporary = path.with_name(path.name + ".resume")
+    count = write_jsonl(read_jsonl(path, compression), temporary, compression=compression)
+    os.replace(temporary, path)
+    return count
+
+
+def write_jsonl(rems: Iterable[Dict[str, Any]], path: Union[str, Path], compression: Optional[str] = "infer",
+                resume: bool = False, flush_every: int = 64) -> int:
+    """
+    Escribe REMs en streaming, un REM por línea
+
+    Args:
+        rems: REMs a escribir (lista o generador, se consume de uno en uno)
+        path: Fichero de destino (.jsonl, .jsonl.gz, .jsonl.zst)
+        compression: "infer" (por extensión), None, "gzip" o "zstd"
+        resume: Añadir tras los registros completos existentes en lugar de sobrescribir
+        flush_every: Registros entre volcados a disco
+
+    Returns:
+        Número total de REMs completos en el fichero
+    """
+    path = Path(path)
+    compression = _resolve_compression(path, compression)
+
+    count = 0
+    if resume and path.exists():
+        count = _repair_for_resume(path, compression)
+
+    with _open_text(path, "a" if resume else "w", compression) as f:
+        for written, rem in enumerate(rems, start=1):
+            f.write(json.dumps(rem, default=str, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+            if written % flush_every == 0:
+                f.flush()
+
+    return count
@@ -7,18 +7,621 @@ Sistema que convierte datos digitales en Registros Experienciales Multimodales
 con formato optimizado para análisis fenomenológico computacional.
 
 Formato de salida: PhenomenalREM-Ultra JSON Schema v4.0.0
+
+torch se importa de forma diferida: el modo heurístico de texto
+(`forge_text_heuristic`) arranca sin cargarlo.
 """
 
-import torch
+from __future__ import annotations
+
 import numpy as np
-from typing import Dict, Any, List, Tuple, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Tuple, Optional, Union, Iterable, Iterator, FrozenSet, Set
+from dataclasses import dataclass, asdict, field
+import hashlib
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 import uuid
 import re
-from collections import Counter
+import warnings
+import queue
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from remforge_binary import dump_rems
+from remforge_cache import ForgeResultCache, content_key
+from remforge_embeddings import AnchorEmbeddingTable, heuristic_token_embedding
+from remforge_models import get_model_registry, lazy_import
+from remforge_segment import EXPERIENTIAL_DELIMITERS, iter_clause_spans
+from remforge_store import REMStore
+from remforge_stream import write_jsonl
+
+torch = lazy_import("torch")
+
+# ============================================
+# ÍNDICE LÉXICO PRECOMPILADO
+# ============================================
+
+# Modalidades de qualia en el orden del perfil de intensidad
+QUALIA_BY_MODALITY: Dict[str, Tuple[str, ...]] = {
+    "visual": ("rojo", "azul", "verde", "brillante", "oscuro", "claro", "luminoso", "opaco"),
+    "auditory": ("alto", "bajo", "fuerte", "suave", "sordo", "claro", "mudo", "armonioso"),
+    "haptic": ("áspero", "liso", "suave", "duro", "blando", "cálido", "frío", "húmedo"),
+    "olfactory": ("aromatico", "perfumado", "acido", "dulce", "amargo", "penetrante"),
+    "gustatory": ("dulce", "amargo", "ácido", "salado", "umami", "picante", "sabroso"),
+    "affective": ("feliz", "triste", "enojado", "contento", "ansioso", "tranquilo", "emocionado")
+}
+
+# Verbos y marcadores por modo intencional
+VERBS_PER_MODE: Dict[str, Tuple[str, ...]] = {
+    "perception": ("veo", "oigo", "siento", "percibo", "noto", "observo"),
+    "memory": ("recordé", "recuerdo", "era", "fue", "había", "solía"),
+    "imagination": ("imagino", "supongo", "quizás", "tal vez", "podría", "sería"),
+    "reflection": ("pienso", "creo", "entiendo", "analizo", "considero", "reflexiono"),
+    "language": ("digo", "cuento", "explico", "describo", "narro"),
+    "action": ("hago", "actúo", "intento", "busco", "quiero", "necesito")
+}
+
+# Objeto del acto intencional, en orden de prioridad
+DIRECTEDNESS_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "qualia_visual": ("color", "rojo", "azul"),
+    "qualia_auditory": ("sonido", "oigo", "ruido"),
+    "qualia_haptic": ("siento", "textura", "liso"),
+    "qualia_gustatory": ("sabor", "dulce", "amargo"),
+    "qualia_olfactory": ("olor", "huele")
+}
+
+# Marcadores temporales, en orden de prioridad de fase
+TEMPORAL_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "present": ("ahora", "veo", "siento"),
+    "past": ("recordé", "era", "fue", "había"),
+    "future": ("imagino", "sería", "podría"),
+    "atemporal": ("siempre", "nunca", "eterno"),
+    "habitual": ("normalmente", "generalmente", "suelo")
+}
+
+# Tipo de horizonte fenomenológico, en orden de prioridad
+HORIZON_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "inner": ("dentro", "adentro", "interior"),
+    "outer": ("afuera", "exterior", "mundo"),
+    "bodily": ("cuerpo", "manos", "piel", "dedos"),
+    "spatial": ("aquí", "ahí", "cerca", "lejos"),
+    "temporal": ("ahora", "antes", "después", "tiempo")
+}
+
+# Gist temático y espacial, en orden de prioridad
+THEMATIC_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "Experiencia visual cromática": ("color",),
+    "Experiencia auditiva": ("sonido", "oigo"),
+    "Experiencia mnésica": ("recuerdo", "memoria")
+}
+
+SPATIAL_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "Espacio peripersonal": ("aquí", "cerca"),
+    "Espacio extrapersonal": ("allá", "lejos"),
+    "Espacio interno": ("dentro",)
+}
+
+# Micro-intencionalidades por cláusula, en orden de prioridad
+MICRO_INTENT_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "visual_inspection": ("veo", "observo"),
+    "haptic_exploration": ("siento", "percibo"),
+    "auditory_attention": ("escucho", "oigo"),
+    "reflective_contemplation": ("pienso", "reflexiono")
+}
+
+LEXICON_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    # Palabras que denotan presencia inmediata
+    "experiential": (
+        "veo", "oigo", "siento", "huelo", "pruebo", "percibo", "noto", "observo",
+        "está", "hay", "me", "mi", "aquí", "ahora", "ante", "frente", "bajo", "sobre", "dentro"
+    ),
+    # Palabras sensoriales
+    "sensorial": (
+        "rojo", "azul", "verde", "brillante", "oscuro", "claro", "luminoso", "opaco",
+        "suave", "áspero", "liso", "rugoso", "duro", "blando", "cálido", "frío", "húmedo", "seco",
+        "alto", "bajo", "fuerte", "sordo", "mudo", "armonioso", "discordante",
+        "dulce", "amargo", "ácido", "salado", "umami", "picante", "sabroso", "insípido",
+        "aromatico", "perfumado", "acido", "penetrante", "sutil", "intenso"
+    ),
+    # Qualia puros (baja interferencia)
+    "pure_qualia": (
+        "rojo", "azul", "verde", "amarillo", "blanco", "negro", "gris",
+        "brillante", "oscuro", "claro", "opaco", "transparente", "sólido",
+        "suave", "áspero", "liso", "rugoso", "duro", "blando", "cálido", "frío",
+        "alto", "bajo", "fuerte", "sordo", "mudo"
+    ),
+    # Contaminación semántica (alta interferencia)
+    "semantic_contamination": (
+        "recuerda", "pienso", "creo", "entiendo", "siento que", "me parece",
+        "probablemente", "quizás", "tal vez", "supongo", "debe ser"
+    ),
+    # Afecto semántico vs fenomenológico
+    "affect:semantic": (
+        "bien", "mal", "bueno", "malo", "excelente", "terrible", "fantástico", "horrible",
+        "me gusta", "me encanta", "odio", "detesto", "prefiero", "disfruto"
+    ),
+    "affect:phenomenal": (
+        "emocionado", "impresionado", "conmovido", "estremecido", "maravillado",
+        "sorprendido", "asombrado", "fascinado", "hipnotizado", "transportado"
+    ),
+    # Autorreferencia del sujeto
+    "self_reference": ("yo", "me"),
+    # Qualia momentáneos
+    "momentary_qualia": (
+        "brillante", "súbito", "intenso", "vivo", "inmediato",
+        "puro", "directo", "instantáneo", "claro", "preciso"
+    ),
+    # Retención (pasado) y protensión (futuro) por cláusula
+    "retention": ("recordé", "era"),
+    "protention": ("imagino", "sería"),
+    # Marcas de transición memoria -> percepción
+    "phase:past": ("era", "fue", "había"),
+    "phase:present": ("veo", "siento", "está"),
+    **{f"horizon:{horizon}": terms for horizon, terms in HORIZON_MARKERS.items()},
+    **{f"theme:{theme}": terms for theme, terms in THEMATIC_MARKERS.items()},
+    **{f"spatial:{gist}": terms for gist, terms in SPATIAL_MARKERS.items()},
+    **{f"micro_intent:{intent}": terms for intent, terms in MICRO_INTENT_MARKERS.items()},
+    **{f"qualia:{modality}": terms for modality, terms in QUALIA_BY_MODALITY.items()},
+    **{f"mode:{mode}": terms for mode, terms in VERBS_PER_MODE.items()},
+    **{f"directedness:{target}": terms for target, terms in DIRECTEDNESS_MARKERS.items()},
+    **{f"temporal:{phase}": terms for phase, terms in TEMPORAL_MARKERS.items()}
+}
+
+
+def _build_lexicon_index(categories: Dict[str, Tuple[str, ...]]) -> Dict[str, FrozenSet[str]]:
+    """Invierte las categorías léxicas: término -> todas sus categorías"""
+    index: Dict[str, Set[str]] = {}
+    for category, terms in categories.items():
+        for term in terms:
+            index.setdefault(term, set()).add(category)
+    return {term: frozenset(term_categories) for term, term_categories in index.items()}
+
+
+LEXICON_INDEX: Dict[str, FrozenSet[str]] = _build_lexicon_index(LEXICON_CATEGORIES)
+LEXICON_MAX_NGRAM = max(len(term.split()) for term in LEXICON_INDEX)
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+_FIRST_PERSON_PATTERN = re.compile(r'\b(yo|me|mi|mis|mí)\b')
+_THIRD_PERSON_PATTERN = re.compile(r'\b(él|ella|su|sus|ellos|ellas)\b')
+
+
+def tokenize_lexicon(text: str) -> List[str]:
+    """Tokeniza texto en minúsculas para consultas al índice léxico"""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def lexicon_hits(tokens: List[str]) -> Dict[str, Set[str]]:
+    """
+    Consulta el índice léxico en una sola pasada sobre los tokens
+
+    Incluye n-gramas hasta LEXICON_MAX_NGRAM para términos multipalabra
+    ("tal vez", "me gusta"). Devuelve categoría -> términos distintos encontrados.
+    """
+    hits: Dict[str, Set[str]] = {}
+    for i in range(len(tokens)):
+        for n in range(1, LEXICON_MAX_NGRAM + 1):
+            if i + n > len(tokens):
+                break
+            term = tokens[i] if n == 1 else " ".join(tokens[i:i + n])
+            for category in LEXICON_INDEX.get(term, ()):
+                hits.setdefault(category, set()).add(term)
+    return hits
+
+
+@dataclass
+class TextAnalysisContext:
+    """
+    Análisis léxico de un documento, calculado una sola vez por forja y
+    compartido por todos los analizadores de texto.
+    """
+    raw: str
+    normalized: str
+    lower: str
+    words: List[str]
+    tokens: List[str]
+    word_set: Set[str]
+    lexicon: Dict[str, Set[str]]
+    first_person_count: int
+    third_person_count: int
+    clauses: List[Dict] = field(default_factory=list)
+    clause_lexicon: List[Dict[str, Set[str]]] = field(default_factory=list)
+    temporal_markers: List[str] = field(default_factory=list)
+
+
+# ============================================
+# PRECISIÓN DE INFERENCIA
+# ============================================
+
+SUPPORTED_PRECISIONS = ("float32", "float16", "bfloat16", "int8")
+
+# Nombre del dtype de torch de los pesos y de las entradas en coma flotante por precisión
+# (int8 cuantiza dinámicamente las capas lineales; activaciones en float32)
+PRECISION_DTYPES = {
+    "float32": "float32",
+    "float16": "float16",
+    "bfloat16": "bfloat16",
+    "int8": "float32"
+}
+
+
+# ============================================
+# ESTADÍSTICAS VISUALES VECTORIZADAS
+# ============================================
+
+# Parámetros por defecto del análisis visual (sobrescribibles con visual_config)
+DEFAULT_VISUAL_CONFIG = {
+    "patch_size": 32,             # Lado máximo de los parches de micro-variación
+    "max_micro_variations": 10,   # Parches reportados (en orden de filas)
+    "attention_grid": 4,          # Celdas por lado del mapa de atención
+    "map_grid": 8,                # Divisiones por lado de las coordenadas del mapa de experiencia
+    "histogram_bins": 2048,       # Resolución del estimador de percentiles (error <= rango / bins)
+    "reduction_chunk_pixels": 1 << 22,  # Píxeles por bloque en las reducciones de imagen completa
+    "feature_cache_size": 256,    # Imágenes con features CLIP en caché LRU (0 la desactiva)
+    "decode_window_batches": 4    # Lotes por ventana de decodificación (memoria acotada en lotes grandes)
+}
+
+
+def image_cache_key(image_tensor: torch.Tensor) -> str:
+    """Hash del contenido (y la forma) de una imagen, para la caché de features"""
+    data = image_tensor.detach().float().contiguous().cpu().numpy()
+    digest = hashlib.blake2b(data.tobytes(), digest_size=16)
+    digest.update(str(tuple(data.shape)).encode())
+    return digest.hexdigest()
+
+
+def rgb_to_hsv(image_tensor: torch.Tensor) -> torch.Tensor:
+    """Convierte un tensor RGB [..., 3, H, W] en [0, 1] a HSV (matiz también en [0, 1])"""
+    r, g, b = image_tensor.unbind(dim=-3)
+    maxc = image_tensor.amax(dim=-3)
+    minc = image_tensor.amin(dim=-3)
+    delta = maxc - minc
+    
+    saturation = delta / torch.where(maxc > 0, maxc, torch.ones_like(maxc))
+    safe_delta = torch.where(delta > 0, delta, torch.ones_like(delta))
+    rc, gc, bc = (maxc - r) / safe_delta, (maxc - g) / safe_delta, (maxc - b) / safe_delta
+    
+    hue = torch.where(maxc == r, bc - gc, torch.where(maxc == g, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = torch.where(delta > 0, (hue / 6.0) % 1.0, torch.zeros_like(hue))
+    return torch.stack([hue, saturation, maxc], dim=-3)
+
+
+def _row_chunks(image_tensor: torch.Tensor, max_pixels: int, rows: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """Bloques de filas [inicio, fin) con como mucho max_pixels píxeles por bloque (en todo el lote)"""
+    rows = image_tensor.shape[-2] if rows is None else rows
+    pixels_per_row = max(1, image_tensor.shape[0] * image_tensor.shape[-1])
+    step = max(1, max_pixels // pixels_per_row)
+    for start in range(0, rows, step):
+        yield start, min(rows, start + step)
+
+
+def float64_reduction_input(tensor: torch.Tensor) -> torch.Tensor:
+    """Tensor en un dispositivo con float64 para acumular reducciones (MPS no lo soporta: se pasa a CPU)"""
+    return tensor.cpu() if tensor.device.type == "mps" else tensor
+
+
+def histogram_quantiles(values: torch.Tensor, quantiles: List[float], bins: int = 2048,
+                        chunk_elements: int = 1 << 22) -> torch.Tensor:
+    """
+    Percentiles aproximados por fila de [N, M] mediante histograma
+    
+    A diferencia de torch.quantile no ordena los valores ni tiene límite de
+    tamaño: acumula un histograma de `bins` cubetas entre el mínimo y el
+    máximo de cada fila, procesando `chunk_elements` columnas cada vez.
+    El error está acotado por (máximo - mínimo) / bins.
+    
+    Returns:
+        Tensor [N, len(quantiles)]
+    """
+    device = values.device
+    values = float64_reduction_input(values)
+    rows, count = values.shape
+    low = values.amin(dim=1, keepdim=True).double()
+    span = (values.amax(dim=1, keepdim=True).double() - low).clamp(min=1e-12)
+    
+    histogram = torch.zeros((rows, bins), dtype=torch.int64, device=values.device)
+    for start in range(0, count, chunk_elements):
+        block = values[:, start:start + chunk_elements].double()
+        indices = ((block - low) / span * bins).long().clamp_(0, bins - 1)
+        histogram.scatter_add_(1, indices, torch.ones_like(indices))
+    cumulative = histogram.cumsum(dim=1)
+    
+    # Rango (base 0) de cada percentil, con la misma convención que torch.quantile
+    ranks = torch.tensor(quantiles, dtype=torch.float64, device=values.device) * (count - 1)
+    ranks = ranks.expand(rows, -1).contiguous()
+    bucket = torch.searchsorted(cumulative.double(), ranks, right=True).clamp(max=bins - 1)
+    
+    before = torch.where(bucket > 0, cumulative.gather(1, (bucket - 1).clamp(min=0)), torch.zeros_like(bucket))
+    inside = histogram.gather(1, bucket).clamp(min=1)
+    fraction = ((ranks - before + 0.5) / inside).clamp(0.0, 1.0)
+    return (low + (bucket + fraction) / bins * span).to(device=device, dtype=values.dtype)
+
+
+def hsv_statistics(image_tensor: torch.Tensor, max_pixels: int = 1 << 22) -> Dict[str, torch.Tensor]:
+    """
+    Estadísticas HSV por imagen de [N, 3, H, W] sin materializar la imagen HSV completa
+    
+    Convierte y acumula por bloques de filas. Devuelve medias y desviaciones
+    (insesgadas) por canal [N, 3] y las proporciones de píxeles de matiz
+    cálido y frío [N], en float32 sobre el dispositivo de la imagen.
+    """
+    device = image_tensor.device
+    image_tensor = float64_reduction_input(image_tensor)
+    batch = image_tensor.shape[0]
+    pixels = image_tensor.shape[-2] * image_tensor.shape[-1]
+    totals = torch.zeros((batch, 3), dtype=torch.float64, device=image_tensor.device)
+    squares = torch.zeros_like(totals)
+    warm = torch.zeros(batch, dtype=torch.float64, device=image_tensor.device)
+    cold = torch.zeros_like(warm)
+    
+    for start, end in _row_chunks(image_tensor, max_pixels):
+        hsv = rgb_to_hsv(image_tensor[..., start:end, :]).double()
+        totals += hsv.sum(dim=[2, 3])
+        squares += (hsv * hsv).sum(dim=[2, 3])
+        
+        # Colores cálidos → positivo, fríos → negativo
+        hue = hsv[:, 0]
+        warm += (((hue > 0.0) & (hue < 0.17)) | ((hue > 0.94) & (hue < 1.0))).sum(dim=[1, 2])
+        cold += ((hue > 0.5) & (hue < 0.67)).sum(dim=[1, 2])
+    
+    mean = totals / pixels
+    variance = ((squares - totals * mean) / max(pixels - 1, 1)).clamp(min=0)
+    statistics = {
+        "mean": mean,
+        "std": variance.sqrt(),
+        "warm_ratio": warm / pixels,
+        "cold_ratio": cold / pixels
+    }
+    return {name: value.to(device=device, dtype=torch.float32) for name, value in statistics.items()}
+
+
+def integral_images(image_tensor: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, int]:
+    """
+    Imágenes integrales de la suma y la suma de cuadrados de [B, C, H, W]
+    
+    Acumula sobre lote y canales, en float64 para que las sumas por región
+    no pierdan precisión. Devuelve (integral, integral_cuadrados, B*C), con
+    un borde de ceros de modo que integral[y, x] = suma de [:y, :x].
+    """
+    values = float64_reduction_input(image_tensor).double()
+    channels = values.shape[0] * values.shape[1]
+    height, width = values.shape[-2:]
+    
+    integral = values.new_zeros((height + 1, width + 1))
+    integral_sq = values.new_zeros((height + 1, width + 1))
+    integral[1:, 1:] = values.sum(dim=(0, 1)).cumsum(0).cumsum(1)
+    integral_sq[1:, 1:] = (values * values).sum(dim=(0, 1)).cumsum(0).cumsum(1)
+    return integral, integral_sq, channels
+
+
+def region_statistics(image_tensor: torch.Tensor, y_edges: torch.Tensor,
+                      x_edges: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Media y desviación típica (insesgada) de cada celda de una rejilla
+    
+    Las celdas son [y_edges[i], y_edges[i+1]) x [x_edges[j], x_edges[j+1]),
+    sobre todos los canales del tensor. Todas las celdas se resuelven con
+    cuatro lecturas de las imágenes integrales, en una sola operación.
+    
+    Returns:
+        (medias, desviaciones), tensores [filas, columnas]
+    """
+    integral, integral_sq, channels = integral_images(image_tensor)
+    y_edges = y_edges.to(integral.device)
+    x_edges = x_edges.to(integral.device)
+    y0, y1 = y_edges[:-1, None], y_edges[1:, None]
+    x0, x1 = x_edges[None, :-1], x_edges[None, 1:]
+    
+    def box_sum(table):
+        return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+    
+    count = ((y1 - y0) * (x1 - x0) * channels).double()
+    total = box_sum(integral)
+    total_sq = box_sum(integral_sq)
+    
+    mean = total / count
+    variance = ((total_sq - total * mean) / (count - 1)).clamp(min=0)
+    return mean, variance.sqrt()
+
+
+# ============================================
+# AUDIO POR VENTANAS
+# ============================================
+
+# Parámetros por defecto del análisis de audio (sobrescribibles con audio_config)
+DEFAULT_AUDIO_CONFIG = {
+    "sample_rate": 16000,         # Frecuencia de entrada de HuBERT (se remuestrea una única vez)
+    "window_seconds": 10.0,       # Duración de cada ventana de inferencia
+    "overlap_seconds": 1.0,       # Solape entre ventanas consecutivas
+    "window_batch_size": 8,       # Ventanas por pasada del modelo
+    "temporal_segments": 8,       # Segmentos de los invariantes temporales
+    "fft_size": 2048              # Tamaño de trama del análisis espectral
+}
+
+
+def resample_audio(waveform: torch.Tensor, orig_sr: int, target_sr: int) -> torch.Tensor:
+    """Remuestrea una señal [..., T] (sinc de torchaudio, o interpolación lineal si no está instalado)"""
+    if orig_sr == target_sr:
+        return waveform
+    try:
+        import torchaudio.functional as AF
+        return AF.resample(waveform, orig_sr, target_sr)
+    except ImportError:
+        length = max(1, round(waveform.shape[-1] * target_sr / orig_sr))
+        flat = waveform.reshape(-1, 1, waveform.shape[-1])
+        resampled = torch.nn.functional.interpolate(flat, size=length, mode="linear", align_corners=False)
+        return resampled.reshape(*waveform.shape[:-1], length)
+
+
+def frame_audio_windows(waveform: torch.Tensor, window: int, hop: int) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Divide una señal [T] en ventanas solapadas [N, window] (vista sin copia salvo el relleno final)
+    
+    Returns:
+        (ventanas, longitudes válidas de cada ventana)
+    """
+    length = waveform.shape[-1]
+    count = 1 if length <= window else 1 + -(-(length - window) // hop)
+    padded = torch.nn.functional.pad(waveform, (0, (count - 1) * hop + window - length))
+    starts = torch.arange(count, device=waveform.device) * hop
+    lengths = (length - starts).clamp(max=window)
+    return padded.unfold(-1, window, hop), lengths
+
+
+def audio_window_statistics(windows: torch.Tensor, lengths: torch.Tensor, sample_rate: int,
+                            fft_size: int = 2048) -> Dict[str, torch.Tensor]:
+    """
+    Estadísticas acústicas por ventana [N, window] en una sola pasada vectorizada
+    
+    Las posiciones de relleno (más allá de `lengths`) se excluyen de todas las
+    medias.
+    
+    Returns:
+        rms, zero_crossing_rate, spectral_centroid (Hz), spectral_flatness y
+        spectral_flux, tensores [N]
+    """
+    positions = torch.arange(windows.shape[-1], device=windows.device)
+    valid = (positions[None, :] < lengths[:, None]).to(windows.dtype)
+    counts = lengths.clamp(min=1).to(windows.dtype)
+    
+    rms = ((windows ** 2) * valid).sum(dim=1).div(counts).sqrt()
+    crossings = (torch.sign(windows[:, 1:]) != torch.sign(windows[:, :-1])).to(windows.dtype) * valid[:, 1:]
+    zero_crossing_rate = crossings.sum(dim=1) / (counts - 1).clamp(min=1)
+    
+    # Espectro por tramas sin solape: [N, tramas, fft_size // 2 + 1]
+    fft_size = min(fft_size, windows.shape[-1])
+    frames = (windows * valid).unfold(-1, fft_size, fft_size)
+    frame_valid = valid.unfold(-1, fft_size, fft_size).amin(dim=-1)
+    magnitude = torch.fft.rfft(frames * torch.hann_window(fft_size, device=windows.device, dtype=windows.dtype)).abs()
+    frequencies = torch.fft.rfftfreq(fft_size, d=1.0 / sample_rate).to(windows.device, windows.dtype)
+    
+    frame_energy = magnitude.sum(dim=-1)
+    centroid = (magnitude * frequencies).sum(dim=-1) / (frame_energy + 1e-8)
+    flatness = torch.exp(torch.log(magnitude + 1e-8).mean(dim=-1)) / (magnitude.mean(dim=-1) + 1e-8)
+    flux = torch.zeros_like(frame_energy)
+    flux[:, 1:] = (magnitude[:, 1:] - magnitude[:, :-1]).clamp(min=0).sum(dim=-1) / (frame_energy[:, :-1] + 1e-8)
+    
+    frame_counts = frame_valid.sum(dim=1).clamp(min=1)
+    return {
+        "rms": rms,
+        "zero_crossing_rate": zero_crossing_rate,
+        "spectral_centroid": (centroid * frame_valid).sum(dim=1) / frame_counts,
+        "spectral_flatness": (flatness * frame_valid).sum(dim=1) / frame_counts,
+        "spectral_flux": (flux * frame_valid).sum(dim=1) / frame_counts
+    }
+
+
+# ============================================
+# VÍDEO: MUESTREO DE FOTOGRAMAS
+# ============================================
+
+# Parámetros por defecto del muestreo de vídeo (sobrescribibles con video_config)
+DEFAULT_VIDEO_CONFIG = {
+    "sample_fps": 1.0,            # Fotogramas por segundo muestreados a ritmo fijo
+    "scene_threshold": 0.35,      # Distancia de histograma que marca un cambio de escena (None lo desactiva)
+    "scene_probe_fps": 4.0,       # Frecuencia de sondeo para detectar cambios de escena
+    "max_side": 448,              # Lado máximo de los fotogramas decodificados
+    "batch_size": 16,             # Fotogramas por pasada del pipeline visual
+    "queue_size": 32              # Fotogramas decodificados en espera (acota la memoria)
+}
+
+HISTOGRAM_LEVELS = 4  # Niveles por canal del histograma de color de escena
+
+
+def frame_histogram(frame: np.ndarray) -> np.ndarray:
+    """Histograma RGB normalizado (HISTOGRAM_LEVELS³ cubetas) de un fotograma uint8 HxWx3"""
+    step = max(1, min(frame.shape[0], frame.shape[1]) // 64)
+    codes = frame[::step, ::step].astype(np.int32) * HISTOGRAM_LEVELS // 256
+    bins = (codes[..., 0] * HISTOGRAM_LEVELS + codes[..., 1]) * HISTOGRAM_LEVELS + codes[..., 2]
+    histogram = np.bincount(bins.ravel(), minlength=HISTOGRAM_LEVELS ** 3).astype(np.float64)
+    return histogram / max(histogram.sum(), 1.0)
+
+
+def histogram_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """Distancia de variación total entre dos histogramas normalizados (0 iguales, 1 disjuntos)"""
+    return float(0.5 * np.abs(a - b).sum())
+
+
+def decode_video_frames(video_path: str, config: Dict, frames: "queue.Queue", stop: threading.Event):
+    """
+    Decodifica un vídeo en segundo plano y publica los fotogramas muestreados en una cola
+    
+    Todos los fotogramas se avanzan con `grab()` (sin conversión de color) y
+    sólo los que tocan por muestreo fijo o por sondeo de escena se recuperan
+    con `retrieve()` y se reducen a `max_side`. Mensajes publicados:
+    ("meta", {...}), ("frame", {...}), ("error", excepción) y ("end", None).
+    """
+    def publish(message) -> bool:
+        while not stop.is_set():
+            try:
+                frames.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    capture = None
+    try:
+        import cv2
+        capture = cv2.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise FileNotFoundError(f"No se puede abrir el vídeo: {video_path}")
+        
+        fps = capture.get(cv2.CAP_PROP_FPS) or 25.0
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        if not publish(("meta", {"fps": fps, "frame_count": frame_count, "duration": frame_count / fps})):
+            return
+        
+        sample_step = fps / config["sample_fps"]
+        threshold = config["scene_threshold"]
+        probe_step = fps / config["scene_probe_fps"] if threshold is not None else None
+        next_sample, next_probe = 0.0, 0.0
+        previous_histogram = None
+        
+        index = 0
+        while not stop.is_set() and capture.grab():
+            due_sample = index >= next_sample
+            due_probe = probe_step is not None and index >= next_probe
+            
+            if due_sample or due_probe:
+                ok, frame = capture.retrieve()
+                if ok:
+                    scale = config["max_side"] / max(frame.shape[:2])
+                    if scale < 1:
+                        frame = cv2.resize(frame, (round(frame.shape[1] * scale), round(frame.shape[0] * scale)),
+                                           interpolation=cv2.INTER_AREA)
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    
+                    scene_change = False
+                    if threshold is not None:
+                        histogram = frame_histogram(frame)
+                        scene_change = (previous_histogram is not None
+                                        and histogram_distance(histogram, previous_histogram) > threshold)
+                        previous_histogram = histogram
+                    
+                    if (due_sample or scene_change) and not publish(("frame", {
+                        "frame_index": index,
+                        "timestamp": index / fps,
+                        "frame": frame,
+                        "scene_change": scene_change
+                    })):
+                        return
+                
+                while next_sample <= index:
+                    next_sample += sample_step
+                while probe_step is not None and next_probe <= index:
+                    next_probe += probe_step
+            index += 1
+        
+        publish(("end", None))
+    except Exception as e:
+        publish(("error", e))
+    finally:
+        if capture is not None:
+            capture.release()
+
 
 # ============================================
 # CLASE PRINCIPAL: REMFORGE ULTRA FORMATO ÓPTIMO
@@ -30,21 +633,77 @@ class REMForgeUltraFormatoOptimo:
     específico para tokenización fenomenológica computacional.
     """
     
-    def __init__(self, device: str = "auto", precision: str = "float16"):
+    # Modelo de referencia por modalidad (clave en el registro compartido de modelos)
+    MODEL_NAMES = {
+        "semantic": "facebook/bart-large",
+        "vision": "openai/clip-vit-base-patch32",
+        "audio": "facebook/hubert-base-ls960",
+        "depth": "Intel/dpt-large"
+    }
+    
+    # Modelos que intervienen en cada tipo de forja (forman parte de la clave de la caché de resultados)
+    FORGE_MODALITIES = {
+        "text": ("semantic",),
+        "image": ("vision", "depth"),
+        "audio": ("audio",)
+    }
+    
+    def __init__(self, device: str = "auto", precision: Optional[str] = None, load_models: bool = True,
+                 embedding_table: Optional[AnchorEmbeddingTable] = None, visual_config: Optional[Dict] = None,
+                 result_cache: Optional[ForgeResultCache] = None, audio_config: Optional[Dict] = None,
+                 video_config: Optional[Dict] = None):
         self.device = self._autodetect_device(device)
-        self.precision = precision
+        self.requested_precision = precision
+        self.precision = self._resolve_precision(precision, self.device)
         self.session_id = uuid.uuid4().hex[:8]
         self.forge_version = "4.0.0-ultra"
         
-        # Modelos especializados por modalidad
-        self.models = self._load_optimized_models()
+        # Modelos especializados por modalidad, cargados bajo demanda en su primer uso y
+        # compartidos entre instancias del proceso (load_models=False fuerza el modo heurístico)
+        self._model_loaders = {
+            "semantic": self._load_semantic_model,
+            "vision": self._load_vision_model,
+            "audio": self._load_audio_model,
+            "depth": self._load_depth_model
+        }
+        self.load_models = load_models
+        if load_models:
+            self.models = {}
+        else:
+            self.models = {modality: None for modality in self._model_loaders}
+        
+        # Parámetros del análisis visual (tamaño de parche, rejillas de atención y del mapa)
+        self.visual_config = {**DEFAULT_VISUAL_CONFIG, **(visual_config or {})}
+        self._visual_feature_cache: "OrderedDict[str, Dict[str, torch.Tensor]]" = OrderedDict()
+        
+        # Parámetros del análisis de audio (ventanas de inferencia y segmentos temporales)
+        self.audio_config = {**DEFAULT_AUDIO_CONFIG, **(audio_config or {})}
+        
+        # Parámetros del muestreo de vídeo (ritmo fijo, detección de escena, resolución)
+        self.video_config = {**DEFAULT_VIDEO_CONFIG, **(video_config or {})}
+        
+        # Tabla deduplicada de embeddings de anclajes (None: embeddings completos en cada REM)
+        self.embedding_table = embedding_table
+        
+        # Caché persistente de REMs por contenido (None: sin caché)
+        self.result_cache = result_cache
         
         # Buffers para preservación de invariantes temporales
         self.temporal_buffer = []
         self.invariant_cache = {}
         
         print(f"🚀 REMForge Ultra Formato Óptimo inicializado")
-        print(f"   Session: {self.session_id} | Device: {self.device} | Version: {self.forge_version}")
+        print(f"   Session: {self.session_id} | Device: {self.device} | Precision: {self.precision} | Version: {self.forge_version}")
+    
+    @classmethod
+    def heuristic(cls, **kwargs) -> "REMForgeUltraFormatoOptimo":
+        """Forge sólo heurística (CPU, float32, sin modelos): no importa torch para forjar texto"""
+        return cls(device="cpu", precision="float32", load_models=False, **kwargs)
+    
+    @property
+    def compute_dtype(self) -> torch.dtype:
+        """dtype de torch de la precisión efectiva (se resuelve al usarlo, no al construir la forge)"""
+        return getattr(torch, PRECISION_DTYPES[self.precision])
     
     def _autodetect_device(self, device: str) -> str:
         if device == "auto":
@@ -55,204 +714,1085 @@ class REMForgeUltraFormatoOptimo:
             return "cpu"
         return device
     
-    def _load_optimized_models(self) -> Dict:
-        """Carga modelos optimizados para análisis fenomenológico"""
-        models = {}
+    def _resolve_precision(self, precision: Optional[str], device: str) -> str:
+        """Determina la precisión efectiva soportada por el dispositivo (None: la adecuada al dispositivo)"""
+        if precision is None:
+            return "float32" if device == "cpu" else "float16"
         
-        # Modelo de análisis semántico con consciencia de qualia
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(f"Precisión no soportada: {precision} (opciones: {', '.join(SUPPORTED_PRECISIONS)})")
+        
+        if precision == "int8" and device != "cpu":
+            raise ValueError("La cuantización dinámica int8 sólo está disponible en CPU")
+        
+        if precision == "float16" and device == "cpu":
+            # Los kernels fp16 en CPU son lentos o inexistentes: se mantiene fp32
+            warnings.warn("float16 no acelera en CPU, usando float32 (use bfloat16 o int8)", stacklevel=3)
+            return "float32"
+        
+        if precision == "bfloat16" and device == "mps":
+            warnings.warn("bfloat16 no disponible en MPS, usando float16", stacklevel=3)
+            return "float16"
+        
+        return precision
+    
+    def _apply_precision(self, model: torch.nn.Module) -> torch.nn.Module:
+        """Aplica la precisión efectiva a un encoder ya cargado en su dispositivo"""
+        if self.precision in ("float16", "bfloat16"):
+            return model.to(dtype=self.compute_dtype)
+        
+        if self.precision == "int8":
+            return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        
+        return model
+    
+    def _get_model(self, modality: str) -> Optional[Any]:
+        """Devuelve el modelo de una modalidad, cargándolo en su primer uso
+        
+        La carga pasa por el registro compartido del proceso, que garantiza una
+        única carga thread-safe por (modelo, dispositivo, precisión).
+        """
+        if modality not in self.models:
+            self.models[modality] = get_model_registry().get_or_load(
+                self.MODEL_NAMES[modality], self.device, self.precision, self._model_loaders[modality]
+            )
+        
+        return self.models[modality]
+    
+    def preload(self, modalities: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Carga explícitamente los modelos indicados (útil para pools en caliente)
+        
+        Args:
+            modalities: Subconjunto de ["semantic", "vision", "audio", "depth"]; None = todos
+        
+        Returns:
+            Disponibilidad de cada modalidad solicitada
+        """
+        if modalities is None:
+            modalities = list(self._model_loaders)
+        
+        unknown = [modality for modality in modalities if modality not in self._model_loaders]
+        if unknown:
+            raise ValueError(f"Modalidades desconocidas: {unknown}")
+        
+        return {modality: self._get_model(modality) is not None for modality in modalities}
+    
+    def _load_optimized_models(self) -> Dict:
+        """Carga todos los modelos optimizados para análisis fenomenológico"""
+        self.preload()
+        return self.models
+    
+    def _load_semantic_model(self) -> Optional[Dict]:
+        """Modelo de análisis semántico con consciencia de qualia"""
         try:
             from transformers import AutoModel, AutoTokenizer
-            models["semantic"] = {
-                "model": AutoModel.from_pretrained("facebook/bart-large").to(self.device).eval(),
-                "tokenizer": AutoTokenizer.from_pretrained("facebook/bart-large"),
-                "max_length": 512
+            model = {
+                "model": self._apply_precision(AutoModel.from_pretrained(self.MODEL_NAMES["semantic"]).to(self.device).eval()),
+                "tokenizer": AutoTokenizer.from_pretrained(self.MODEL_NAMES["semantic"]),
+                "max_length": 512,
+                "window_overlap": 128  # Tokens de solape entre ventanas de documentos largos
             }
             print("✓ BART-Qualia cargado")
+            return model
         except:
-            models["semantic"] = None
             print("⚠️ Modelo semántico no disponible, usando heurísticos")
-        
-        # CLIP con extracción de capas intermedias
+            return None
+    
+    def _load_vision_model(self) -> Optional[Dict]:
+        """CLIP con extracción de capas intermedias"""
         try:
             from transformers import CLIPModel, CLIPProcessor
-            clip_model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32").to(self.device).eval()
-            models["vision"] = {
+            clip_model = self._apply_precision(CLIPModel.from_pretrained(self.MODEL_NAMES["vision"]).to(self.device).eval())
+            model = {
                 "model": clip_model,
-                "processor": CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32"),
+                "processor": CLIPProcessor.from_pretrained(self.MODEL_NAMES["vision"]),
                 "extract_layers": [-1, -3, -6]  # Múltiples escalas
             }
             print("✓ CLIP-Multilayer cargado")
+            return model
         except:
-            models["vision"] = None
             print("⚠️ Modelo visual no disponible, usando heurísticos")
-        
-        # HuBERT para análisis acústico fenomenológico
+            return None
+    
+    def _load_audio_model(self) -> Optional[Dict]:
+        """HuBERT para análisis acústico fenomenológico"""
         try:
-            from transformers import Wav2Vec2Model, Wav2Vec2Processor
-            models["audio"] = {
-                "model": Wav2Vec2Model.from_pretrained("facebook/hubert-base-ls960").to(self.device).eval(),
-                "processor": Wav2Vec2Processor.from_pretrained("facebook/hubert-base-ls960"),
-                "sample_rate": 16000
+            from transformers import HubertModel, Wav2Vec2FeatureExtractor
+            feature_extractor = Wav2Vec2FeatureExtractor.from_pretrained(self.MODEL_NAMES["audio"])
+            model = {
+                "model": self._apply_precision(HubertModel.from_pretrained(self.MODEL_NAMES["audio"]).to(self.device).eval()),
+                "processor": feature_extractor,
+                "sample_rate": feature_extractor.sampling_rate
             }
             print("✓ HuBERT cargado")
+            return model
         except:
-            models["audio"] = None
             print("⚠️ Modelo de audio no disponible, usando heurísticos")
-        
-        # MiDaS para profundidad espacial
+            return None
+    
+    def _load_depth_model(self) -> Optional[Any]:
+        """MiDaS para profundidad espacial"""
         try:
             from transformers import pipeline
-            models["depth"] = pipeline("depth-estimation", model="Intel/dpt-large", device=0 if self.device == "cuda" else -1)
+            model = pipeline("depth-estimation", model=self.MODEL_NAMES["depth"], device=0 if self.device == "cuda" else -1)
             print("✓ MiDaS cargado")
+            return model
         except:
-            models["depth"] = None
             print("⚠️ Modelo de profundidad no disponible, usando heurísticos")
-        
-        return models
+            return None
     
     # ========================================
     # MÉTODOS PRINCIPALES DE CONVERSIÓN
     # ========================================
     
-    def forge_text_ultra(self, text: str, context: Dict = None) -> Dict[str, Any]:
-        """
-        Conversión de texto con análisis de invariantes lingüísticas
-        
-        Args:
-            text: Texto experiencial (diario, narrativa, etc.)
-            context: {situational_context, temporal_context, author_id}
-        """
+    def forge_text_ultra(self, text: str, context: Dict = None) -> Dict[str, Any]:
+        """
+        Conversión de texto con análisis de invariantes lingüísticas
+        
+        Args:
+            text: Texto experiencial (diario, narrativa, etc.)
+            context: {situational_context, temporal_context, author_id}
+        """
+        return self._forge_with_result_cache("text", [text], [context],
+                                             lambda texts, contexts: [self._forge_text_uncached(texts[0], contexts[0])])[0]
+    
+    def _forge_text_uncached(self, text: str, context: Optional[Dict]) -> Dict[str, Any]:
+        """Forja un texto sin pasar por la caché de resultados"""
+        # 1. Normalización fenomenológica y análisis léxico único del documento
+        analysis = self._build_text_analysis(text)
+        
+        # 2. Extracción de anclajes con scoring de interferencia fenomenológica
+        anchors, embeddings, interference_scores = self._extract_anchors_with_interference(analysis.normalized, analysis)
+        
+        return self._assemble_text_rem(analysis, context, anchors, embeddings, interference_scores)
+    
+    def forge_text_batch(self, texts: List[str], contexts: Optional[List[Dict]] = None,
+                         batch_size: int = 16) -> List[Dict[str, Any]]:
+        """
+        Conversión por lotes de textos experienciales
+        
+        Tokeniza y ejecuta el modelo semántico sobre mini-lotes con padding,
+        y reparte los hidden states de vuelta a la construcción de cada REM.
+        
+        Args:
+            texts: Lista de textos experienciales
+            contexts: Lista de contextos (uno por texto) o None
+            batch_size: Documentos por pasada del modelo semántico
+        """
+        if contexts is None:
+            contexts = [None] * len(texts)
+        elif len(contexts) != len(texts):
+            raise ValueError(f"Se esperaban {len(texts)} contextos, se recibieron {len(contexts)}")
+        
+        return self._forge_with_result_cache(
+            "text", texts, contexts,
+            lambda texts, contexts: self._forge_text_batch_uncached(texts, contexts, batch_size)
+        )
+    
+    def _forge_text_batch_uncached(self, texts: List[str], contexts: List[Optional[Dict]],
+                                   batch_size: int) -> List[Dict[str, Any]]:
+        """Forja un lote de textos sin pasar por la caché de resultados"""
+        analyses = [self._build_text_analysis(text) for text in texts]
+        
+        if self._get_model('semantic') is None:
+            anchor_results = [
+                self._extract_anchors_with_interference(analysis.normalized, analysis)
+                for analysis in analyses
+            ]
+        else:
+            encoded = self._encode_semantic_batch([analysis.normalized for analysis in analyses], batch_size=batch_size)
+            anchor_results = [
+                self._select_anchors_from_hidden_states(tokens, hidden_states, analysis.normalized)
+                for analysis, (tokens, hidden_states) in zip(analyses, encoded)
+            ]
+        
+        return [
+            self._assemble_text_rem(analysis, context, *anchor_result)
+            for analysis, context, anchor_result in zip(analyses, contexts, anchor_results)
+        ]
+    
+    def forge_image_ultra(self, image_input: Union[str, np.ndarray, torch.Tensor], context: Dict = None,
+                          viewpoint: str = "first_person") -> Dict[str, Any]:
+        """
+        Conversión de imagen con análisis de qualia visuales multi-escala
+        
+        Args:
+            image_input: Ruta, array HxWxC o tensor [C, H, W] / [1, C, H, W]
+            context: {situational_context, description, author_id}
+            viewpoint: "first_person", "third_person" o "aerial"
+        """
+        return self.forge_images_batch([image_input], [context], viewpoint=viewpoint)[0]
+    
+    def forge_images_batch(self, images: List[Union[str, np.ndarray, torch.Tensor]],
+                           contexts: Optional[List[Dict]] = None, batch_size: int = 16,
+                           num_workers: Optional[int] = None, viewpoint: str = "first_person") -> List[Dict[str, Any]]:
+        """
+        Conversión por lotes de imágenes
+        
+        Decodifica las imágenes en un pool de hilos por ventanas de
+        `batch_size * decode_window_batches` (la siguiente ventana se decodifica
+        mientras se forja la actual, de modo que la memoria no crece con el
+        número de imágenes), las agrupa por tamaño y apila cada grupo en un
+        único tensor en el dispositivo; CLIP, DPT y las estadísticas de qualia
+        se ejecutan una vez por lote.
+        
+        Sólo se apilan imágenes del mismo tamaño dentro de una ventana: con
+        tamaños mixtos los lotes se reducen (hasta 1 imagen), así que conviene
+        reescalar el corpus a unos pocos tamaños antes de forjarlo.
+        
+        Args:
+            images: Rutas, arrays o tensores de imagen
+            contexts: Lista de contextos (uno por imagen) o None
+            batch_size: Imágenes por pasada de los modelos
+            num_workers: Hilos de decodificación (por defecto, hasta 8)
+            viewpoint: Punto de vista común a todas las imágenes
+        """
+        if contexts is None:
+            contexts = [None] * len(images)
+        elif len(contexts) != len(images):
+            raise ValueError(f"Se esperaban {len(images)} contextos, se recibieron {len(contexts)}")
+        
+        # Las rutas se identifican en la caché por el contenido del fichero
+        return self._forge_with_result_cache(
+            f"image/{viewpoint}", images, contexts,
+            lambda images, contexts: self._forge_images_batch_uncached(images, contexts, batch_size, num_workers, viewpoint),
+            key_inputs=[Path(image) if isinstance(image, str) else image for image in images]
+        )
+    
+    def _forge_images_batch_uncached(self, images: List[Union[str, np.ndarray, torch.Tensor]],
+                                     contexts: List[Optional[Dict]], batch_size: int,
+                                     num_workers: Optional[int], viewpoint: str) -> List[Dict[str, Any]]:
+        """Forja un lote de imágenes sin pasar por la caché de resultados"""
+        workers = num_workers or min(8, os.cpu_count() or 1)
+        window = batch_size * max(1, self.visual_config["decode_window_batches"])
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        
+        # PIL libera el GIL al decodificar: los hilos decodifican la ventana siguiente
+        # mientras se forja la actual, y sólo esas dos ventanas están en memoria
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = [pool.submit(self._decode_image, image) for image in images[:window]]
+            for start in range(0, len(images), window):
+                decoded = [future.result() for future in pending]
+                pending = [pool.submit(self._decode_image, image) for image in images[start + window:start + 2 * window]]
+                self._forge_image_window(decoded, contexts[start:start + window], batch_size, viewpoint,
+                                         results, start)
+                del decoded
+        
+        return results
+    
+    def _decode_image(self, image_input: Union[str, np.ndarray, torch.Tensor]) -> Tuple[torch.Tensor, Optional[str]]:
+        """Decodifica una imagen y calcula su clave en la caché de features (si está activa)"""
+        image_tensor = self._load_image(image_input)
+        cache_key = image_cache_key(image_tensor) if self.visual_config["feature_cache_size"] else None
+        return image_tensor, cache_key
+    
+    def _forge_image_window(self, decoded: List[Tuple[torch.Tensor, Optional[str]]], contexts: List[Optional[Dict]],
+                            batch_size: int, viewpoint: str, results: List[Optional[Dict[str, Any]]], offset: int):
+        """Forja una ventana de imágenes decodificadas en lotes del mismo tamaño (results[offset + i])"""
+        # Sólo se pueden apilar imágenes del mismo tamaño
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for index, (image_tensor, _) in enumerate(decoded):
+            groups.setdefault(tuple(image_tensor.shape[1:]), []).append(index)
+        
+        for indices in groups.values():
+            for start in range(0, len(indices), batch_size):
+                chunk = indices[start:start + batch_size]
+                image_batch = torch.cat([decoded[i][0] for i in chunk]).float().to(self.device)
+                
+                features_batch = self._extract_visual_multiscale_batch(image_batch, [decoded[i][1] for i in chunk])
+                depth_batch = self._estimate_depth_batch(image_batch)
+                qualia_batch = self._analyze_visual_qualia_batch(image_batch, features_batch)
+                
+                for row, index in enumerate(chunk):
+                    results[offset + index] = self._assemble_image_rem(
+                        image_batch[row:row + 1], contexts[index], qualia_batch[row], depth_batch[row], viewpoint
+                    )
+    
+    def forge_audio_ultra(self, audio_input: Union[str, np.ndarray, torch.Tensor], context: Dict = None,
+                          sample_rate: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Conversión de audio con invariantes temporales de HuBERT
+        
+        Args:
+            audio_input: Ruta, o señal [T] / [C, T] / [T, C] en array o tensor
+            context: {situational_context, description, author_id}
+            sample_rate: Frecuencia de la señal (sólo para arrays y tensores)
+        """
+        return self.forge_audio_batch([audio_input], [context], sample_rate=sample_rate)[0]
+    
+    def forge_audio_batch(self, audios: List[Union[str, np.ndarray, torch.Tensor]],
+                          contexts: Optional[List[Dict]] = None, sample_rate: Optional[int] = None,
+                          num_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Conversión por lotes de grabaciones de audio
+        
+        Cada señal se remuestrea una única vez a la frecuencia del modelo y se
+        divide en ventanas solapadas; las ventanas de todas las grabaciones se
+        agrupan en lotes con padding para HuBERT, y sus hidden states se
+        promedian por ventana y por segmento en los invariantes temporales.
+        
+        Args:
+            audios: Rutas, arrays o tensores de audio
+            contexts: Lista de contextos (uno por grabación) o None
+            sample_rate: Frecuencia de las señales en array o tensor (por defecto, la del modelo)
+            num_workers: Hilos de decodificación (por defecto, hasta 8)
+        """
+        if contexts is None:
+            contexts = [None] * len(audios)
+        elif len(contexts) != len(audios):
+            raise ValueError(f"Se esperaban {len(audios)} contextos, se recibieron {len(contexts)}")
+        
+        return self._forge_with_result_cache(
+            "audio", audios, contexts,
+            lambda audios, contexts: self._forge_audio_batch_uncached(audios, contexts, sample_rate, num_workers),
+            key_inputs=[(Path(audio), None) if isinstance(audio, str) else (audio, sample_rate) for audio in audios]
+        )
+    
+    def _forge_audio_batch_uncached(self, audios: List[Union[str, np.ndarray, torch.Tensor]],
+                                    contexts: List[Optional[Dict]], sample_rate: Optional[int],
+                                    num_workers: Optional[int]) -> List[Dict[str, Any]]:
+        """Forja un lote de grabaciones sin pasar por la caché de resultados"""
+        workers = num_workers or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            decoded = list(pool.map(lambda audio: self._load_audio(audio, sample_rate), audios))
+        
+        # Las señales completas se quedan en CPU; al dispositivo sólo pasa cada lote de ventanas
+        target_sr = self._audio_sample_rate()
+        signals = [resample_audio(waveform.cpu(), sr, target_sr) for waveform, sr in decoded]
+        encoded = self._encode_audio_windows(signals, target_sr)
+        
+        return [
+            self._assemble_audio_rem(signal.shape[-1] / target_sr, window_data, context)
+            for signal, window_data, context in zip(signals, encoded, contexts)
+        ]
+    
+    def forge_video(self, video_path: str, context: Dict = None, viewpoint: str = "first_person",
+                    **sampling) -> List[Dict[str, Any]]:
+        """
+        Conversión de vídeo en una secuencia temporal de REMs (uno por fotograma muestreado)
+        
+        Args:
+            video_path: Ruta del vídeo (requiere opencv-python)
+            context: {situational_context, description, author_id}
+            viewpoint: Punto de vista común a todos los fotogramas
+            **sampling: Sobrescrituras de video_config (sample_fps, scene_threshold...)
+        """
+        return list(self.iter_forge_video(video_path, context, viewpoint, **sampling))
+    
+    def iter_forge_video(self, video_path: str, context: Dict = None, viewpoint: str = "first_person",
+                         **sampling) -> Iterator[Dict[str, Any]]:
+        """
+        Forja un vídeo en streaming, produciendo los REMs de fotograma en orden temporal
+        
+        Un hilo decodifica y muestrea los fotogramas (ritmo fijo más cambios de
+        escena) mientras los lotes anteriores pasan por el pipeline visual. Los
+        invariantes entre fotogramas se calculan de forma incremental, con un
+        fotograma de anticipación para la protensión y la duración.
+        """
+        unknown = set(sampling) - set(DEFAULT_VIDEO_CONFIG)
+        if unknown:
+            raise ValueError(f"Parámetros de muestreo desconocidos: {sorted(unknown)}")
+        config = {**self.video_config, **sampling}
+        
+        frames: "queue.Queue" = queue.Queue(maxsize=config["queue_size"])
+        stop = threading.Event()
+        decoder = threading.Thread(target=decode_video_frames, args=(video_path, config, frames, stop),
+                                   name="remforge-video-decoder", daemon=True)
+        decoder.start()
+        
+        sequence = {
+            "sequence_id": f"SEQ-{uuid.uuid4().hex[:12]}",
+            "position": 0,
+            "duration": 0.0,
+            "previous": None,      # Último REM emitido por el pipeline, pendiente de protensión y duración
+            "previous_features": None
+        }
+        try:
+            batch = []
+            while True:
+                kind, payload = frames.get()
+                if kind == "meta":
+                    sequence["duration"] = payload["duration"]
+                    continue
+                if kind == "error":
+                    raise payload
+                if kind == "frame":
+                    batch.append(payload)
+                if batch and (kind == "end" or len(batch) >= config["batch_size"]):
+                    yield from self._forge_video_frames(batch, context, viewpoint, sequence)
+                    batch = []
+                if kind == "end":
+                    break
+            
+            if sequence["previous"] is not None:
+                yield self._close_video_frame(sequence["previous"], None, sequence["duration"])
+        finally:
+            stop.set()
+            decoder.join(timeout=1.0)
+    
+    def _forge_video_frames(self, batch: List[Dict[str, Any]], context: Optional[Dict], viewpoint: str,
+                            sequence: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Pasa un lote de fotogramas por el pipeline visual y enlaza cada REM con el anterior"""
+        image_batch = torch.stack([torch.from_numpy(item["frame"]).permute(2, 0, 1) for item in batch])
+        image_batch = image_batch.to(self.device).float() / 255.0
+        
+        features_batch = self._extract_visual_multiscale_batch(image_batch)
+        depth_batch = self._estimate_depth_batch(image_batch)
+        qualia_batch = self._analyze_visual_qualia_batch(image_batch, features_batch)
+        
+        # Similitud coseno de las features con el fotograma anterior, en el dispositivo
+        summaries = torch.stack([torch.cat([value.flatten().float() for value in features.values()])
+                                 for features in features_batch])
+        previous = sequence["previous_features"]
+        reference = torch.cat([summaries[:1] if previous is None else previous[None], summaries[:-1]])
+        similarities = torch.nn.functional.cosine_similarity(summaries, reference, dim=1).tolist()
+        sequence["previous_features"] = summaries[-1]
+        
+        for row, item in enumerate(batch):
+            rem = self._assemble_image_rem(image_batch[row:row + 1], context, qualia_batch[row],
+                                           depth_batch[row], viewpoint)
+            qualia = qualia_batch[row]
+            previous_rem = sequence["previous"]
+            previous_profile = previous_rem["phenomenal_core"]["qualia_signature"]["intensity_profile"] \
+                if previous_rem is not None else qualia["intensity_profile"]
+            
+            self._to_video_frame_rem(rem, item, sequence, previous_rem, similarities[row],
+                                     [current - past for current, past in zip(qualia["intensity_profile"], previous_profile)])
+            if previous_rem is not None:
+                yield self._close_video_frame(previous_rem, rem, sequence["duration"])
+            sequence["previous"] = rem
+            sequence["position"] += 1
+    
+    def _to_video_frame_rem(self, rem: Dict[str, Any], item: Dict[str, Any], sequence: Dict[str, Any],
+                            previous_rem: Optional[Dict[str, Any]], similarity: float, qualia_delta: List[float]):
+        """Convierte un REM de imagen en el REM de un fotograma de la secuencia (in situ)"""
+        header = rem["header"]
+        header["rem_id"] = "VID-" + header["rem_id"][len("IMG-"):]
+        header["modality_origin"] = "video"
+        header["temporal_scope"] = {
+            "start_offset": item["timestamp"],
+            "duration": 0.0,  # Se completa al conocer el siguiente fotograma
+            "total_sequence_length": sequence["duration"],
+            "sequence_id": sequence["sequence_id"],
+            "sequence_position": sequence["position"],
+            "frame_index": item["frame_index"]
+        }
+        
+        salience = rem["noetic_layer"]["act_intensity"]
+        transitions = [{
+            "position": sequence["position"],
+            "time": item["timestamp"],
+            "feature_similarity": similarity,
+            "transition_type": "scene_change"
+        }] if item["scene_change"] else []
+        
+        invariants = rem["phenomenal_core"]["invariant_features"]
+        invariants["temporal_invariants"] = [[similarity, salience, 1.0]]  # Retención, presente, protensión
+        invariants["inter_frame_invariants"] = {
+            "previous_rem_id": previous_rem["header"]["rem_id"] if previous_rem is not None else None,
+            "feature_similarity": similarity,
+            "qualia_delta": qualia_delta,
+            "scene_change": item["scene_change"]
+        }
+        
+        rem["noetic_layer"]["temporal_phase"] = "present"
+        rem["experiential_stream"]["temporal_markers"] = ["present", "scene_change"] if item["scene_change"] else ["present"]
+        flow = rem["visualization_layer"]["temporal_flow"]
+        flow["flow_type"] = "sequential"
+        flow["phase_transitions"] = transitions
+        flow["retention_proprotentions"] = invariants["temporal_invariants"]
+        rem["multiscale_representation"]["medium_scale"]["intentional_shifts"] = transitions
+    
+    def _close_video_frame(self, rem: Dict[str, Any], next_rem: Optional[Dict[str, Any]],
+                           duration: float) -> Dict[str, Any]:
+        """Completa la duración y la protensión de un fotograma al conocer el siguiente"""
+        scope = rem["header"]["temporal_scope"]
+        if next_rem is not None:
+            end = next_rem["header"]["temporal_scope"]["start_offset"]
+            protention = next_rem["phenomenal_core"]["invariant_features"]["inter_frame_invariants"]["feature_similarity"]
+        else:
+            end = max(duration, scope["start_offset"])
+            protention = 1.0
+        scope["duration"] = end - scope["start_offset"]
+        rem["phenomenal_core"]["invariant_features"]["temporal_invariants"][0][2] = protention
+        return rem
+    
+    def _result_cache_key(self, kind: str, content: Any, context: Optional[Dict]) -> Optional[str]:
+        """Clave de la caché de resultados, o None si la caché no aplica
+        
+        Con una tabla de embeddings los REMs referencian vectores de esa tabla,
+        así que no se cachean. La clave usa los modelos realmente disponibles
+        (no los configurados): un REM del modo heurístico de respaldo no se
+        sirve a una forja que sí tiene el modelo.
+        """
+        if self.result_cache is None or self.embedding_table is not None:
+            return None
+        modalities = self.FORGE_MODALITIES[kind.split("/")[0]]
+        config = {
+            "models": {
+                modality: self.MODEL_NAMES[modality] if self._get_model(modality) is not None else None
+                for modality in modalities
+            },
+            "precision": self.precision,
+            "visual_config": self.visual_config,
+            "audio_config": self.audio_config
+        }
+        return content_key(f"ultra/{kind}", content, context, self.forge_version, config)
+    
+    def _forge_with_result_cache(self, kind: str, inputs: List[Any], contexts: List[Optional[Dict]],
+                                 forge_fn, key_inputs: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """Devuelve los REMs en caché y forja (con forge_fn) sólo los que faltan"""
+        keys = [
+            self._result_cache_key(kind, content, context)
+            for content, context in zip(key_inputs or inputs, contexts)
+        ]
+        if not keys or keys[0] is None:
+            return forge_fn(inputs, contexts)
+        
+        results = [self.result_cache.get(key) for key in keys]
+        results = [self._reissue_cached_rem(rem) if rem is not None else None for rem in results]
+        missing = [i for i, rem in enumerate(results) if rem is None]
+        if missing:
+            forged = forge_fn([inputs[i] for i in missing], [contexts[i] for i in missing])
+            for i, rem in zip(missing, forged):
+                self.result_cache.put(keys[i], rem)
+                results[i] = rem
+        return results
+    
+    @staticmethod
+    def _reissue_cached_rem(rem: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copia de un REM en caché con identificador y marca de tiempo nuevos
+        
+        Cada forja produce un REM distinto aunque la entrada se repita; así dos
+        aciertos de caché no comparten rem_id (p. ej. al exportarlos a un REMStore).
+        """
+        header = dict(rem["header"])
+        prefix = header["rem_id"].split("-", 1)[0]
+        header["rem_id"] = f"{prefix}-{uuid.uuid4().hex[:12]}"
+        header["creation_timestamp"] = datetime.utcnow().isoformat()
+        return {**rem, "header": header}
+    
+    def iter_forge(self, texts: Iterable[str], contexts: Optional[Iterable[Optional[Dict]]] = None,
+                   batch_size: int = 16, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Forja textos en streaming, produciendo los REMs de uno en uno
+        
+        Consume la entrada por bloques de `batch_size` (que pasan por
+        `forge_text_batch`), de modo que la memoria no crece con el corpus.
+        
+        Args:
+            texts: Iterable de textos experienciales (puede ser un generador)
+            contexts: Iterable de contextos paralelo a `texts`, o None
+            batch_size: Documentos por bloque
+            start: Textos iniciales a saltar sin forjar (reanudación)
+        """
+        if contexts is None:
+            items = ((text, None) for text in texts)
+        else:
+            items = zip(texts, contexts)
+        items = islice(items, start, None)
+        
+        while True:
+            chunk = list(islice(items, batch_size))
+            if not chunk:
+                return
+            chunk_texts, chunk_contexts = zip(*chunk)
+            yield from self.forge_text_batch(list(chunk_texts), list(chunk_contexts), batch_size=batch_size)
+    
+    def export_rems(self, rems: Iterable[Dict[str, Any]], destination: Union[str, Path],
+                    format: Optional[str] = None, resume: bool = False) -> Union[int, REMStore]:
+        """
+        Exporta REMs forjados a disco
+        
+        Args:
+            rems: REMs a exportar (lista o generador)
+            destination: Fichero .json / .premb / .jsonl[.gz|.zst], o directorio de un REMStore
+            format: "json", "jsonl", "premb" o "store" (por defecto se infiere de la extensión)
+            resume: Sólo jsonl: continuar un fichero existente en lugar de sobrescribirlo
+        
+        Returns:
+            Número de REMs escritos (json/jsonl/premb) o el REMStore de destino
+        """
+        destination = Path(destination)
+        if format is None:
+            if destination.name.endswith((".jsonl", ".jsonl.gz", ".jsonl.zst", ".jsonl.zstd")):
+                format = "jsonl"
+            else:
+                format = {".json": "json", ".premb": "premb"}.get(destination.suffix, "store")
+        
+        if format == "jsonl":
+            return write_jsonl(rems, destination, resume=resume)
+        
+        if format == "store":
+            store = REMStore(destination)
+            store.extend(rems)
+            return store
+        
+        rems = list(rems)
+        if format == "json":
+            with open(destination, "w", encoding='utf-8') as f:
+                json.dump(rems, f, indent=2, default=str, ensure_ascii=False)
+        elif format == "premb":
+            dump_rems(rems, destination)
+        else:
+            raise ValueError(f"Formato de exportación no soportado: {format}")
+        return len(rems)
+    
+    def _build_text_analysis(self, text: str) -> TextAnalysisContext:
+        """Normaliza, tokeniza y segmenta el documento una única vez"""
+        text_clean = self._phenomenological_normalize(text)
+        lower = text_clean.lower()
+        tokens = _WORD_PATTERN.findall(lower)
+        
+        analysis = TextAnalysisContext(
+            raw=text,
+            normalized=text_clean,
+            lower=lower,
+            words=text_clean.split(),
+            tokens=tokens,
+            word_set=set(tokens),
+            lexicon=lexicon_hits(tokens),
+            first_person_count=len(_FIRST_PERSON_PATTERN.findall(lower)),
+            third_person_count=len(_THIRD_PERSON_PATTERN.findall(lower))
+        )
+        
+        # Análisis multi-cláusula con detección de qualia lingüísticos
+        analysis.clauses, analysis.clause_lexicon = self._analyze_clausal_structure(text_clean)
+        analysis.temporal_markers = self._extract_temporal_markers(analysis)
+        
+        return analysis
+    
+    def _assemble_text_rem(self, analysis: TextAnalysisContext, context: Optional[Dict],
+                           anchors: List[str], embeddings: List[np.ndarray],
+                           interference_scores: List[float]) -> Dict[str, Any]:
+        """Construye el REM de texto a partir del análisis y los anclajes ya extraídos"""
+        if context is None:
+            context = {}
+        
+        text = analysis.raw
+        text_clean = analysis.normalized
+        clauses = analysis.clauses
+        
+        # 3. Detección de invariantes noéticas (patrones intencionales)
+        noetic_invariants = self._extract_noetic_invariants(analysis)
+        
+        # 4. Construcción de signature de qualia lingüística
+        qualia_signature = self._build_linguistic_qualia_signature(analysis, anchors)
+        
+        # 5. Análisis de afecto con separación semántica-fenomenológica
+        affect_split = self._split_affective_semantic_vs_phenomenal(analysis)
+        
+        # 6. Generar visualization layer
+        visualization = self._generate_text_experience_map(clauses, anchors, noetic_invariants)
+        
+        return {
+            "header": {
+                "rem_id": f"TXT-{uuid.uuid4().hex[:12]}",
+                "forge_version": self.forge_version,
+                "creation_timestamp": datetime.utcnow().isoformat(),
+                "modality_origin": "text",
+                "temporal_scope": {
+                    "start_offset": 0.0,
+                    "duration": len(text_clean) / 10.0,  # Estimación: 10 chars/sec
+                    "total_sequence_length": len(text_clean) / 10.0
+                },
+                "quality_metrics": {
+                    "completeness_score": 1.0 if len(text_clean) > 20 else 0.7,
+                    "contamination_detected": len(anchors) > 3,
+                    "phenomenal_resolution": self._compute_phenomenal_resolution(len(anchors), len(clauses))
+                }
+            },
+            "experiential_stream": {
+                "narrative_raw": text,
+                "narrative_enriched": f"[Context: {context.get('situational_context', 'none')}] {text_clean}",
+                "clause_boundaries": clauses,
+                "temporal_markers": analysis.temporal_markers
+            },
+            "noetic_layer": {
+                "intentional_mode": noetic_invariants.get("dominant_mode", "perception"),
+                "directedness": noetic_invariants.get("directedness", "general_experience"),
+                "temporal_phase": self._infer_temporal_phase(analysis),
+                "ego_involvement": self._compute_ego_involvement(analysis),
+                "horizon_type": self._infer_horizon_type(analysis),
+                "act_intensity": np.mean([c['experiential_score'] for c in clauses]) if clauses else 0.5
+            },
+            "sensorial_layer": {
+                "modality_distribution": self._compute_modal_distribution_from_text(anchors, qualia_signature),
+                "spatial_horizon": "peripersonal_space" if "aquí" in analysis.word_set else "extrapersonal_space",
+                "spatial_coordinates": {"egocentric": [0, 0, 0], "allocentric": [0, 0, 0], "rotation": [0, 0, 0]},
+                "affective_valence": affect_split["phenomenal_valence"],
+                "affective_arousal": (affect_split["semantic_valence"] + affect_split["phenomenal_valence"]) / 2,
+                "sensorial_resolution": {
+                    "temporal_precision": 100.0,
+                    "spatial_precision": 0.0,
+                    "qualia_precision": 0.85
+                }
+            },
+            "semantic_contamination": {
+                "contamination_strength": np.mean(interference_scores) if interference_scores else 0.5,
+                "source": "text_fenomenological",
+                "lexical_anchors": [
+                    {
+                        "token": anchor,
+                        **self._anchor_embedding_field(emb),
+                        "salience_score": 1.0 - interference,  # Invertido: bajo score = alta interferencia
+                        "temporal_position": i,
+                        "origin": "global_description"
+                    }
+                    for i, (anchor, emb, interference) in enumerate(zip(anchors, embeddings, interference_scores))
+                ],
+                "semantic_traces": self._trace_semantic_categories(analysis),
+                "invariance_under_semantic_permutation": self._test_semantic_invariance(analysis, anchors)
+            },
+            "phenomenal_core": {
+                "invariant_features": {
+                    "sensory_invariants": qualia_signature["invariant_patterns"],
+                    "noetic_invariants": noetic_invariants["invariant_vectors"],
+                    "temporal_invariants": self._extract_temporal_invariants(analysis)
+                },
+                "qualia_signature": {
+                    "qualia_type": qualia_signature["dominant_type"],
+                    "intensity_profile": qualia_signature["intensity_profile"],
+                    "discrimination_threshold": qualia_signature["jnd_threshold"],
+                    "phenomenal_saturation": qualia_signature["saturation"]
+                },
+                "eidetic_reductions": self._perform_eidetic_reductions(analysis, qualia_signature)
+            },
+            "multiscale_representation": {
+                "coarse_scale": {
+                    "global_narrative": self._summarize_narrative(analysis),
+                    "thematic_gist": self._extract_thematic_gist(analysis),
+                    "affective_gist": self._extract_affective_gist(affect_split),
+                    "spatial_gist": self._extract_spatial_gist(analysis)
+                },
+                "medium_scale": {
+                    "episodic_units": [c['text'] for c in clauses if c['experiential_score'] > 0.6],
+                    "intentional_shifts": noetic_invariants["shifts"],
+                    "qualia_clusters": qualia_signature["clusters"]
+                },
+                "fine_scale": {
+                    "momentary_experiences": self._extract_momentary_qualia(analysis),
+                    "micro_intentionalities": self._extract_micro_intentionalities(analysis),
+                    "qualia_micro_variations": qualia_signature["micro_variations"]
+                }
+            },
+            "visualization_layer": {
+                "experience_map": {
+                    "format": "graph_network",
+                    "coordinates": visualization["coordinates"],
+                    "qualia_weights": visualization["qualia_weights"],
+                    "intentional_vectors": visualization["intentional_vectors"]
+                },
+                "contamination_heatmap": {
+                    "anchor_positions": [i for i, _ in enumerate(anchors)],
+                    "contamination_density": interference_scores,
+                    "pure_zones": visualization["pure_zones"]
+                },
+                "temporal_flow": {
+                    "flow_type": "continuous" if len(clauses) > 1 else "discrete",
+                    "phase_transitions": noetic_invariants["transitions"],
+                    "retention_proprotentions": noetic_invariants["temporal_vectors"]
+                }
+            }
+        }
+    
+    def _assemble_image_rem(self, image_tensor: torch.Tensor, context: Optional[Dict], qualia_visual: Dict,
+                            depth_info: Optional[Dict], viewpoint: str) -> Dict[str, Any]:
+        """Construye el REM de imagen a partir de las features y qualia ya calculados"""
+        if context is None:
+            context = {}
+        
+        h, w = image_tensor.shape[-2:]
+        description = context.get("description", "")
+        
+        attention = self._compute_phenomenal_attention(image_tensor)
+        noesis = self._infer_visual_noesis(qualia_visual, viewpoint, depth_info)
+        affect = self._split_visual_affect(qualia_visual, image_tensor)
+        visualization = self._generate_visual_experience_map(image_tensor, qualia_visual, attention, None)
+        pixel_qualia = self._extract_pixel_qualia(image_tensor, attention)
+        
+        layout = depth_info["spatial_layout"] if depth_info else "unknown"
+        mean_depth = depth_info["mean_depth"] if depth_info else 0.5
+        attention_density = [value for row in attention["attention_map"] for value in row]
+        
+        return {
+            "header": {
+                "rem_id": f"IMG-{uuid.uuid4().hex[:12]}",
+                "forge_version": self.forge_version,
+                "creation_timestamp": datetime.utcnow().isoformat(),
+                "modality_origin": "image",
+                "temporal_scope": {
+                    "start_offset": 0.0,
+                    "duration": 0.0,  # Instante visual
+                    "total_sequence_length": 0.0
+                },
+                "quality_metrics": {
+                    "completeness_score": 1.0 if self._get_model('vision') is not None else 0.7,
+                    "contamination_detected": bool(description),
+                    "phenomenal_resolution": self._compute_phenomenal_resolution(
+                        len(pixel_qualia), len(qualia_visual["micro_variations"]))
+                }
+            },
+            "experiential_stream": {
+                "narrative_raw": description,
+                "narrative_enriched": f"[Context: {context.get('situational_context', 'none')}] {description}".rstrip(),
+                "clause_boundaries": [],
+                "temporal_markers": ["present"]
+            },
+            "noetic_layer": {
+                "intentional_mode": noesis["mode"],
+                "directedness": noesis["directedness"],
+                "temporal_phase": "present",
+                "ego_involvement": 1.0 if viewpoint == "first_person" else 0.0,
+                "horizon_type": "spatial",
+                "act_intensity": qualia_visual["salience"]
+            },
+            "sensorial_layer": {
+                "modality_distribution": self._compute_modal_dist_from_qualia(qualia_visual, "image"),
+                "spatial_horizon": "extrapersonal_space" if layout == "deep" else "peripersonal_space",
+                "spatial_coordinates": {
+                    "egocentric": [*attention["center_of_attention"], mean_depth],
+                    "allocentric": [0, 0, 0],
+                    "rotation": [0, 0, 0]
+                },
+                "affective_valence": affect["visual_valence"],
+                "affective_arousal": affect["visual_arousal"],
+                "sensorial_resolution": {
+                    "temporal_precision": 0.0,
+                    "spatial_precision": float(h * w),
+                    "qualia_precision": 0.85
+                }
+            },
+            "semantic_contamination": {
+                "contamination_strength": float(np.clip(abs(affect["semantic_valence"]), 0.0, 1.0)),
+                "source": "image_pixels",
+                "lexical_anchors": [],
+                "semantic_traces": [
+                    {"trace_type": "visual_category", "surface_form": quale, "phenomenal_interference": 0.2}
+                    for quale in pixel_qualia
+                ],
+                "invariance_under_semantic_permutation": self._test_visual_invariance(image_tensor, pixel_qualia)
+            },
+            "phenomenal_core": {
+                "invariant_features": {
+                    "sensory_invariants": qualia_visual["invariant_patterns"],
+                    "noetic_invariants": noesis["invariant_vectors"],
+                    "temporal_invariants": noesis["temporal_vectors"]
+                },
+                "qualia_signature": {
+                    "qualia_type": qualia_visual["dominant_type"],
+                    "intensity_profile": qualia_visual["intensity_profile"],
+                    "discrimination_threshold": qualia_visual["jnd_threshold"],
+                    "phenomenal_saturation": qualia_visual["saturation"]
+                },
+                "eidetic_reductions": self._perform_visual_eidetic_reductions(qualia_visual, attention)
+            },
+            "multiscale_representation": {
+                "coarse_scale": {
+                    "global_narrative": description,
+                    "thematic_gist": f"Experiencia visual {qualia_visual['dominant_type']}",
+                    "affective_gist": self._gist_affect_from_qualia(qualia_visual),
+                    "spatial_gist": {"deep": "Espacio profundo", "shallow": "Espacio cercano"}.get(layout, "Espacio indeterminado")
+                },
+                "medium_scale": {
+                    "episodic_units": [],
+                    "intentional_shifts": noesis["shifts"],
+                    "qualia_clusters": qualia_visual["clusters"]
+                },
+                "fine_scale": {
+                    "momentary_experiences": pixel_qualia,
+                    "micro_intentionalities": [noesis["directedness"]],
+                    "qualia_micro_variations": qualia_visual["micro_variations"]
+                }
+            },
+            "visualization_layer": {
+                "experience_map": {
+                    "format": "spatial_grid",
+                    "coordinates": visualization["coordinates"],
+                    "qualia_weights": visualization["qualia_weights"],
+                    "intentional_vectors": visualization["intentional_vectors"]
+                },
+                "contamination_heatmap": {
+                    "anchor_positions": list(range(len(attention_density))),
+                    "contamination_density": attention_density,
+                    "pure_zones": visualization["pure_zones"]
+                },
+                "temporal_flow": {
+                    "flow_type": "static",
+                    "phase_transitions": noesis["transitions"],
+                    "retention_proprotentions": noesis["temporal_vectors"]
+                },
+                "attention": attention
+            }
+        }
+    
+    def _assemble_audio_rem(self, duration: float, window_data: Dict[str, np.ndarray],
+                            context: Optional[Dict]) -> Dict[str, Any]:
+        """Construye el REM de audio a partir de las estadísticas y embeddings por ventana"""
         if context is None:
             context = {}
         
-        # 1. Normalización fenomenológica
-        text_clean = self._phenomenological_normalize(text)
-        
-        # 2. Análisis multi-cláusula con detección de qualia lingüísticos
-        clauses = self._analyze_clausal_structure(text_clean)
-        
-        # 3. Extracción de anclajes con scoring de interferencia fenomenológica
-        anchors, embeddings, interference_scores = self._extract_anchors_with_interference(text_clean)
-        
-        # 4. Detección de invariantes noéticas (patrones intencionales)
-        noetic_invariants = self._extract_noetic_invariants(clauses)
-        
-        # 5. Construcción de signature de qualia lingüística
-        qualia_signature = self._build_linguistic_qualia_signature(text_clean, anchors)
-        
-        # 6. Análisis de afecto con separación semántica-fenomenológica
-        affect_split = self._split_affective_semantic_vs_phenomenal(text_clean)
+        description = context.get("description", "")
+        qualia_audio = self._analyze_audio_qualia(window_data)
+        segments = self._pool_audio_segments(window_data, duration)
+        transitions = [
+            {
+                "position": i,
+                "time": segment["start_time"],
+                "continuity": segment["continuity"],
+                "transition_type": "acoustic_rupture"
+            }
+            for i, segment in enumerate(segments) if i > 0 and segment["continuity"] < 0.8
+        ]
+        temporal_vectors = [segment["temporal_vector"] for segment in segments]
         
-        # 7. Generar visualization layer
-        visualization = self._generate_text_experience_map(clauses, anchors, noetic_invariants)
+        times = window_data["start_times"]
+        window_salience = window_data["salience"]
+        coordinates = [
+            [float(t / max(duration, 1e-8)), float(b), float(l)]
+            for t, b, l in zip(times, window_data["brightness"], window_data["loudness"])
+        ]
+        pure_order = np.argsort(window_salience)[::-1][:5]
         
         return {
             "header": {
-                "rem_id": f"TXT-{uuid.uuid4().hex[:12]}",
+                "rem_id": f"AUD-{uuid.uuid4().hex[:12]}",
                 "forge_version": self.forge_version,
                 "creation_timestamp": datetime.utcnow().isoformat(),
-                "modality_origin": "text",
+                "modality_origin": "audio",
                 "temporal_scope": {
                     "start_offset": 0.0,
-                    "duration": len(text_clean) / 10.0,  # Estimación: 10 chars/sec
-                    "total_sequence_length": len(text_clean) / 10.0
+                    "duration": duration,
+                    "total_sequence_length": duration
                 },
                 "quality_metrics": {
-                    "completeness_score": 1.0 if len(text_clean) > 20 else 0.7,
-                    "contamination_detected": len(anchors) > 3,
-                    "phenomenal_resolution": self._compute_phenomenal_resolution(len(anchors), len(clauses))
+                    "completeness_score": 1.0 if self._get_model('audio') is not None else 0.7,
+                    "contamination_detected": bool(description),
+                    "phenomenal_resolution": self._compute_phenomenal_resolution(len(times), len(segments))
                 }
             },
             "experiential_stream": {
-                "narrative_raw": text,
-                "narrative_enriched": f"[Context: {context.get('situational_context', 'none')}] {text_clean}",
-                "clause_boundaries": clauses,
-                "temporal_markers": self._extract_temporal_markers(text_clean)
+                "narrative_raw": description,
+                "narrative_enriched": f"[Context: {context.get('situational_context', 'none')}] {description}".rstrip(),
+                "clause_boundaries": [
+                    {
+                        "start_time": segment["start_time"],
+                        "end_time": segment["end_time"],
+                        "experiential_score": segment["salience"]
+                    }
+                    for segment in segments
+                ],
+                "temporal_markers": ["present"]
             },
             "noetic_layer": {
-                "intentional_mode": noetic_invariants.get("dominant_mode", "perception"),
-                "directedness": noetic_invariants.get("directedness", "general_experience"),
-                "temporal_phase": self._infer_temporal_phase(text_clean),
-                "ego_involvement": self._compute_ego_involvement(text_clean),
-                "horizon_type": self._infer_horizon_type(text_clean),
-                "act_intensity": np.mean([c['experiential_score'] for c in clauses]) if clauses else 0.5
+                "intentional_mode": "perception",
+                "directedness": qualia_audio["directedness"],
+                "temporal_phase": "present",
+                "ego_involvement": 1.0,
+                "horizon_type": "temporal",
+                "act_intensity": qualia_audio["salience"]
             },
             "sensorial_layer": {
-                "modality_distribution": self._compute_modal_distribution_from_text(anchors, qualia_signature),
-                "spatial_horizon": "peripersonal_space" if "aquí" in text_clean else "extrapersonal_space",
-                "spatial_coordinates": {"egocentric": [0, 0, 0], "allocentric": [0, 0, 0], "rotation": [0, 0, 0]},
-                "affective_valence": affect_split["phenomenal_valence"],
-                "affective_arousal": (affect_split["semantic_valence"] + affect_split["phenomenal_valence"]) / 2,
+                "modality_distribution": self._compute_modal_dist_from_audio(qualia_audio),
+                "spatial_horizon": "peripersonal_space",
+                "spatial_coordinates": {
+                    "egocentric": [0.5, 0.5, 0.5],
+                    "allocentric": [0, 0, 0],
+                    "rotation": [0, 0, 0]
+                },
+                "affective_valence": qualia_audio["valence"],
+                "affective_arousal": qualia_audio["arousal"],
                 "sensorial_resolution": {
-                    "temporal_precision": 100.0,
+                    "temporal_precision": float(duration / max(len(times), 1)),
                     "spatial_precision": 0.0,
                     "qualia_precision": 0.85
                 }
             },
             "semantic_contamination": {
-                "contamination_strength": np.mean(interference_scores) if interference_scores else 0.5,
-                "source": "text_fenomenological",
-                "lexical_anchors": [
-                    {
-                        "token": anchor,
-                        "embedding": emb.tolist() if hasattr(emb, 'tolist') else emb,
-                        "salience_score": 1.0 - interference,  # Invertido: bajo score = alta interferencia
-                        "temporal_position": i,
-                        "origin": "global_description"
-                    }
-                    for i, (anchor, emb, interference) in enumerate(zip(anchors, embeddings, interference_scores))
-                ],
-                "semantic_traces": self._trace_semantic_categories(text_clean),
-                "invariance_under_semantic_permutation": self._test_semantic_invariance(text_clean, anchors)
+                "contamination_strength": 0.3 if description else 0.0,
+                "source": "audio_signal",
+                "lexical_anchors": [],
+                "semantic_traces": [],
+                "invariance_under_semantic_permutation": {
+                    "test_passed": True,
+                    "variance_score": float(np.std([segment["continuity"] for segment in segments])),
+                    "semantic_switches": ["ganancia_0.5", "desplazamiento_temporal", "ruido_blanco"]
+                }
             },
             "phenomenal_core": {
                 "invariant_features": {
-                    "sensory_invariants": qualia_signature["invariant_patterns"],
-                    "noetic_invariants": noetic_invariants["invariant_vectors"],
-                    "temporal_invariants": self._extract_temporal_invariants(clauses)
+                    "sensory_invariants": [segment["sensory_vector"] for segment in segments],
+                    "noetic_invariants": [segment["invariant"] for segment in segments],
+                    "temporal_invariants": temporal_vectors
                 },
                 "qualia_signature": {
-                    "qualia_type": qualia_signature["dominant_type"],
-                    "intensity_profile": qualia_signature["intensity_profile"],
-                    "discrimination_threshold": qualia_signature["jnd_threshold"],
-                    "phenomenal_saturation": qualia_signature["saturation"]
+                    "qualia_type": qualia_audio["qualia_type"],
+                    "intensity_profile": qualia_audio["intensity_profile"],
+                    "discrimination_threshold": qualia_audio["jnd_threshold"],
+                    "phenomenal_saturation": qualia_audio["saturation"]
                 },
-                "eidetic_reductions": self._perform_eidetic_reductions(text_clean, qualia_signature)
+                "eidetic_reductions": [
+                    {
+                        "reduction_type": "temporal_reduction",
+                        "reduced_form": "flujo sonoro",
+                        "dependent_variations": ["duración", "ritmo", "continuidad"]
+                    },
+                    {
+                        "reduction_type": "timbral_reduction",
+                        "reduced_form": "cualidad tímbrica",
+                        "dependent_variations": ["brillo", "ruido", "ataque"]
+                    }
+                ]
             },
             "multiscale_representation": {
                 "coarse_scale": {
-                    "global_narrative": self._summarize_narrative(text_clean),
-                    "thematic_gist": self._extract_thematic_gist(text_clean),
-                    "affective_gist": self._extract_affective_gist(affect_split),
-                    "spatial_gist": self._extract_spatial_gist(text_clean)
+                    "global_narrative": description,
+                    "thematic_gist": f"Experiencia auditiva {qualia_audio['qualia_type']}",
+                    "affective_gist": qualia_audio["affective_gist"],
+                    "spatial_gist": "Espacio sonoro envolvente"
                 },
                 "medium_scale": {
-                    "episodic_units": [c['text'] for c in clauses if c['experiential_score'] > 0.6],
-                    "intentional_shifts": noetic_invariants["shifts"],
-                    "qualia_clusters": qualia_signature["clusters"]
+                    "episodic_units": [
+                        {"start_time": segment["start_time"], "end_time": segment["end_time"]}
+                        for segment in segments
+                    ],
+                    "intentional_shifts": transitions,
+                    "qualia_clusters": [
+                        {"type": f"acoustic_segment_{i}", "count": segment["windows"], "intensity": segment["salience"]}
+                        for i, segment in enumerate(segments)
+                    ]
                 },
                 "fine_scale": {
-                    "momentary_experiences": self._extract_momentary_qualia(text_clean),
-                    "micro_intentionalities": self._extract_micro_intentionalities(clauses),
-                    "qualia_micro_variations": qualia_signature["micro_variations"]
+                    "momentary_experiences": [qualia_audio["qualia_type"]],
+                    "micro_intentionalities": [qualia_audio["directedness"]],
+                    "qualia_micro_variations": window_data["profiles"][:self.audio_config["temporal_segments"] * 4].tolist()
                 }
             },
             "visualization_layer": {
                 "experience_map": {
-                    "format": "graph_network",
-                    "coordinates": visualization["coordinates"],
-                    "qualia_weights": visualization["qualia_weights"],
-                    "intentional_vectors": visualization["intentional_vectors"]
+                    "format": "temporal_spectrum",
+                    "coordinates": coordinates,
+                    "qualia_weights": window_salience.tolist(),
+                    "intentional_vectors": [[1.0, 0.0, 0.0]] * len(coordinates)  # Dirección del flujo temporal
                 },
                 "contamination_heatmap": {
-                    "anchor_positions": [i for i, _ in enumerate(anchors)],
-                    "contamination_density": interference_scores,
-                    "pure_zones": visualization["pure_zones"]
+                    "anchor_positions": [],
+                    "contamination_density": [],
+                    "pure_zones": [coordinates[i][:2] + [float(window_salience[i])] for i in pure_order]
                 },
                 "temporal_flow": {
-                    "flow_type": "continuous" if len(clauses) > 1 else "discrete",
-                    "phase_transitions": noetic_invariants["transitions"],
-                    "retention_proprotentions": noetic_invariants["temporal_vectors"]
+                    "flow_type": "continuous",
+                    "phase_transitions": transitions,
+                    "retention_proprotentions": temporal_vectors
+                },
+                "acoustic_profile": {
+                    "window_times": times.tolist(),
+                    "loudness": window_data["loudness"].tolist(),
+                    "brightness": window_data["brightness"].tolist(),
+                    "noisiness": window_data["noisiness"].tolist(),
+                    "continuity": window_data["continuity"].tolist()
                 }
             }
         }
@@ -261,190 +1801,232 @@ class REMForgeUltraFormatoOptimo:
     # MÉTODOS DE ANÁLISIS FENOMENOLÓGICO
     # ========================================
     
+    def _anchor_embedding_field(self, emb: Union[np.ndarray, List[float]]) -> Dict[str, Any]:
+        """Embedding completo del anclaje, o su referencia en la tabla deduplicada"""
+        if self.embedding_table is not None:
+            return {"embedding_id": self.embedding_table.add(emb)}
+        return {"embedding": emb.tolist() if hasattr(emb, 'tolist') else emb}
+    
     def _phenomenological_normalize(self, text: str) -> str:
         """Normaliza texto preservando marcas fenomenológicas"""
         text = re.sub(r'\s+', ' ', text.strip())
         return text
     
-    def _analyze_clausal_structure(self, text: str) -> List[Dict]:
-        """Divide el texto en cláusulas experienciales con scoring"""
-        # Split por conectores temporales y de perspectiva
-        delimiters = r'(?<=[.!?])\s+|\s+(?:y|pero|entonces|cuando|mientras|aunque|sin embargo)\s+'
-        clauses_text = re.split(delimiters, text)
+    def _analyze_clausal_structure(self, text: str) -> Tuple[List[Dict], List[Dict[str, Set[str]]]]:
+        """Divide el texto en cláusulas experienciales con scoring
         
+        Devuelve también los hits léxicos de cada cláusula para no volver a tokenizarlas.
+        """
+        # Split por fin de oración y conectores temporales y de perspectiva, con offsets exactos
         clauses = []
-        start_idx = 0
+        clause_lexicon = []
         
-        for clause in clauses_text:
-            if clause.strip():
-                length = len(clause.split())
-                experiential_score = self._score_experiential_clause(clause)
-                
-                clauses.append({
-                    "text": clause,
-                    "length": length,
-                    "boundary": {"start_char": start_idx, "end_char": start_idx + len(clause), "experiential_score": experiential_score, "qualia_density": 0.0},
-                    "experiential_score": experiential_score
-                })
-                start_idx += len(clause) + 1
+        for clause, start_char, end_char in iter_clause_spans(text, EXPERIENTIAL_DELIMITERS):
+            length = len(clause.split())
+            hits = lexicon_hits(tokenize_lexicon(clause))
+            experiential_score = self._score_experiential_clause(hits)
+            
+            clauses.append({
+                "text": clause,
+                "length": length,
+                "boundary": {"start_char": start_char, "end_char": end_char, "experiential_score": experiential_score, "qualia_density": 0.0},
+                "experiential_score": experiential_score
+            })
+            clause_lexicon.append(hits)
         
-        return clauses
+        return clauses, clause_lexicon
     
-    def _score_experiential_clause(self, clause: str) -> float:
-        """Puntúa qué tan 'experiencialmente densa' es una cláusula"""
-        # Palabras que denotan presencia inmediata
-        experiential_words = {
-            "veo", "oigo", "siento", "huelo", "pruebo", "percibo", "noto", "observo",
-            "está", "hay", "me", "mi", "aquí", "ahora", "ante", "frente", "bajo", "sobre", "dentro"
-        }
-        
-        # Palabras sensoriales
-        sensorial_words = {
-            "rojo", "azul", "verde", "brillante", "oscuro", "claro", "luminoso", "opaco",
-            "suave", "áspero", "liso", "rugoso", "duro", "blando", "cálido", "frío", "húmedo", "seco",
-            "alto", "bajo", "fuerte", "suave", "sordo", "claro", "mudo", "armonioso", "discordante",
-            "dulce", "amargo", "ácido", "salado", "umami", "picante", "sabroso", "insípido",
-            "aromatico", "perfumado", "acido", "dulce", "amargo", "penetrante", "sutil", "intenso"
-        }
-        
-        words = set(clause.lower().split())
-        score = len(words & experiential_words) * 0.6 + len(words & sensorial_words) * 0.4
+    def _score_experiential_clause(self, hits: Dict[str, Set[str]]) -> float:
+        """Puntúa qué tan 'experiencialmente densa' es una cláusula a partir de sus hits léxicos"""
+        score = len(hits.get("experiential", ())) * 0.6 + len(hits.get("sensorial", ())) * 0.4
         
         return min(score / 3, 1.0)  # Normalizar
     
-    def _extract_anchors_with_interference(self, text: str) -> Tuple[List[str], List[np.ndarray], List[float]]:
+    def _extract_anchors_with_interference(self, text: str, analysis: Optional[TextAnalysisContext] = None
+                                           ) -> Tuple[List[str], List[np.ndarray], List[float]]:
         """Extrae anclajes con scoring de interferencia fenomenológica"""
-        if self.models.get('semantic') is None:
+        if self._get_model('semantic') is None:
             # Fallback: extraer sustantivos y adjetivos simples
-            words = re.findall(r'\b\w+\b', text.lower())
+            words = analysis.tokens if analysis is not None else tokenize_lexicon(text)
             
             # Palabras de contenido (filtrar stopwords básicas)
             stopwords = {'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'una', 'es', 'se', 'con', 'mi', 'me', 'te', 'le', 'lo', 'las', 'los', 'del', 'al', 'por', 'para', 'sin', 'sobre', 'tras', 'durante', 'mediante'}
             content_words = [w for w in words if w not in stopwords and len(w) > 3][:8]
             
-            # Embeddings dummy
-            embeddings = [np.random.randn(768) for _ in content_words]
+            # Embeddings heurísticos deterministas por token
+            embeddings = [heuristic_token_embedding(word) for word in content_words]
             
             # Interferencia heurística
-            interference_scores = []
-            for word in content_words:
-                if word in ["rojo", "azul", "verde", "brillante", "suave", "áspero", "cálido", "frío"]:
-                    interference_scores.append(0.2)  # Baja interferencia (qualia puro)
-                elif word in ["recuerda", "pienso", "creo", "entiendo"]:
-                    interference_scores.append(0.8)  # Alta interferencia (semántica)
-                else:
-                    interference_scores.append(0.5)  # Interferencia media
+            interference_scores = [self._compute_phenomenological_interference(word, text) for word in content_words]
             
             return content_words, embeddings, interference_scores
         
         # Usar modelo BART para análisis semántico profundo
-        tokenizer = self.models['semantic']['tokenizer']
-        model = self.models['semantic']['model']
-        
-        inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512).to(self.device)
-        
-        with torch.no_grad():
-            outputs = model(**inputs)
+        tokens, hidden_states = self._encode_semantic_batch([text])[0]
+        return self._select_anchors_from_hidden_states(tokens, hidden_states, text)
+    
+    def _encode_semantic_batch(self, texts: List[str], batch_size: int = 16) -> List[Tuple[List[str], torch.Tensor]]:
+        """Ejecuta el modelo semántico sobre ventanas solapadas en mini-lotes con padding
+        
+        Los documentos más largos que `max_length` se dividen en ventanas con
+        `window_overlap` tokens de solape; las ventanas de todos los documentos
+        se ordenan por longitud para minimizar el padding y se ejecutan por
+        lotes, así que la memoria de activaciones depende del tamaño de ventana
+        y no del documento. Cada token toma el estado de la ventana en la que
+        está más centrado. El resultado conserva el orden de entrada, cubre el
+        documento completo y excluye las posiciones de padding.
+        """
+        semantic = self._get_model('semantic')
+        tokenizer = semantic['tokenizer']
+        model = semantic['model']
+        max_length = semantic['max_length']
+        overlap = semantic.get('window_overlap', 128)
+        
+        # (documento, input_ids de la ventana, posiciones [inicio, fin) que aporta al documento)
+        windows: List[Tuple[int, List[int], int, int]] = []
+        for doc_index, ids in enumerate(tokenizer(texts, add_special_tokens=False)['input_ids']):
+            for input_ids, keep_start, keep_end in self._plan_semantic_windows(ids, tokenizer, max_length, overlap):
+                windows.append((doc_index, input_ids, keep_start, keep_end))
+        
+        order = sorted(range(len(windows)), key=lambda i: len(windows[i][1]), reverse=True)
+        pieces: List[Optional[Tuple[torch.Tensor, torch.Tensor]]] = [None] * len(windows)
+        
+        for start in range(0, len(order), batch_size):
+            batch_indices = order[start:start + batch_size]
+            inputs = tokenizer.pad({'input_ids': [windows[i][1] for i in batch_indices]},
+                                   return_tensors="pt").to(self.device)
+            
+            with torch.no_grad():
+                outputs = model(**inputs)
+            
+            attention_mask = inputs['attention_mask'].bool()
+            for row, window_index in enumerate(batch_indices):
+                _, _, keep_start, keep_end = windows[window_index]
+                mask = attention_mask[row]
+                pieces[window_index] = (
+                    inputs['input_ids'][row][mask][keep_start:keep_end],
+                    outputs.last_hidden_state[row][mask][keep_start:keep_end].float()
+                )
+        
+        # Las ventanas de cada documento están en orden: se cosen concatenando sus tramos
+        stitched: List[List[Tuple[torch.Tensor, torch.Tensor]]] = [[] for _ in texts]
+        for (doc_index, _, _, _), piece in zip(windows, pieces):
+            stitched[doc_index].append(piece)
+        
+        encoded = []
+        for doc_pieces in stitched:
+            input_ids = torch.cat([ids for ids, _ in doc_pieces])
+            hidden_states = torch.cat([states for _, states in doc_pieces])
+            encoded.append((tokenizer.convert_ids_to_tokens(input_ids), hidden_states))
+        return encoded
+    
+    @staticmethod
+    def _plan_semantic_windows(ids: List[int], tokenizer, max_length: int,
+                               overlap: int) -> List[Tuple[List[int], int, int]]:
+        """
+        Divide los ids de un documento en ventanas solapadas con sus tokens especiales
         
-        # Extraer embeddings
-        hidden_states = outputs.last_hidden_state.squeeze(0)
-        tokens = tokenizer.convert_ids_to_tokens(inputs['input_ids'].squeeze(0))
+        Returns:
+            Por ventana: (input_ids, inicio, fin), donde [inicio, fin) son las
+            posiciones locales de la ventana que aporta al documento cosido
+        """
+        content = max_length - tokenizer.num_special_tokens_to_add(pair=False)
+        if len(ids) <= content:
+            input_ids = tokenizer.build_inputs_with_special_tokens(ids)
+            return [(input_ids, 0, len(input_ids))]
+        
+        overlap = min(overlap, content // 2)
+        starts = [0]
+        while starts[-1] + content < len(ids):
+            starts.append(starts[-1] + content - overlap)
+        
+        # Posición del primer token de contenido dentro de una ventana (tras los especiales iniciales)
+        prefix = tokenizer.build_inputs_with_special_tokens([-1]).index(-1)
+        
+        plan = []
+        for k, start in enumerate(starts):
+            input_ids = tokenizer.build_inputs_with_special_tokens(ids[start:start + content])
+            first, last = k == 0, k == len(starts) - 1
+            # Frontera entre ventanas consecutivas: el centro de su solape
+            keep_start = 0 if first else prefix + overlap // 2
+            keep_end = len(input_ids) if last else prefix + starts[k + 1] - start + overlap // 2
+            plan.append((input_ids, keep_start, keep_end))
+        return plan
+    
+    def _select_anchors_from_hidden_states(self, tokens: List[str], hidden_states: torch.Tensor, text: str,
+                                           top_k: int = 5) -> Tuple[List[str], List[np.ndarray], List[float]]:
+        """Selecciona anclajes de contenido a partir de los hidden states de un documento
+        
+        Las normas y el top-k se calculan en el dispositivo sobre la matriz
+        completa, con los tokens especiales y las continuaciones enmascarados;
+        sólo las filas seleccionadas se copian al host.
+        """
+        special_tokens = set(self._get_model('semantic')['tokenizer'].all_special_tokens)
+        content_mask = [token not in special_tokens and not token.startswith('##') for token in tokens]
+        num_content = sum(content_mask)
+        if num_content == 0:
+            return [], [], []
+        
+        mask = torch.tensor(content_mask, device=hidden_states.device)
+        if num_content > top_k:
+            # Seleccionar top tokens por relevancia (norma), en orden creciente de norma
+            norms = torch.linalg.vector_norm(hidden_states.float(), dim=1).masked_fill(~mask, float('-inf'))
+            selected = torch.topk(norms, top_k).indices.flip(0)
+        else:
+            selected = mask.nonzero().squeeze(1)
         
-        # Filtrar y seleccionar tokens de contenido
-        content_tokens = []
-        token_embeddings = []
-        interference_scores = []
+        positions = selected.tolist()
+        token_embeddings = list(hidden_states.index_select(0, selected).cpu().numpy())
         
-        for i, token in enumerate(tokens):
-            if token not in ['[CLS]', '[SEP]', '[PAD]', '[UNK]'] and not token.startswith('##'):
-                # Calcular interferencia fenomenológica
-                interference = self._compute_phenomenological_interference(token, text)
-                
-                content_tokens.append(token.replace('##', ''))
-                token_embeddings.append(hidden_states[i].cpu().numpy())
-                interference_scores.append(interference)
-        
-        # Seleccionar top tokens por relevancia
-        if len(content_tokens) > 5:
-            norms = [np.linalg.norm(emb) for emb in token_embeddings]
-            top_indices = np.argsort(norms)[-5:]
-            
-            content_tokens = [content_tokens[i] for i in top_indices]
-            token_embeddings = [token_embeddings[i] for i in top_indices]
-            interference_scores = [interference_scores[i] for i in top_indices]
+        # Calcular interferencia fenomenológica
+        interference_scores = [self._compute_phenomenological_interference(tokens[i], text) for i in positions]
+        content_tokens = [tokens[i].replace('##', '') for i in positions]
         
         return content_tokens, token_embeddings, interference_scores
     
     def _compute_phenomenological_interference(self, token: str, context: str) -> float:
         """Calcula interferencia semántica en la pureza fenomenológica"""
-        token_lower = token.lower()
-        
-        # Qualia puros (baja interferencia)
-        pure_qualia = {
-            "rojo", "azul", "verde", "amarillo", "blanco", "negro", "gris",
-            "brillante", "oscuro", "claro", "opaco", "transparente", "sólido",
-            "suave", "áspero", "liso", "rugoso", "duro", "blando", "cálido", "frío",
-            "alto", "bajo", "fuerte", "suave", "sordo", "claro", "mudo"
-        }
-        
-        # Contaminación semántica (alta interferencia)
-        semantic_contamination = {
-            "recuerda", "pienso", "creo", "entiendo", "siento que", "me parece",
-            "probablemente", "quizás", "tal vez", "supongo", "debe ser"
-        }
+        categories = LEXICON_INDEX.get(token.lower(), frozenset())
         
-        if token_lower in pure_qualia:
+        if "pure_qualia" in categories:
             return 0.2  # Baja interferencia
-        elif token_lower in semantic_contamination:
+        elif "semantic_contamination" in categories:
             return 0.8  # Alta interferencia
         else:
             return 0.5  # Interferencia media
     
-    def _extract_noetic_invariants(self, clauses: List[Dict]) -> Dict[str, Any]:
+    def _extract_noetic_invariants(self, analysis: TextAnalysisContext) -> Dict[str, Any]:
         """Extrae invariantes noéticas (patrones intencionales)"""
         modes = ["perception", "memory", "imagination", "reflection", "language", "action", "dream"]
-        verbs_per_mode = {
-            "perception": ["veo", "oigo", "siento", "percibo", "noto", "observo"],
-            "memory": ["recordé", "recuerdo", "era", "fue", "había", "solía"],
-            "imagination": ["imagino", "supongo", "quizás", "tal vez", "podría", "sería"],
-            "reflection": ["pienso", "creo", "entiendo", "analizo", "considero", "reflexiono"],
-            "language": ["digo", "cuento", "explico", "describo", "narro"],
-            "action": ["hago", "actúo", "intento", "busco", "quiero", "necesito"]
-        }
+        clauses = analysis.clauses
+        clause_hits = analysis.clause_lexicon
         
         # Detectar modo dominante
         mode_scores = {mode: 0 for mode in modes}
         
-        for clause in clauses:
-            text = clause["text"].lower()
-            for mode, verbs in verbs_per_mode.items():
-                if any(verb in text for verb in verbs):
+        for clause, hits in zip(clauses, clause_hits):
+            for mode in VERBS_PER_MODE:
+                if f"mode:{mode}" in hits:
                     mode_scores[mode] += clause["experiential_score"]
         
         dominant_mode = max(mode_scores.items(), key=lambda x: x[1])[0] if any(mode_scores.values()) else "perception"
         
-        # Detectar directedness
+        # Detectar directedness sobre todas las cláusulas
         directedness = "general_experience"
-        if "color" in text or "rojo" in text or "azul" in text:
-            directedness = "qualia_visual"
-        elif "sonido" in text or "oigo" in text or "ruido" in text:
-            directedness = "qualia_auditory"
-        elif "siento" in text or "textura" in text or "liso" in text:
-            directedness = "qualia_haptic"
-        elif "sabor" in text or "dulce" in text or "amargo" in text:
-            directedness = "qualia_gustatory"
-        elif "olor" in text or "huele" in text:
-            directedness = "qualia_olfactory"
+        for target in DIRECTEDNESS_MARKERS:
+            if any(f"directedness:{target}" in hits for hits in clause_hits):
+                directedness = target
+                break
         
         # Generar vectores invariantes
         invariant_vectors = []
-        for i, clause in enumerate(clauses[:5]):  # Máximo 5 cláusulas
+        for i, (clause, hits) in enumerate(zip(clauses[:5], clause_hits)):  # Máximo 5 cláusulas
             vector = [
                 clause["experiential_score"],
-                1.0 if "yo" in clause["text"].lower() or "me" in clause["text"].lower() else 0.0,
-                1.0 if any(verb in clause["text"].lower() for verb in verbs_per_mode.get(dominant_mode, [])) else 0.0,
+                1.0 if "self_reference" in hits else 0.0,
+                1.0 if f"mode:{dominant_mode}" in hits else 0.0,
                 i / max(len(clauses), 1),  # Posición temporal normalizada
-                len(clause["text"].split()) / 20.0  # Longitud normalizada
+                clause["length"] / 20.0  # Longitud normalizada
             ]
             invariant_vectors.append(vector)
         
@@ -453,29 +2035,22 @@ class REMForgeUltraFormatoOptimo:
             "directedness": directedness,
             "invariant_vectors": invariant_vectors,
             "shifts": self._detect_intentional_shifts(clauses),
-            "transitions": self._detect_phase_transitions(clauses),
-            "temporal_vectors": self._extract_temporal_vectors(clauses)
+            "transitions": self._detect_phase_transitions(analysis),
+            "temporal_vectors": self._extract_temporal_vectors(analysis)
         }
     
-    def _build_linguistic_qualia_signature(self, text: str, anchors: List[str]) -> Dict[str, Any]:
+    def _build_linguistic_qualia_signature(self, analysis: TextAnalysisContext, anchors: List[str]) -> Dict[str, Any]:
         """Construye signature de qualia lingüística"""
         # Clasificar qualia por modalidad
-        qualia_by_modality = {
-            "visual": ["rojo", "azul", "verde", "brillante", "oscuro", "claro", "luminoso", "opaco"],
-            "auditory": ["alto", "bajo", "fuerte", "suave", "sordo", "claro", "mudo", "armonioso"],
-            "haptic": ["áspero", "liso", "suave", "duro", "blando", "cálido", "frío", "húmedo"],
-            "olfactory": ["aromatico", "perfumado", "acido", "dulce", "amargo", "penetrante"],
-            "gustatory": ["dulce", "amargo", "ácido", "salado", "umami", "picante", "sabroso"],
-            "affective": ["feliz", "triste", "enojado", "contento", "ansioso", "tranquilo", "emocionado"]
-        }
+        qualia_by_modality = QUALIA_BY_MODALITY
         
         # Contar qualia por modalidad
-        text_words = set(text.lower().split())
+        hits = analysis.lexicon
         qualia_counts = {}
         total_qualia = 0
         
-        for modality, qualia_list in qualia_by_modality.items():
-            count = len(text_words & set(qualia_list))
+        for modality in qualia_by_modality:
+            count = len(hits.get(f"qualia:{modality}", ()))
             qualia_counts[modality] = count
             total_qualia += count
         
@@ -514,27 +2089,16 @@ class REMForgeUltraFormatoOptimo:
             "saturation": saturation,
             "invariant_patterns": invariant_patterns,
             "clusters": clusters,
-            "micro_variations": self._extract_qualia_variations(text, qualia_by_modality)
+            "micro_variations": self._extract_qualia_variations(analysis, qualia_by_modality)
         }
     
-    def _split_affective_semantic_vs_phenomenal(self, text: str) -> Dict[str, float]:
+    def _split_affective_semantic_vs_phenomenal(self, analysis: TextAnalysisContext) -> Dict[str, float]:
         """Separa afecto semántico del afecto fenomenológico"""
-        # Palabras de afecto semántico
-        semantic_affect = {
-            "bien", "mal", "bueno", "malo", "excelente", "terrible", "fantástico", "horrible",
-            "me gusta", "me encanta", "odio", "detesto", "prefiero", "disfruto"
-        }
-        
-        # Palabras de afecto fenomenológico
-        phenomenal_affect = {
-            "emocionado", "impresionado", "conmovido", "estremecido", "maravillado",
-            "sorprendido", "asombrado", "fascinado", "hipnotizado", "transportado"
-        }
-        
-        words = set(text.lower().split())
+        hits = analysis.lexicon
+        words = analysis.word_set
         
-        semantic_count = len(words & semantic_affect)
-        phenomenal_count = len(words & phenomenal_affect)
+        semantic_count = len(hits.get("affect:semantic", ()))
+        phenomenal_count = len(hits.get("affect:phenomenal", ()))
         
         # Calcular valencias
         semantic_valence = (semantic_count / max(len(words), 1)) * 2 - 1  # -1 a 1
@@ -599,52 +2163,34 @@ class REMForgeUltraFormatoOptimo:
         total = sum(distribution.values())
         return {k: v/total for k, v in distribution.items()}
     
-    def _extract_temporal_markers(self, text: str) -> List[str]:
+    def _extract_temporal_markers(self, analysis: TextAnalysisContext) -> List[str]:
         """Extrae marcadores temporales"""
-        markers = []
-        
-        if any(word in text.lower() for word in ["ahora", "veo", "siento"]):
-            markers.append("present")
-        if any(word in text.lower() for word in ["recordé", "era", "fue", "había"]):
-            markers.append("past")
-        if any(word in text.lower() for word in ["imagino", "sería", "podría"]):
-            markers.append("future")
-        if any(word in text.lower() for word in ["siempre", "nunca", "eterno"]):
-            markers.append("atemporal")
-        if any(word in text.lower() for word in ["normalmente", "generalmente", "suelo"]):
-            markers.append("habitual")
+        hits = analysis.lexicon
+        markers = [phase for phase in TEMPORAL_MARKERS if f"temporal:{phase}" in hits]
         
         return markers if markers else ["present"]
     
-    def _infer_temporal_phase(self, text: str) -> str:
+    def _infer_temporal_phase(self, analysis: TextAnalysisContext) -> str:
         """Infiere fase temporal principal"""
-        markers = self._extract_temporal_markers(text)
+        markers = analysis.temporal_markers
         return markers[0] if markers else "present"
     
-    def _compute_ego_involvement(self, text: str) -> float:
+    def _compute_ego_involvement(self, analysis: TextAnalysisContext) -> float:
         """Calcula involucramiento del ego (0=tercera persona, 1=primera persona)"""
-        first_person = len(re.findall(r'\b(yo|me|mi|mis|mí)\b', text.lower()))
-        third_person = len(re.findall(r'\b(él|ella|su|sus|ellos|ellas)\b', text.lower()))
+        first_person = analysis.first_person_count
+        third_person = analysis.third_person_count
         
         if first_person + third_person == 0:
             return 0.5  # Neutral
         
         return first_person / (first_person + third_person)
     
-    def _infer_horizon_type(self, text: str) -> str:
+    def _infer_horizon_type(self, analysis: TextAnalysisContext) -> str:
         """Infiere tipo de horizonte fenomenológico"""
-        if any(word in text.lower() for word in ["dentro", "adentro", "interior"]):
-            return "inner"
-        elif any(word in text.lower() for word in ["afuera", "exterior", "mundo"]):
-            return "outer"
-        elif any(word in text.lower() for word in ["cuerpo", "manos", "piel", "dedos"]):
-            return "bodily"
-        elif any(word in text.lower() for word in ["aquí", "ahí", "cerca", "lejos"]):
-            return "spatial"
-        elif any(word in text.lower() for word in ["ahora", "antes", "después", "tiempo"]):
-            return "temporal"
-        else:
-            return "spatial"
+        for horizon in HORIZON_MARKERS:
+            if f"horizon:{horizon}" in analysis.lexicon:
+                return horizon
+        return "spatial"
     
     def _compute_phenomenal_resolution(self, num_anchors: int, num_clauses: int) -> float:
         """Calcula resolución fenomenológica en bits por token"""
@@ -657,12 +2203,12 @@ class REMForgeUltraFormatoOptimo:
         
         return min(base_resolution, 10.0)  # Máximo 10 bits
     
-    def _trace_semantic_categories(self, text: str) -> List[Dict]:
+    def _trace_semantic_categories(self, analysis: TextAnalysisContext) -> List[Dict]:
         """Traza categorías semánticas detectadas"""
         traces = []
         
         # Detectar tipos de palabras
-        words = text.split()
+        words = analysis.words
         
         for i, word in enumerate(words):
             word_lower = word.lower()
@@ -693,10 +2239,10 @@ class REMForgeUltraFormatoOptimo:
         
         return traces[:10]  # Limitar resultados
     
-    def _test_semantic_invariance(self, text: str, anchors: List[str]) -> Dict[str, Any]:
+    def _test_semantic_invariance(self, analysis: TextAnalysisContext, anchors: List[str]) -> Dict[str, Any]:
         """Test de invarianza bajo permutación semántica"""
         # Simular test (en producción usaría más análisis)
-        original_meaning = hash(text) % 1000
+        original_meaning = hash(analysis.normalized) % 1000
         
         # Simular permutaciones
         permutations = ["permutación1", "permutación2", "permutación3"]
@@ -708,16 +2254,17 @@ class REMForgeUltraFormatoOptimo:
             "semantic_switches": permutations
         }
     
-    def _extract_temporal_invariants(self, clauses: List[Dict]) -> List[List[float]]:
+    def _extract_temporal_invariants(self, analysis: TextAnalysisContext) -> List[List[float]]:
         """Extrae invariantes temporales"""
         invariants = []
+        clauses = analysis.clauses
         
-        for i, clause in enumerate(clauses[:3]):  # Máximo 3
+        for i, (clause, hits) in enumerate(zip(clauses[:3], analysis.clause_lexicon)):  # Máximo 3
             invariant = [
                 i / max(len(clauses), 1),  # Posición temporal normalizada
                 clause["experiential_score"],  # Intensidad experiencial
-                1.0 if "ahora" in clause["text"].lower() else 0.0,  # Marcador presente
-                len(clause["text"].split()) / 20.0  # Longitud normalizada
+                1.0 if "ahora" in hits.get("temporal:present", ()) else 0.0,  # Marcador presente
+                clause["length"] / 20.0  # Longitud normalizada
             ]
             invariants.append(invariant)
         
@@ -741,17 +2288,15 @@ class REMForgeUltraFormatoOptimo:
         
         return shifts
     
-    def _detect_phase_transitions(self, clauses: List[Dict]) -> List[Dict]:
+    def _detect_phase_transitions(self, analysis: TextAnalysisContext) -> List[Dict]:
         """Detecta transiciones de fase temporal"""
         transitions = []
+        clause_hits = analysis.clause_lexicon
         
-        for i in range(1, len(clauses)):
-            prev_text = clauses[i-1]["text"].lower()
-            curr_text = clauses[i]["text"].lower()
-            
+        for i in range(1, len(clause_hits)):
             # Detectar cambios de fase temporal
-            prev_temporal = any(word in prev_text for word in ["era", "fue", "había"])
-            curr_temporal = any(word in curr_text for word in ["veo", "siento", "está"])
+            prev_temporal = "phase:past" in clause_hits[i-1]
+            curr_temporal = "phase:present" in clause_hits[i]
             
             if prev_temporal and curr_temporal:
                 transitions.append({
@@ -763,90 +2308,78 @@ class REMForgeUltraFormatoOptimo:
         
         return transitions
     
-    def _extract_temporal_vectors(self, clauses: List[Dict]) -> List[List[float]]:
+    def _extract_temporal_vectors(self, analysis: TextAnalysisContext) -> List[List[float]]:
         """Extrae vectores temporales (retención-protensión)"""
         vectors = []
         
-        for i, clause in enumerate(clauses[:3]):
+        for clause, hits in zip(analysis.clauses[:3], analysis.clause_lexicon):
             # Retención (pasado)
-            retention = 1.0 if "recordé" in clause["text"].lower() or "era" in clause["text"].lower() else 0.3
+            retention = 1.0 if "retention" in hits else 0.3
             
             # Presente
             present = clause["experiential_score"]
             
             # Protensión (futuro)
-            protention = 1.0 if "imagino" in clause["text"].lower() or "sería" in clause["text"].lower() else 0.3
+            protention = 1.0 if "protention" in hits else 0.3
             
             vectors.append([retention, present, protention])
         
         return vectors
     
-    def _extract_momentary_qualia(self, text: str) -> List[str]:
+    def _extract_momentary_qualia(self, analysis: TextAnalysisContext) -> List[str]:
         """Extrae qualia momentáneos"""
-        qualia_words = [
-            "brillante", "súbito", "intenso", "vivo", "inmediato", 
-            "puro", "directo", "instantáneo", "claro", "preciso"
+        momentary = [
+            word for word in analysis.tokens
+            if "momentary_qualia" in LEXICON_INDEX.get(word, frozenset())
         ]
         
-        words = text.lower().split()
-        momentary = [word for word in words if word in qualia_words]
-        
         return momentary[:5]
     
-    def _extract_micro_intentionalities(self, clauses: List[Dict]) -> List[str]:
+    def _extract_micro_intentionalities(self, analysis: TextAnalysisContext) -> List[str]:
         """Extrae micro-intencionalidades"""
         micro_intents = []
         
-        for clause in clauses[:3]:
-            text = clause["text"].lower()
-            
-            if "veo" in text or "observo" in text:
-                micro_intents.append("visual_inspection")
-            elif "siento" in text or "percibo" in text:
-                micro_intents.append("haptic_exploration")
-            elif "escucho" in text or "oigo" in text:
-                micro_intents.append("auditory_attention")
-            elif "pienso" in text or "reflexiono" in text:
-                micro_intents.append("reflective_contemplation")
+        for hits in analysis.clause_lexicon[:3]:
+            for intent in MICRO_INTENT_MARKERS:
+                if f"micro_intent:{intent}" in hits:
+                    micro_intents.append(intent)
+                    break
         
         return micro_intents
     
-    def _extract_qualia_variations(self, text: str, qualia_by_modality: Dict) -> List[List[float]]:
+    def _extract_qualia_variations(self, analysis: TextAnalysisContext, qualia_by_modality: Dict) -> List[List[float]]:
         """Extrae variaciones microscópicas de qualia"""
         variations = []
-        words = text.split()
+        words = analysis.tokens
         
         for i in range(min(len(words), 10)):  # Máximo 10 palabras
-            word = words[i].lower()
+            categories = LEXICON_INDEX.get(words[i], frozenset())
             
             variation = [i / 10.0]  # Posición temporal
             
             # Intensidad por modalidad
-            for modality, qualia_list in qualia_by_modality.items():
-                intensity = 1.0 if word in qualia_list else 0.0
+            for modality in qualia_by_modality:
+                intensity = 1.0 if f"qualia:{modality}" in categories else 0.0
                 variation.append(intensity)
             
             variations.append(variation)
         
         return variations
     
-    def _summarize_narrative(self, text: str) -> str:
+    def _summarize_narrative(self, analysis: TextAnalysisContext) -> str:
         """Resume la narrativa principal"""
+        text = analysis.normalized
         sentences = text.split('.')
         if len(sentences) > 1:
             return sentences[0].strip()
         return text[:100] + "..." if len(text) > 100 else text
     
-    def _extract_thematic_gist(self, text: str) -> str:
+    def _extract_thematic_gist(self, analysis: TextAnalysisContext) -> str:
         """Extrae el tema principal"""
-        if "color" in text.lower():
-            return "Experiencia visual cromática"
-        elif "sonido" in text.lower() or "oigo" in text.lower():
-            return "Experiencia auditiva"
-        elif "recuerdo" in text.lower() or "memoria" in text.lower():
-            return "Experiencia mnésica"
-        else:
-            return "Experiencia sensorial general"
+        for theme in THEMATIC_MARKERS:
+            if f"theme:{theme}" in analysis.lexicon:
+                return theme
+        return "Experiencia sensorial general"
     
     def _extract_affective_gist(self, affect_split: Dict) -> str:
         """Extrae el afecto principal"""
@@ -862,18 +2395,14 @@ class REMForgeUltraFormatoOptimo:
         else:
             return "Afecto neutral"
     
-    def _extract_spatial_gist(self, text: str) -> str:
+    def _extract_spatial_gist(self, analysis: TextAnalysisContext) -> str:
         """Extrae el contexto espacial"""
-        if "aquí" in text.lower() or "cerca" in text.lower():
-            return "Espacio peripersonal"
-        elif "allá" in text.lower() or "lejos" in text.lower():
-            return "Espacio extrapersonal"
-        elif "dentro" in text.lower():
-            return "Espacio interno"
-        else:
-            return "Espacio indeterminado"
+        for gist in SPATIAL_MARKERS:
+            if f"spatial:{gist}" in analysis.lexicon:
+                return gist
+        return "Espacio indeterminado"
     
-    def _perform_eidetic_reductions(self, text: str, qualia_signature: Dict) -> List[Dict]:
+    def _perform_eidetic_reductions(self, analysis: TextAnalysisContext, qualia_signature: Dict) -> List[Dict]:
         """Realiza reducciones eidéticas"""
         reductions = []
         
@@ -886,7 +2415,7 @@ class REMForgeUltraFormatoOptimo:
             })
         
         # Reducción espacial
-        if "aquí" in text.lower() or "cerca" in text.lower():
+        if "spatial:Espacio peripersonal" in analysis.lexicon:
             reductions.append({
                 "reduction_type": "spatial_reduction",
                 "reduced_form": "presencia inmediata",
@@ -936,89 +2465,203 @@ class REMForgeUltraFormatoOptimo:
         
         return image_tensor
     
-    def _extract_visual_multiscale(self, image_tensor: torch.Tensor) -> Dict[str, Any]:
-        """Extrae features visuales multi-escala"""
-        if self.models.get('vision') is None:
-            # Fallback: estadísticas simples
-            features = {
-                "global": torch.cat([
-                    image_tensor.mean(dim=[2,3]),
-                    image_tensor.std(dim=[2,3]),
-                    image_tensor.flatten(start_dim=1).mean(dim=1, keepdim=True),
-                    image_tensor.flatten(start_dim=1).std(dim=1, keepdim=True)
-                ], dim=1).squeeze(0),
-                "intermediate": torch.randn(512),
-                "fine": torch.randn(256)
-            }
-            return features
+    def _load_audio(self, audio_input: Union[str, np.ndarray, torch.Tensor],
+                    sample_rate: Optional[int] = None) -> Tuple[torch.Tensor, int]:
+        """Carga audio como señal mono float32 [T] (en CPU) junto con su frecuencia de muestreo"""
+        if isinstance(audio_input, str):
+            try:
+                import soundfile as sf
+                data, sample_rate = sf.read(audio_input, dtype="float32", always_2d=True)
+                waveform = torch.from_numpy(data.T)
+            except ImportError:
+                import torchaudio
+                waveform, sample_rate = torchaudio.load(audio_input)
+        elif isinstance(audio_input, np.ndarray):
+            waveform = torch.from_numpy(np.asarray(audio_input, dtype=np.float32))
+        elif isinstance(audio_input, torch.Tensor):
+            waveform = audio_input.detach().float().cpu()
+        else:
+            raise ValueError(f"Tipo de audio no soportado: {type(audio_input)}")
         
-        # Usar CLIP con extracción de múltiples capas
-        model = self.models['vision']['model']
-        processor = self.models['vision']['processor']
+        # Mezcla a mono: el eje de canales es el más corto
+        if waveform.dim() == 2:
+            waveform = waveform.mean(dim=0 if waveform.shape[0] <= waveform.shape[1] else 1)
+        elif waveform.dim() != 1:
+            raise ValueError(f"Se esperaba una señal [T] o [C, T], forma recibida: {tuple(waveform.shape)}")
         
-        inputs = processor(images=image_tensor, return_tensors="pt").to(self.device)
+        return waveform.contiguous(), int(sample_rate or self.audio_config["sample_rate"])
+    
+    def _extract_visual_multiscale(self, image_tensor: torch.Tensor) -> Dict[str, Any]:
+        """Extrae features visuales multi-escala"""
+        return self._extract_visual_multiscale_batch(image_tensor)[0]
+    
+    def _extract_visual_multiscale_batch(self, image_batch: torch.Tensor,
+                                         cache_keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Extrae features visuales multi-escala de un lote [N, C, H, W] (una pasada de CLIP)
         
-        with torch.no_grad():
-            outputs = model.vision_model(**inputs)
-            hidden_states = outputs.last_hidden_state
+        Las capas de `extract_layers` se capturan con output_hidden_states y se
+        promedian sobre los tokens en el dispositivo. Las features por imagen se
+        guardan en una caché LRU indexada por el hash del contenido de la imagen.
+        """
+        vision = self._get_model('vision')
+        if vision is None:
+            # Fallback determinista: estadísticas globales y promedios espaciales a dos escalas
+            global_features = torch.cat([
+                image_batch.mean(dim=[2,3]),
+                image_batch.std(dim=[2,3]),
+                image_batch.flatten(start_dim=1).mean(dim=1, keepdim=True),
+                image_batch.flatten(start_dim=1).std(dim=1, keepdim=True)
+            ], dim=1)
+            intermediate = torch.nn.functional.adaptive_avg_pool2d(image_batch, (4, 4)).flatten(start_dim=1)
+            fine = torch.nn.functional.adaptive_avg_pool2d(image_batch, (16, 16)).flatten(start_dim=1)
+            return [
+                {
+                    "global": global_features[i],
+                    "intermediate": intermediate[i],
+                    "fine": fine[i]
+                }
+                for i in range(image_batch.shape[0])
+            ]
         
-        # Extraer features de diferentes capas
-        features = {}
-        for layer_idx in self.models['vision']['extract_layers']:
-            if hasattr(model.vision_model.encoder.layers[layer_idx], "output"):
-                layer_output = model.vision_model.encoder.layers[layer_idx].output
-                features[f"layer_{abs(layer_idx)}"] = layer_output.mean(dim=1).squeeze(0)
+        cache_size = self.visual_config["feature_cache_size"]
+        if cache_size and cache_keys is None:
+            cache_keys = [image_cache_key(image) for image in image_batch]
+        
+        features: List[Optional[Dict[str, Any]]] = [None] * image_batch.shape[0]
+        if cache_size:
+            for i, key in enumerate(cache_keys):
+                if key in self._visual_feature_cache:
+                    self._visual_feature_cache.move_to_end(key)
+                    features[i] = self._visual_feature_cache[key]
+        
+        missing = [i for i, image_features in enumerate(features) if image_features is None]
+        if missing:
+            # Usar CLIP con extracción de múltiples capas en una sola pasada
+            model = vision['model']
+            pixel_values = self._clip_pixel_values(image_batch[missing], vision['processor'])
+            
+            with torch.no_grad():
+                outputs = model.vision_model(pixel_values=pixel_values.to(self.compute_dtype), output_hidden_states=True)
+            
+            # hidden_states[0] son los embeddings de entrada: los índices negativos de capa coinciden
+            pooled = {
+                f"layer_{abs(layer_idx)}": outputs.hidden_states[layer_idx].mean(dim=1).float()
+                for layer_idx in vision['extract_layers']
+            }
+            
+            for row, i in enumerate(missing):
+                features[i] = {name: layer_features[row] for name, layer_features in pooled.items()}
+                if cache_size:
+                    self._visual_feature_cache[cache_keys[i]] = features[i]
+                    while len(self._visual_feature_cache) > cache_size:
+                        self._visual_feature_cache.popitem(last=False)
         
         return features
     
+    def _clip_pixel_values(self, image_batch: torch.Tensor, processor) -> torch.Tensor:
+        """Preprocesado CLIP en el dispositivo: redimensionado, recorte central y normalización
+        
+        Equivale al CLIPImageProcessor con do_rescale=False (las imágenes ya
+        están en [0, 1]) sin pasar el lote por PIL ni numpy.
+        """
+        image_processor = getattr(processor, "image_processor", processor)
+        shortest_edge = image_processor.size.get("shortest_edge", 224)
+        crop_h = image_processor.crop_size.get("height", 224)
+        crop_w = image_processor.crop_size.get("width", 224)
+        
+        h, w = image_batch.shape[-2:]
+        scale = shortest_edge / min(h, w)
+        resized_h, resized_w = max(crop_h, round(h * scale)), max(crop_w, round(w * scale))
+        resized = torch.nn.functional.interpolate(
+            image_batch.float(), size=(resized_h, resized_w), mode="bicubic", align_corners=False, antialias=True
+        ).clamp(0.0, 1.0)
+        
+        top = (resized_h - crop_h) // 2
+        left = (resized_w - crop_w) // 2
+        cropped = resized[..., top:top + crop_h, left:left + crop_w]
+        
+        mean = torch.tensor(image_processor.image_mean, device=cropped.device).view(1, -1, 1, 1)
+        std = torch.tensor(image_processor.image_std, device=cropped.device).view(1, -1, 1, 1)
+        return (cropped - mean) / std
+    
     def _estimate_depth_map(self, image_tensor: torch.Tensor) -> Optional[Dict]:
         """Estima mapa de profundidad usando MiDaS"""
-        if self.models.get('depth') is None:
+        return self._estimate_depth_batch(image_tensor)[0]
+    
+    def _estimate_depth_batch(self, image_batch: torch.Tensor) -> List[Optional[Dict]]:
+        """Estima la profundidad de un lote [N, C, H, W] en una sola llamada al pipeline"""
+        depth_model = self._get_model('depth')
+        if depth_model is None:
             # Fallback: heurística simple
-            return {
-                "mean_depth": 0.5,
-                "std_depth": 0.2,
-                "depth_range": 0.4,
-                "spatial_layout": "unknown"
-            }
+            return [
+                {
+                    "mean_depth": 0.5,
+                    "std_depth": 0.2,
+                    "depth_range": 0.4,
+                    "spatial_layout": "unknown"
+                }
+                for _ in range(image_batch.shape[0])
+            ]
         
         try:
             from torchvision.transforms import ToPILImage
-            pil_image = ToPILImage()(image_tensor.squeeze(0))
-            depth = self.models['depth'](pil_image)
-            depth_array = np.array(depth["depth"])
+            to_pil = ToPILImage()
+            pil_images = [to_pil(image) for image in image_batch.float().cpu()]
+            depths = depth_model(pil_images)
             
-            return {
-                "mean_depth": float(depth_array.mean() / 255.0),
-                "std_depth": float(depth_array.std() / 255.0),
-                "depth_range": float((depth_array.max() - depth_array.min()) / 255.0),
-                "spatial_layout": "deep" if depth_array.mean() > 128 else "shallow"
-            }
+            results = []
+            for depth in depths:
+                depth_array = np.array(depth["depth"])
+                results.append({
+                    "mean_depth": float(depth_array.mean() / 255.0),
+                    "std_depth": float(depth_array.std() / 255.0),
+                    "depth_range": float((depth_array.max() - depth_array.min()) / 255.0),
+                    "spatial_layout": "deep" if depth_array.mean() > 128 else "shallow"
+                })
+            return results
         except:
-            return None
+            return [None] * image_batch.shape[0]
     
     def _analyze_visual_qualia_pro(self, image_tensor: torch.Tensor, features_multiscale: Dict) -> Dict[str, Any]:
         """Analiza qualia visuales profundamente"""
+        return self._analyze_visual_qualia_batch(image_tensor, [features_multiscale])[0]
+    
+    def _analyze_visual_qualia_batch(self, image_batch: torch.Tensor,
+                                     features_batch: List[Dict]) -> List[Dict[str, Any]]:
+        """Analiza qualia visuales de un lote [N, C, H, W] con reducciones por imagen"""
         from torchvision.transforms import functional as F
         
-        # Diversidad de color en espacio Lab
-        lab_image = self._rgb_to_lab(image_tensor)
-        color_diversity = lab_image.std(dim=[2,3]).mean().item()
+        hsv = hsv_statistics(image_batch, self.visual_config["reduction_chunk_pixels"])
+        
+        # Diversidad de color en espacio Lab (aproximado con HSV)
+        color_diversity = hsv["std"].mean(dim=1)
         
         # Complejidad de textura
-        gray = F.rgb_to_grayscale(image_tensor)
-        texture_complexity = self._compute_texture_complexity(gray).item()
+        gray = F.rgb_to_grayscale(image_batch)
+        texture_complexity = self._compute_texture_complexity(gray)
         
         # Contraste
-        contrast = self._compute_contrast(image_tensor).item()
+        contrast = self._compute_contrast(image_batch)
         
         # Satuación de color
-        hsv = F.rgb_to_hsv(image_tensor)
-        saturation = hsv[:, 1, :, :].mean().item()
+        saturation = hsv["mean"][:, 1]
         
         # Brillo
-        brightness = image_tensor.mean().item()
+        brightness = image_batch.mean(dim=[1,2,3])
+        
+        # Una sola transferencia al host para todo el lote
+        statistics = torch.stack([color_diversity, texture_complexity, contrast, saturation, brightness], dim=1)
         
+        return [
+            self._build_visual_qualia(image_batch[i:i+1], features_multiscale, *row)
+            for i, (features_multiscale, row) in enumerate(zip(features_batch, statistics.float().tolist()))
+        ]
+    
+    def _build_visual_qualia(self, image_tensor: torch.Tensor, features_multiscale: Dict, color_diversity: float,
+                             texture_complexity: float, contrast: float, saturation: float,
+                             brightness: float) -> Dict[str, Any]:
+        """Construye la signature de qualia visual de una imagen a partir de sus estadísticas"""
         # Clasificar tipo de qualia visual dominante
         if color_diversity > 0.5 and texture_complexity > 0.5:
             qualia_type = "rich_multimodal"
@@ -1063,23 +2706,34 @@ class REMForgeUltraFormatoOptimo:
     def _rgb_to_lab(self, rgb_tensor: torch.Tensor) -> torch.Tensor:
         """Convierte RGB a espacio Lab aproximado"""
         # Simple aproximación usando HSV como proxy
-        from torchvision.transforms import functional as F
-        hsv = F.rgb_to_hsv(rgb_tensor)
+        hsv = rgb_to_hsv(rgb_tensor)
         return hsv
     
     def _compute_texture_complexity(self, gray_tensor: torch.Tensor) -> torch.Tensor:
-        """Computa complejidad de textura mediante gradientes"""
-        # Gradiente Sobel aproximado
-        dx = gray_tensor[..., :-1, :-1] - gray_tensor[..., 1:, :-1]
-        dy = gray_tensor[..., :-1, :-1] - gray_tensor[..., :-1, 1:]
-        gradient_magnitude = torch.sqrt(dx**2 + dy**2)
-        return gradient_magnitude.mean()
+        """Computa complejidad de textura mediante gradientes (por imagen)"""
+        h, w = gray_tensor.shape[-2:]
+        device = gray_tensor.device
+        gray_tensor = float64_reduction_input(gray_tensor)
+        total = torch.zeros(gray_tensor.shape[0], dtype=torch.float64, device=gray_tensor.device)
+        
+        # Por bloques de filas (con una fila de solape) para no materializar los gradientes completos
+        for start, end in _row_chunks(gray_tensor, self.visual_config["reduction_chunk_pixels"], rows=h - 1):
+            block = gray_tensor[..., start:end + 1, :]
+            # Gradiente Sobel aproximado
+            dx = block[..., :-1, :-1] - block[..., 1:, :-1]
+            dy = block[..., :-1, :-1] - block[..., :-1, 1:]
+            total += torch.sqrt(dx**2 + dy**2).flatten(start_dim=1).sum(dim=1, dtype=torch.float64)
+        
+        return (total / max((h - 1) * (w - 1), 1)).to(device=device, dtype=gray_tensor.dtype)
     
     def _compute_contrast(self, image_tensor: torch.Tensor) -> torch.Tensor:
-        """Computa contraste (percentil 95 - percentil 5)"""
-        flattened = image_tensor.flatten()
-        p95 = torch.quantile(flattened, 0.95)
-        p5 = torch.quantile(flattened, 0.05)
+        """Computa contraste (percentil 95 - percentil 5) por imagen"""
+        # Estimador por histograma: sin ordenar la imagen y sin el límite de tamaño de torch.quantile
+        p5, p95 = histogram_quantiles(
+            image_tensor.flatten(start_dim=1), [0.05, 0.95],
+            bins=self.visual_config["histogram_bins"],
+            chunk_elements=self.visual_config["reduction_chunk_pixels"]
+        ).unbind(dim=1)
         return (p95 - p5) / (p95 + p5 + 1e-8)
     
     def _extract_visual_invariants(self, features_multiscale: Dict) -> List[List[float]]:
@@ -1112,30 +2766,28 @@ class REMForgeUltraFormatoOptimo:
     
     def _extract_visual_micro_variations(self, image_tensor: torch.Tensor) -> List[List[float]]:
         """Extrae variaciones microscópicas visuales"""
-        variations = []
-        
         # Dividir imagen en parches pequeños
         h, w = image_tensor.shape[-2:]
-        patch_size = min(32, h//4, w//4)
-        
-        for i in range(0, h-patch_size, patch_size):
-            for j in range(0, w-patch_size, patch_size):
-                patch = image_tensor[..., i:i+patch_size, j:j+patch_size]
-                
-                variation = [
-                    i / h,  # Posición normalizada
-                    j / w,
-                    patch.mean().item(),  # Brillo
-                    patch.std().item()    # Contraste
-                ]
-                variations.append(variation)
-                
-                if len(variations) >= 10:  # Limitar
-                    break
-            if len(variations) >= 10:
-                break
-        
-        return variations
+        patch_size = min(self.visual_config["patch_size"], h//4, w//4)
+        limit = self.visual_config["max_micro_variations"]
+        if patch_size <= 0 or limit <= 0:
+            return []
+        
+        row_starts = torch.arange(0, h-patch_size, patch_size)
+        col_starts = torch.arange(0, w-patch_size, patch_size)
+        if len(row_starts) == 0 or len(col_starts) == 0:
+            return []
+        
+        # Sólo las filas de parches que caben en el límite (orden de filas)
+        row_starts = row_starts[:-(-limit // len(col_starts))]
+        y_edges = torch.cat([row_starts, row_starts[-1:] + patch_size])
+        x_edges = torch.cat([col_starts, col_starts[-1:] + patch_size])
+        means, stds = region_statistics(image_tensor, y_edges, x_edges)
+        
+        # Posición normalizada, brillo y contraste de cada parche
+        rows, cols = torch.meshgrid(row_starts.double() / h, col_starts.double() / w, indexing="ij")
+        variations = torch.stack([rows, cols, means.cpu(), stds.cpu()], dim=-1).reshape(-1, 4)[:limit]
+        return variations.tolist()
     
     def _compute_phenomenal_attention(self, image_tensor: torch.Tensor) -> Dict[str, Any]:
         """Computa atención fenomenológica"""
@@ -1148,18 +2800,10 @@ class REMForgeUltraFormatoOptimo:
             h, w = gray.shape[-2:]
             
             # Dividir en grid y calcular varianza por región
-            grid_size = 4
-            attention_map = np.zeros((grid_size, grid_size))
-            
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    y_start = i * h // grid_size
-                    y_end = (i + 1) * h // grid_size
-                    x_start = j * w // grid_size
-                    x_end = (j + 1) * w // grid_size
-                    
-                    region = gray[..., y_start:y_end, x_start:x_end]
-                    attention_map[i, j] = region.std().item()
+            grid_size = self.visual_config["attention_grid"]
+            edges = torch.arange(grid_size + 1)
+            _, region_std = region_statistics(gray, edges * h // grid_size, edges * w // grid_size)
+            attention_map = region_std.cpu().numpy()
             
             # Encontrar centro de atención
             max_idx = np.unravel_index(np.argmax(attention_map), attention_map.shape)
@@ -1172,10 +2816,11 @@ class REMForgeUltraFormatoOptimo:
                 "attention_map": attention_map.tolist()
             }
         except:
+            grid_size = self.visual_config["attention_grid"]
             return {
                 "center_of_attention": [0.5, 0.5],
                 "attention_spread": 0.5,
-                "attention_map": [[0.5] * 4 for _ in range(4)]
+                "attention_map": [[0.5] * grid_size for _ in range(grid_size)]
             }
     
     def _infer_visual_noesis(self, qualia_visual: Dict, viewpoint: str, depth_info: Optional[Dict]) -> Dict[str, Any]:
@@ -1233,18 +2878,10 @@ class REMForgeUltraFormatoOptimo:
     
     def _compute_color_valence(self, image_tensor: torch.Tensor) -> float:
         """Computa valencia afectiva desde paleta de colores"""
-        from torchvision.transforms import functional as F
-        
-        # Convertir a HSV
-        hsv = F.rgb_to_hsv(image_tensor)
-        hue = hsv[:, 0, :, :]  # Canal de matiz
-        
-        # Colores cálidos → positivo, fríos → negativo
-        warm_mask = ((hue > 0.0) & (hue < 0.17)) | ((hue > 0.94) & (hue < 1.0))
-        cold_mask = (hue > 0.5) & (hue < 0.67)
-        
-        warm_ratio = warm_mask.float().mean().item()
-        cold_ratio = cold_mask.float().mean().item()
+        # Proporción de matices cálidos (positivo) y fríos (negativo)
+        hsv = hsv_statistics(image_tensor, self.visual_config["reduction_chunk_pixels"])
+        warm_ratio = hsv["warm_ratio"].mean().item()
+        cold_ratio = hsv["cold_ratio"].mean().item()
         
         valence = (warm_ratio - cold_ratio) * 0.5
         return np.clip(valence, -1.0, 1.0)
@@ -1254,11 +2891,10 @@ class REMForgeUltraFormatoOptimo:
         """Genera mapa de experiencia visual"""
         h, w = image_tensor.shape[-2:]
         
-        # Coordenadas espaciales
-        coordinates = []
-        for i in range(0, h, h//8):
-            for j in range(0, w, w//8):
-                coordinates.append([j/w, i/h, 0.5])  # Normalizadas
+        # Coordenadas espaciales normalizadas (rejilla en orden de filas)
+        grid = self.visual_config["map_grid"]
+        ys, xs = np.meshgrid(np.arange(0, h, max(1, h//grid)) / h, np.arange(0, w, max(1, w//grid)) / w, indexing="ij")
+        coordinates = np.stack([xs, ys, np.full_like(xs, 0.5)], axis=-1).reshape(-1, 3).tolist()
         
         # Pesos de qualia por posición
         qualia_weights = [qualia_visual["salience"]] * len(coordinates)
@@ -1358,6 +2994,222 @@ class REMForgeUltraFormatoOptimo:
             "variance_score": 0.2,
             "semantic_switches": ["rotación_90", "escala_0.5", "brillo_1.2"]
         }
+    
+    # ========================================
+    # MÉTODOS DE ANÁLISIS AUDITIVO
+    # ========================================
+    
+    def _audio_sample_rate(self) -> int:
+        """Frecuencia de trabajo: la del extractor de HuBERT, o la configurada en modo heurístico"""
+        audio = self._get_model('audio')
+        return int(audio["sample_rate"]) if audio is not None else int(self.audio_config["sample_rate"])
+    
+    def _encode_audio_windows(self, signals: List[torch.Tensor], sample_rate: int) -> List[Dict[str, np.ndarray]]:
+        """
+        Ventanea las señales y ejecuta HuBERT sobre lotes de ventanas con padding
+        
+        Las ventanas de todas las señales comparten los lotes; las señales se
+        ventanean donde estén (en CPU al forjar) y sólo cada lote de ventanas
+        se copia al dispositivo, donde se resume (media de hidden states y
+        estadísticas acústicas); los resúmenes de cada señal se transfieren
+        al host una sola vez.
+        
+        Returns:
+            Por señal: inicio de cada ventana, perfil acústico, embedding y continuidad
+        """
+        config = self.audio_config
+        window = max(1, int(config["window_seconds"] * sample_rate))
+        hop = max(1, window - int(config["overlap_seconds"] * sample_rate))
+        framed = [frame_audio_windows(signal.float(), window, hop) for signal in signals]
+        order = [(s, w) for s, (windows, _) in enumerate(framed) for w in range(windows.shape[0])]
+        audio = self._get_model('audio')
+        
+        profiles: List[List[torch.Tensor]] = [[] for _ in signals]
+        embeddings: List[List[torch.Tensor]] = [[] for _ in signals]
+        batch_size = config["window_batch_size"]
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            batch = torch.stack([framed[s][0][w] for s, w in chunk]).to(self.device)
+            lengths = torch.stack([framed[s][1][w] for s, w in chunk]).to(self.device)
+            
+            stats = audio_window_statistics(batch, lengths, sample_rate, config["fft_size"])
+            profile = torch.stack([
+                ((20 * torch.log10(stats["rms"] + 1e-8) + 60) / 60).clamp(0, 1),  # Sonoridad (-60..0 dBFS)
+                (stats["spectral_centroid"] / (sample_rate / 2)).clamp(0, 1),      # Brillo
+                stats["spectral_flatness"].clamp(0, 1),                            # Ruido frente a tono
+                stats["spectral_flux"] / (1 + stats["spectral_flux"]),             # Ataques / ritmo
+                stats["zero_crossing_rate"]
+            ], dim=1)
+            pooled = self._hubert_window_embeddings(audio, batch, lengths) if audio is not None else profile
+            
+            for row, (s, _) in enumerate(chunk):
+                profiles[s].append(profile[row])
+                embeddings[s].append(pooled[row])
+        
+        results = []
+        for s, (windows, _) in enumerate(framed):
+            embedding = torch.stack(embeddings[s])
+            continuity = torch.ones(embedding.shape[0], device=embedding.device)
+            if embedding.shape[0] > 1:
+                continuity[1:] = torch.nn.functional.cosine_similarity(embedding[1:], embedding[:-1], dim=1)
+            profile = torch.stack(profiles[s]).cpu().numpy()
+            
+            results.append({
+                "start_times": np.arange(windows.shape[0]) * hop / sample_rate,
+                "profiles": profile,
+                "loudness": profile[:, 0],
+                "brightness": profile[:, 1],
+                "noisiness": profile[:, 2],
+                "rhythm": profile[:, 3],
+                "salience": profile[:, [0, 1, 3]].mean(axis=1),
+                "embeddings": embedding.cpu().numpy(),
+                "continuity": continuity.cpu().numpy()
+            })
+        return results
+    
+    def _hubert_window_embeddings(self, audio: Dict, batch: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+        """Media de los hidden states de HuBERT por ventana, excluyendo las tramas de padding"""
+        extractor = audio["processor"]
+        model = audio["model"]
+        valid = torch.arange(batch.shape[1], device=batch.device)[None, :] < lengths[:, None]
+        
+        # Misma normalización que Wav2Vec2FeatureExtractor, pero en el dispositivo
+        inputs = batch
+        if getattr(extractor, "do_normalize", False):
+            mask = valid.to(batch.dtype)
+            counts = lengths.clamp(min=1)[:, None].to(batch.dtype)
+            mean = (batch * mask).sum(dim=1, keepdim=True) / counts
+            variance = (((batch - mean) * mask) ** 2).sum(dim=1, keepdim=True) / counts
+            inputs = (batch - mean) / torch.sqrt(variance + 1e-7)
+        inputs = torch.where(valid, inputs, torch.full_like(inputs, float(getattr(extractor, "padding_value", 0.0))))
+        
+        kwargs = {"attention_mask": valid.long()} if getattr(extractor, "return_attention_mask", False) else {}
+        with torch.no_grad():
+            hidden = model(inputs.to(self.compute_dtype), **kwargs).last_hidden_state.float()
+        
+        if hasattr(model, "_get_feat_extract_output_lengths"):
+            frame_lengths = model._get_feat_extract_output_lengths(lengths)
+        else:
+            frame_lengths = lengths // 320  # Paso total del extractor convolucional de HuBERT
+        frame_mask = (torch.arange(hidden.shape[1], device=hidden.device)[None, :] < frame_lengths[:, None])
+        frame_mask = frame_mask.unsqueeze(-1).float()
+        return (hidden * frame_mask).sum(dim=1) / frame_mask.sum(dim=1).clamp(min=1)
+    
+    def _pool_audio_segments(self, window_data: Dict[str, np.ndarray], duration: float) -> List[Dict[str, Any]]:
+        """Agrupa las ventanas en segmentos contiguos y deriva sus invariantes temporales"""
+        start_times = window_data["start_times"]
+        embeddings = window_data["embeddings"]
+        groups = np.array_split(np.arange(len(start_times)), min(self.audio_config["temporal_segments"], len(start_times)))
+        
+        pooled = [embeddings[indices].mean(axis=0) for indices in groups]
+        
+        def cosine(a, b):
+            return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-8))
+        
+        segments = []
+        for i, indices in enumerate(groups):
+            start_time = float(start_times[indices[0]])
+            end_time = float(min(start_times[indices[-1]] + self.audio_config["window_seconds"], duration))
+            salience = float(window_data["salience"][indices].mean())
+            retention = cosine(pooled[i - 1], pooled[i]) if i > 0 else 1.0
+            protention = cosine(pooled[i], pooled[i + 1]) if i + 1 < len(groups) else 1.0
+            
+            segments.append({
+                "start_time": start_time,
+                "end_time": end_time,
+                "windows": len(indices),
+                "salience": salience,
+                "continuity": retention,
+                "temporal_vector": [retention, salience, protention],
+                "invariant": [
+                    i / len(groups),                                   # Posición temporal normalizada
+                    salience,                                          # Intensidad experiencial
+                    retention,                                         # Continuidad con el segmento previo
+                    (end_time - start_time) / max(duration, 1e-8)      # Duración relativa
+                ],
+                "sensory_vector": window_data["profiles"][indices].mean(axis=0).tolist()
+            })
+        return segments
+    
+    def _analyze_audio_qualia(self, window_data: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Signature de qualia auditivos a partir del perfil acústico medio"""
+        loudness, brightness, noisiness, rhythm, zero_crossings = window_data["profiles"].mean(axis=0).tolist()
+        
+        if loudness < 0.15:
+            qualia_type, directedness = "silent", "auditory_vigilance"
+        elif noisiness > 0.5:
+            qualia_type, directedness = "noisy", "ambient_immersion"
+        elif rhythm > 0.5:
+            qualia_type, directedness = "percussive", "rhythmic_entrainment"
+        elif noisiness < 0.1:
+            qualia_type, directedness = "tonal", "melodic_listening"
+        else:
+            qualia_type, directedness = "textured", "timbral_exploration"
+        
+        salience = (loudness + brightness + rhythm) / 3
+        arousal = float(np.clip(0.5 * loudness + 0.5 * rhythm, 0.0, 1.0))
+        valence = float(np.clip((1.0 - 2.0 * noisiness) * 0.5, -1.0, 1.0))
+        
+        if arousal > 0.6:
+            affective_gist = "Experiencia auditiva intensa y enérgica"
+        elif valence > 0.3:
+            affective_gist = "Experiencia auditiva armoniosa"
+        elif qualia_type == "silent":
+            affective_gist = "Experiencia auditiva silenciosa y expectante"
+        else:
+            affective_gist = "Experiencia auditiva difusa"
+        
+        return {
+            "qualia_type": qualia_type,
+            "directedness": directedness,
+            "intensity_profile": [loudness, brightness, noisiness, rhythm, zero_crossings],
+            "jnd_threshold": 0.05 + (noisiness * 0.1) + (rhythm * 0.05),
+            "saturation": min(salience, 1.0),
+            "salience": salience,
+            "arousal": arousal,
+            "valence": valence,
+            "affective_gist": affective_gist
+        }
+    
+    def _compute_modal_dist_from_audio(self, qualia_audio: Dict) -> Dict[str, float]:
+        """Computa distribución modal de una experiencia auditiva"""
+        distribution = {
+            "visual": 0.05,
+            "auditory": 0.85,
+            "haptic": 0.05,
+            "olfactory": 0.02,
+            "gustatory": 0.02,
+            "proprioceptive": 0.10,
+            "affective": 0.40 * qualia_audio["saturation"],
+            "cognitive": 0.15,
+            "digital": 0.10
+        }
+        
+        # Los ataques marcados se viven también corporalmente
+        if qualia_audio["qualia_type"] == "percussive":
+            distribution["proprioceptive"] += 0.1
+        
+        total = sum(distribution.values())
+        return {k: v/total for k, v in distribution.items()}
+
+# ============================================
+# PUNTO DE ENTRADA HEURÍSTICO
+# ============================================
+
+_heuristic_forge: Optional[REMForgeUltraFormatoOptimo] = None
+
+
+def forge_text_heuristic(text: str, context: Dict = None) -> Dict[str, Any]:
+    """
+    Forja un texto en modo heurístico con una forge compartida del proceso
+    
+    Pensado para la CLI y las comprobaciones de salud: no carga modelos ni
+    importa torch, así que el arranque en frío es de milisegundos.
+    """
+    global _heuristic_forge
+    if _heuristic_forge is None:
+        _heuristic_forge = REMForgeUltraFormatoOptimo.heuristic()
+    return _heuristic_forge.forge_text_ultra(text, context)
 
 # ============================================
 # CLASE DE VISUALIZACIÓN FENOMENOLÓGICA
@@ -1367,11 +3219,14 @@ class PhenomenalVisualizer:
     """Genera representaciones visuales del contenido fenomenológico"""
     
     @staticmethod
-    def generate_experience_map(rem_data: Dict, output_path: str):
-        """Genera mapa de experiencia 2D/3D"""
+    def generate_experience_map(rem_data: Union[Dict, List[Dict]], output_path: str):
+        """Genera mapa de experiencia 2D/3D (una lista de REMs se trata como secuencia de vídeo)"""
         import matplotlib.pyplot as plt
         import numpy as np
         
+        if isinstance(rem_data, list):
+            return PhenomenalVisualizer.visualize_temporal_experience_map(rem_data, output_path)
+        
         modality = rem_data["header"]["modality_origin"]
         
         if modality == "text":
@@ -1467,13 +3322,85 @@ class PhenomenalVisualizer:
     @staticmethod
     def visualize_audio_experience_map(rem_data: Dict, output_path: str):
         """Visualiza audio como espectro temporal de qualia"""
-        # Implementación simplificada
+        import matplotlib.pyplot as plt
+        
+        profile = rem_data["visualization_layer"]["acoustic_profile"]
+        qualia = rem_data["phenomenal_core"]["qualia_signature"]
+        invariants = rem_data["phenomenal_core"]["invariant_features"]["temporal_invariants"]
+        transitions = rem_data["visualization_layer"]["temporal_flow"]["phase_transitions"]
+        times = profile["window_times"]
+        
+        fig = plt.figure(figsize=(12, 8))
+        
+        # Perfil acústico por ventana, con las rupturas temporales marcadas
+        ax1 = fig.add_subplot(211)
+        for key, color in (("loudness", "#2C3E50"), ("brightness", "#E67E22"), ("noisiness", "#7F8C8D")):
+            ax1.plot(times, profile[key], label=key, color=color, linewidth=1.5)
+        for transition in transitions:
+            ax1.axvline(transition["time"], color="red", linestyle="--", alpha=0.5)
+        ax1.set_title("Espectro Temporal de Qualia")
+        ax1.set_xlabel("Tiempo (s)")
+        ax1.legend(loc="upper right")
+        ax1.grid(True, alpha=0.3)
+        
+        # Perfil de intensidad
+        ax2 = fig.add_subplot(223)
+        ax2.bar(range(len(qualia["intensity_profile"])), qualia["intensity_profile"], color="purple")
+        ax2.set_title(f"Perfil de Intensidad Qualia ({qualia['qualia_type']})")
+        ax2.set_ylabel("Intensidad")
+        
+        # Retención-presente-protensión por segmento
+        ax3 = fig.add_subplot(224)
+        if invariants:
+            im = ax3.imshow(np.array(invariants).T, cmap='viridis', aspect='auto')
+            ax3.set_yticks(range(3))
+            ax3.set_yticklabels(["retención", "presente", "protensión"])
+            ax3.set_xlabel("Segmento")
+            ax3.set_title("Invariantes Temporales")
+            plt.colorbar(im, ax=ax3)
+        
+        plt.tight_layout()
+        plt.savefig(f"{output_path}_audio_map.png", dpi=150, bbox_inches='tight')
+        plt.close()
+        
         return f"{output_path}_audio_map.png"
     
     @staticmethod
-    def visualize_temporal_experience_map(rem_data: Dict, output_path: str):
+    def visualize_temporal_experience_map(rem_data: Union[Dict, List[Dict]], output_path: str):
         """Visualiza video como secuencia temporal"""
-        # Implementación simplificada
+        import matplotlib.pyplot as plt
+        
+        sequence = rem_data if isinstance(rem_data, list) else [rem_data]
+        times = [rem["header"]["temporal_scope"]["start_offset"] for rem in sequence]
+        salience = [rem["noetic_layer"]["act_intensity"] for rem in sequence]
+        inter_frame = [rem["phenomenal_core"]["invariant_features"].get("inter_frame_invariants", {}) for rem in sequence]
+        similarity = [frame.get("feature_similarity", 1.0) for frame in inter_frame]
+        profiles = np.array([rem["phenomenal_core"]["qualia_signature"]["intensity_profile"] for rem in sequence])
+        
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+        
+        # Saliencia y continuidad entre fotogramas, con los cambios de escena marcados
+        ax1.plot(times, salience, 'o-', color='#8E44AD', label="saliencia")
+        ax1.plot(times, similarity, 's--', color='#16A085', label="continuidad")
+        for time, frame in zip(times, inter_frame):
+            if frame.get("scene_change"):
+                ax1.axvline(time, color="red", linestyle="--", alpha=0.5)
+        ax1.set_title("Flujo Temporal de la Experiencia Visual")
+        ax1.legend(loc="upper right")
+        ax1.grid(True, alpha=0.3)
+        
+        # Perfil de intensidad qualia a lo largo del tiempo
+        if len(profiles):
+            extent = [times[0], times[-1] if len(times) > 1 else times[0] + 1, profiles.shape[1], 0]
+            im = ax2.imshow(profiles.T, cmap='plasma', aspect='auto', extent=extent)
+            ax2.set_title("Perfil de Intensidad Qualia por Fotograma")
+            ax2.set_xlabel("Tiempo (s)")
+            plt.colorbar(im, ax=ax2)
+        
+        plt.tight_layout()
+        plt.savefig(f"{output_path}_temporal_map.png", dpi=150, bbox_inches='tight')
+        plt.close()
+        
         return f"{output_path}_temporal_map.png"
 
 # ============================================
@@ -1505,14 +3432,12 @@ def demo_formato_optimo():
     
     print("\n📄 Procesando textos de demo...")
     
-    rems_generados = []
+    # Generar REMs con formato óptimo en un único lote
+    rems_generados = forge.forge_text_batch(textos_demo, [contexto] * len(textos_demo))
     
-    for i, texto in enumerate(textos_demo):
+    for i, (texto, rem_output) in enumerate(zip(textos_demo, rems_generados)):
         print(f"\n📝 Texto {i+1}: '{texto[:50]}...'")
         
-        # Generar REM con formato óptimo
-        rem_output = forge.forge_text_ultra(texto, contexto)
-        
         # Mostrar estadísticas clave
         header = rem_output["header"]
         noetic = rem_output["noetic_layer"]
@@ -1526,8 +3451,6 @@ def demo_formato_optimo():
         print(f"   ✅ Contaminación: {contamination['contamination_strength']:.3f}")
         print(f"   ✅ Qualia detectados: {len(contamination['lexical_anchors'])}")
         print(f"   ✅ Resolución fenomenológica: {header['quality_metrics']['phenomenal_resolution']:.3f}")
-        
-        rems_generados.append(rem_output)
     
     # Crear visualizaciones
     print("\n📊 Generando visualizaciones fenomenológicas...")
@@ -1542,10 +3465,14 @@ def demo_formato_optimo():
     # Guardar todos los REMs en JSON
     print("\n💾 Guardando REMs en formato óptimo...")
     
-    with open("/mnt/okcomputer/output/rems_formato_optimo.json", "w", encoding='utf-8') as f:
-        json.dump(rems_generados, f, indent=2, default=str, ensure_ascii=False)
+    forge.export_rems(rems_generados, "/mnt/okcomputer/output/rems_formato_optimo.jsonl.gz")
+    print("   ✅ Archivo JSONL guardado: rems_formato_optimo.jsonl.gz")
+    
+    forge.export_rems(rems_generados, "/mnt/okcomputer/output/rems_formato_optimo.premb")
+    print("   ✅ Contenedor binario guardado: rems_formato_optimo.premb")
     
-    print("   ✅ Archivo JSON guardado: rems_formato_optimo.json")
+    with forge.export_rems(rems_generados, "/mnt/okcomputer/output/rems_store", format="store") as store:
+        print(f"   ✅ Almacén REM guardado: rems_store ({len(store)} REMs)")
     
     # Mostrar resumen de características del formato
     print("\n" + "=" * 80)
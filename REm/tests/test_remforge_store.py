@@ -0,0 +1,83 @@
+"""Recuperación de REMStore tras un `append` interrumpido"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from remforge_store import REMStore
+
+
+def make_rem(rem_id: str, anchors: int = 2, dim: int = 4):
+    return {
+        "header": {"rem_id": rem_id, "modality_origin": "text", "creation_timestamp": "2025-01-01T00:00:00"},
+        "semantic_contamination": {
+            "contamination_strength": 0.5,
+            "lexical_anchors": [
+                {"token": f"t{i}", "embedding": [float(i + len(rem_id))] * dim} for i in range(anchors)
+            ],
+        },
+    }
+
+
+def simulate_interrupted_append(path: Path, dim: int = 4):
+    """Registro huérfano, filas de embeddings sin entrada y una línea de índice a medias"""
+    with open(path / REMStore.RECORDS_FILE, "ab") as f:
+        f.write(b"\x78\x9c partial payload")
+    with open(path / REMStore.EMBEDDINGS_FILE, "ab") as f:
+        f.write(np.ones((3, dim), dtype="float32").tobytes())
+    with open(path / REMStore.INDEX_FILE, "a", encoding="utf-8") as f:
+        f.write('{"rem_id": "TXT-partial", "offset": ')
+
+
+def test_reopen_after_interrupted_append_keeps_new_rems(tmp_path):
+    with REMStore(tmp_path) as store:
+        store.append(make_rem("TXT-a"))
+
+    simulate_interrupted_append(tmp_path)
+
+    with REMStore(tmp_path) as store:
+        assert len(store) == 1
+        store.extend([make_rem("TXT-b"), make_rem("TXT-c", anchors=3)])
+
+    with REMStore(tmp_path, readonly=True) as store:
+        assert store.rem_ids() == ["TXT-a", "TXT-b", "TXT-c"]
+        assert store.embeddings.shape == (7, 4)
+        for rem_id in store.rem_ids():
+            expected = make_rem(rem_id, anchors=3 if rem_id == "TXT-c" else 2)
+            anchors = store.get(rem_id)["semantic_contamination"]["lexical_anchors"]
+            assert [a["embedding"] for a in anchors] == \
+                [a["embedding"] for a in expected["semantic_contamination"]["lexical_anchors"]]
+
+
+def test_readonly_open_does_not_truncate(tmp_path):
+    with REMStore(tmp_path) as store:
+        store.append(make_rem("TXT-a"))
+    simulate_interrupted_append(tmp_path)
+    size = (tmp_path / REMStore.INDEX_FILE).stat().st_size
+
+    with REMStore(tmp_path, readonly=True) as store:
+        assert len(store) == 1
+    assert (tmp_path / REMStore.INDEX_FILE).stat().st_size == size
+
+
+def test_entries_pointing_past_the_data_are_dropped(tmp_path):
+    with REMStore(tmp_path) as store:
+        store.extend([make_rem("TXT-a"), make_rem("TXT-b")])
+        last = store.index()[-1]
+
+    # Índice en disco, pero el registro y las filas del último REM no llegaron a escribirse
+    os.truncate(tmp_path / REMStore.RECORDS_FILE, last["offset"] + 1)
+    os.truncate(tmp_path / REMStore.EMBEDDINGS_FILE, last["embedding_start"] * 4 * 4)
+
+    with REMStore(tmp_path) as store:
+        assert store.rem_ids() == ["TXT-a"]
+        store.append(make_rem("TXT-c"))
+
+    with REMStore(tmp_path, readonly=True) as store:
+        assert store.rem_ids() == ["TXT-a", "TXT-c"]
+        assert store.embeddings.shape == (4, 4)
+        assert store.get("TXT-c")["header"]["rem_id"] == "TXT-c"